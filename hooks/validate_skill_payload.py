@@ -22,26 +22,24 @@ and CI remain the backstops.
 """
 
 import json
-import shutil
 import sys
-import tempfile
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
 
 def _load_validator():
-    """Import the skill validator lazily, returning None if it is unavailable.
+    """Import the text-level skill validator lazily, returning None if it is unavailable.
 
     A guard hook must never block an edit because of its own missing dependency
     (e.g. PyYAML absent in a fresh checkout). Callers treat None as "skip".
     """
     sys.path.insert(0, str(REPO_ROOT / "skills" / "skill-creator" / "scripts"))
     try:
-        from quick_validate import validate_skill
+        from quick_validate import validate_skill_text
     except Exception:  # missing dependency, broken import — degrade to allow
         return None
-    return validate_skill
+    return validate_skill_text
 
 
 def project_content(tool_input: dict, target: Path) -> str | None:
@@ -82,21 +80,19 @@ def main() -> int:
     if projected is None:
         return 0
 
-    validate_skill = _load_validator()
-    if validate_skill is None:
+    validate_skill_text = _load_validator()
+    if validate_skill_text is None:
         # Dependency unavailable — allow the edit rather than block it. The Stop
         # hook's skill-structure check and CI remain the backstops.
         return 0
 
-    # Validate a throwaway copy so the real file is untouched on failure.
-    tmp_root = Path(tempfile.mkdtemp())
+    # Validate the projected text in memory; nothing is written to disk.
     try:
-        skill_dir = tmp_root / file_path.parent.name
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text(projected, encoding="utf-8")
-        valid, message = validate_skill(skill_dir)
-    finally:
-        shutil.rmtree(tmp_root, ignore_errors=True)
+        valid, message = validate_skill_text(projected)
+    except ImportError:
+        # quick_validate imports PyYAML on first use, so a missing install
+        # surfaces here rather than in _load_validator. Same rule: allow.
+        return 0
 
     if valid:
         return 0
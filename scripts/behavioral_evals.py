@@ -17,23 +17,44 @@ and a local agent command (non-deterministic, may cost tokens). The agent is
 invoked via `DOJO_BEHAVIORAL_AGENT` (default: `claude -p`), receiving the prompt
 on stdin and printing its answer to stdout.
 
+Cases run concurrently (`--jobs`, default 4). Each reply is cached under
+`.cache/behavioral-evals/`, keyed by the agent command and a hash of the exact
+prompt, so a case whose prompt and agent are unchanged is not asked again.
+Every reply is also appended to a checkpoint as it arrives. If a run stops
+partway, the next run resumes from the checkpoint, which is removed once a run
+completes. `--no-cache` asks every case: it reads neither the cache nor the
+checkpoint, and starts a fresh checkpoint of its own. Neither file is required;
+if `.cache/` cannot be written the run simply keeps nothing.
+
 Usage:
     DOJO_BEHAVIORAL_EVALS=1 behavioral_evals.py          # run against declared triggers
     DOJO_BEHAVIORAL_EVALS=1 behavioral_evals.py --json
+    DOJO_BEHAVIORAL_EVALS=1 behavioral_evals.py --jobs 8 --no-cache
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import shlex
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import yaml
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "skills" / "skill-evals" / "scripts"))
+from cache_io import write_json_atomic  # noqa: E402
+
+DEFAULT_AGENT = "claude -p"
+DEFAULT_JOBS = 4
+# Replies and the resume checkpoint. The catalog is part of every prompt, so
+# editing any description retires every cached reply at once.
+CACHE_DIR = REPO_ROOT / ".cache" / "behavioral-evals"
 
 
 def parse_frontmatter(skill_md: Path) -> dict:
@@ -68,13 +89,20 @@ def build_cases(catalog: list[dict]) -> list[dict]:
     return cases
 
 
-def build_prompt(catalog: list[dict], request: str) -> str:
+def catalog_header(catalog: list[dict]) -> list[str]:
+    """The prompt lines shared by every case: instructions plus the skill list."""
     lines = [
         "You are routing a user request to exactly one skill.",
         "Available skills (name: description):",
     ]
     for skill in catalog:
         lines.append(f"- {skill['name']}: {skill['description']}")
+    return lines
+
+
+def build_prompt(catalog: list[dict], request: str, header: list[str] | None = None) -> str:
+    """Routing prompt for one request; pass `header` to reuse it across cases."""
+    lines = list(header if header is not None else catalog_header(catalog))
     lines += [
         "",
         f'User request: "{request}"',
@@ -94,20 +122,156 @@ def parse_response(text: str, valid_names: list[str]) -> str | None:
     return max(matches, key=len)
 
 
+def agent_command() -> str:
+    return os.environ.get("DOJO_BEHAVIORAL_AGENT", DEFAULT_AGENT)
+
+
 def default_runner(prompt: str) -> str:
-    cmd = shlex.split(os.environ.get("DOJO_BEHAVIORAL_AGENT", "claude -p"))
+    cmd = shlex.split(agent_command())
     proc = subprocess.run(cmd, input=prompt, capture_output=True, text=True)
     if proc.returncode != 0:
         raise RuntimeError(f"agent command failed ({' '.join(cmd)}): {proc.stderr.strip()}")
     return proc.stdout.strip()
 
 
-def run_evals(catalog: list[dict], runner) -> dict:
+def prompt_key(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Agent replies keyed by (agent command, prompt hash), kept in one JSON file.
+
+    An unreadable or malformed file is treated as empty. `save` rewrites the
+    file atomically and is safe to call with writes from several threads; if
+    it cannot write, the replies are only kept for this run.
+    """
+
+    def __init__(self, path: Path, agent: str):
+        self.path = path
+        self.agent = agent
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, str]] = {}
+        try:
+            loaded = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            loaded = {}
+        if isinstance(loaded, dict):
+            self._entries = {k: v for k, v in loaded.items() if isinstance(v, dict)}
+
+    def get(self, prompt: str) -> str | None:
+        reply = self._entries.get(self.agent, {}).get(prompt_key(prompt))
+        return reply if isinstance(reply, str) else None
+
+    def put(self, prompt: str, reply: str) -> None:
+        with self._lock:
+            self._entries.setdefault(self.agent, {})[prompt_key(prompt)] = reply
+
+    def save(self) -> None:
+        with self._lock:
+            write_json_atomic(self.path, self._entries, indent=2, sort_keys=True)
+
+
+class Checkpoint:
+    """Append-only JSONL record of the replies a run has received so far.
+
+    One line per reply, flushed as it arrives, so even an interrupted run keeps
+    every answer it paid for. Lines for another agent command, or a torn last
+    line, are ignored on load. A write that fails leaves the reply in memory
+    only; it never fails the run.
+    """
+
+    def __init__(self, path: Path, agent: str):
+        self.path = path
+        self.agent = agent
+        self._lock = threading.Lock()
+        self.replies: dict[str, str] = {}
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            lines = []
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict) and entry.get("agent") == agent and isinstance(entry.get("reply"), str):
+                self.replies[entry.get("prompt")] = entry["reply"]
+
+    def get(self, prompt: str) -> str | None:
+        return self.replies.get(prompt_key(prompt))
+
+    def record(self, prompt: str, reply: str) -> None:
+        line = json.dumps({"agent": self.agent, "prompt": prompt_key(prompt), "reply": reply})
+        with self._lock:
+            self.replies[prompt_key(prompt)] = reply
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a", encoding="utf-8") as fh:
+                    fh.write(line + "\n")
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self.replies = {}
+            try:
+                self.path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+
+def _ask_all(prompts: list[str], runner, jobs: int, cache, checkpoint) -> list[str]:
+    """Replies for `prompts` in order, asking the runner only for unknown prompts."""
+    replies: list[str | None] = [None] * len(prompts)
+    pending = []
+    for index, prompt in enumerate(prompts):
+        for store in (checkpoint, cache):
+            reply = store.get(prompt) if store is not None else None
+            if reply is not None:
+                replies[index] = reply
+                break
+        else:
+            pending.append(index)
+
+    def ask(index: int) -> str:
+        reply = runner(prompts[index])
+        if checkpoint is not None:
+            checkpoint.record(prompts[index], reply)
+        if cache is not None:
+            cache.put(prompts[index], reply)
+        return reply
+
+    pool = ThreadPoolExecutor(max_workers=max(1, jobs))
+    try:
+        futures = {pool.submit(ask, index): index for index in pending}
+        for future in as_completed(futures):
+            replies[futures[future]] = future.result()
+    finally:
+        # On a failure, stop queued cases; in-flight ones still finish and are
+        # checkpointed, so the next run resumes with them.
+        pool.shutdown(wait=True, cancel_futures=True)
+        if cache is not None:
+            cache.save()
+    return replies
+
+
+def run_evals(catalog: list[dict], runner, jobs: int = 1, cache=None, checkpoint=None) -> dict:
+    """Ask `runner` to route every declared trigger; at most `jobs` at a time.
+
+    `cache` (a ResponseCache) and `checkpoint` (a Checkpoint) supply replies for
+    prompts already answered; results keep case order whatever the completion
+    order. A runner error propagates once in-flight cases have finished; the
+    checkpoint is cleared only after every case has a reply.
+    """
     valid = [s["name"] for s in catalog]
     cases = build_cases(catalog)
+    header = catalog_header(catalog)
+    prompts = [build_prompt(catalog, case["trigger"], header=header) for case in cases]
+    replies = _ask_all(prompts, runner, jobs, cache, checkpoint)
+    if checkpoint is not None:
+        checkpoint.clear()
     results = []
-    for case in cases:
-        reply = runner(build_prompt(catalog, case["trigger"]))
+    for case, reply in zip(cases, replies):
         chosen = parse_response(reply, valid)
         results.append(
             {
@@ -128,7 +292,17 @@ def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument("--skills-root", default="skills", help="Path to skills directory (default: skills)")
     parser.add_argument("--json", action="store_true", help="Emit machine-readable JSON")
+    parser.add_argument(
+        "--jobs", type=int, default=DEFAULT_JOBS,
+        help=f"Cases to run concurrently (default: {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Ask the agent for every case, ignoring cached and checkpointed replies",
+    )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     if os.environ.get("DOJO_BEHAVIORAL_EVALS") != "1":
         print(
@@ -151,8 +325,15 @@ def main() -> int:
             print("No skills declare `triggers:` — nothing to evaluate.")
         return 0
 
+    agent = agent_command()
+    cache = None if args.no_cache else ResponseCache(CACHE_DIR / "replies.json", agent)
+    checkpoint = Checkpoint(CACHE_DIR / "checkpoint.jsonl", agent)
+    if args.no_cache:
+        # Replies from an interrupted run are not replayed; this run's own
+        # replies still checkpoint, so it can be resumed in turn.
+        checkpoint.clear()
     try:
-        report = run_evals(catalog, default_runner)
+        report = run_evals(catalog, default_runner, jobs=args.jobs, cache=cache, checkpoint=checkpoint)
     except (RuntimeError, FileNotFoundError) as exc:
         print(f"Behavioral evals could not run: {exc}", file=sys.stderr)
         return 1
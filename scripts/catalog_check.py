@@ -0,0 +1,299 @@
+#!/bin/sh
+""":"
+if command -v python >/dev/null 2>&1; then
+    exec python "$0" "$@"
+fi
+exec python3 "$0" "$@"
+":"""
+"""Run every catalog CI check in one process.
+
+CI used to start a fresh interpreter per check, and each one re-globbed
+skills/*/SKILL.md and re-parsed every file's frontmatter. This loads the catalog
+once into a snapshot (each SKILL.md read once, its frontmatter parsed once),
+then runs the checks against that snapshot concurrently:
+
+    contract          validate_skill_contract.py --strict (text and JSON from one evaluation)
+    skill-docs        gen_skill_docs.py --check
+    manifest          generate_skills_manifest.py --check
+    harness-adapters  gen_harness_adapters.py --check --skip-symlinks
+    catalog           gen_catalog.py --check
+    profiles          profiles/ci_check.py
+    links             check_links.py
+    slop              slop_scan.py
+
+Each check keeps the exit code and messages of its standalone script; this only
+changes how many times the catalog is loaded. The exit code is 1 if any check
+fails. Per-check timings are wall clock while sharing the process; pass
+--jobs 1 to time each check in isolation.
+
+Usage:
+    catalog_check.py                                  # all checks, text report
+    catalog_check.py --only manifest,catalog          # a subset
+    catalog_check.py --json report.json --markdown summary.md
+    catalog_check.py --contract-json strict-skill-contract-report.json \\
+                     --contract-summary strict-skill-contract-summary.txt
+"""
+
+import argparse
+import io
+import json
+import sys
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SKILLS_ROOT = REPO_ROOT / "skills"
+
+for _path in (
+    REPO_ROOT / "scripts",
+    SKILLS_ROOT / "skill-evals" / "scripts",
+    SKILLS_ROOT / "skill-creator" / "scripts",
+):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+import check_links  # noqa: E402
+import gen_catalog  # noqa: E402
+import gen_harness_adapters  # noqa: E402
+import gen_skill_docs  # noqa: E402
+import generate_skills_manifest  # noqa: E402
+import slop_scan  # noqa: E402
+import validate_skill_contract  # noqa: E402
+from catalog_snapshot import Snapshot  # noqa: E402
+from profiles import ci_check  # noqa: E402
+
+
+@dataclass
+class CheckResult:
+    name: str
+    command: str
+    exit_code: int
+    seconds: float
+    stdout: str
+    stderr: str
+    # Check-specific payload, e.g. the contract report behind --contract-json.
+    data: dict | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_code == 0
+
+
+def check_contract(snapshot: Snapshot, stdout, stderr):
+    results = snapshot.contract_results(strict=True)
+    if not results:
+        print("No skills selected.", file=stderr)
+        return 1, None
+    summary = validate_skill_contract.summarize(results, True)
+    stdout.write(validate_skill_contract.render_text(summary, results))
+    return (1 if summary["fail"] else 0), {"summary": summary, "skills": results}
+
+
+def check_skill_docs(snapshot: Snapshot, stdout, stderr):
+    code = gen_skill_docs.run(
+        snapshot.skills_root, REPO_ROOT, check=True,
+        read_text=snapshot.read_text, stdout=stdout, stderr=stderr,
+    )
+    return code, None
+
+
+def check_manifest(snapshot: Snapshot, stdout, stderr):
+    code = generate_skills_manifest.check_manifest(
+        snapshot.skills_root, REPO_ROOT / "skills.json",
+        frontmatter_of=snapshot.frontmatter_of, stdout=stdout, stderr=stderr,
+    )
+    return code, None
+
+
+def check_harness_adapters(snapshot: Snapshot, stdout, stderr):
+    code = gen_harness_adapters.run(
+        REPO_ROOT, snapshot.skills_root, check=True, skip_symlinks=True,
+        frontmatter_of=lambda path: snapshot.frontmatter_of(path) or {},
+        stdout=stdout, stderr=stderr,
+    )
+    return code, None
+
+
+def check_catalog(snapshot: Snapshot, stdout, stderr):
+    code = gen_catalog.run(
+        REPO_ROOT / "skills.json", REPO_ROOT / "docs" / "catalog" / "index.html", REPO_ROOT,
+        check=True, stdout=stdout, stderr=stderr,
+    )
+    return code, None
+
+
+def check_profiles(snapshot: Snapshot, stdout, stderr):
+    return ci_check.main([], stdout=stdout, stderr=stderr, read_text=snapshot.read_text), None
+
+
+def check_link_refs(snapshot: Snapshot, stdout, stderr):
+    return check_links.main([], stdout=stdout, stderr=stderr, skills=snapshot.skill_names), None
+
+
+def check_slop(snapshot: Snapshot, stdout, stderr):
+    code = slop_scan.scan_files(
+        slop_scan.default_files(), read_text=snapshot.read_text, stdout=stdout, stderr=stderr
+    )
+    return code, None
+
+
+# (name, equivalent standalone command, check) in CI order.
+CHECKS = [
+    ("contract", "skills/skill-evals/scripts/validate_skill_contract.py --skills-root skills --strict",
+     check_contract),
+    ("skill-docs", "scripts/gen_skill_docs.py --check", check_skill_docs),
+    ("manifest", "scripts/generate_skills_manifest.py --check", check_manifest),
+    ("harness-adapters", "scripts/gen_harness_adapters.py --check --skip-symlinks", check_harness_adapters),
+    ("catalog", "scripts/gen_catalog.py --check", check_catalog),
+    ("profiles", "scripts/profiles/ci_check.py", check_profiles),
+    ("links", "scripts/check_links.py", check_link_refs),
+    ("slop", "scripts/slop_scan.py", check_slop),
+]
+CHECK_NAMES = [name for name, _, _ in CHECKS]
+
+
+def run_one(name: str, command: str, fn, snapshot: Snapshot) -> CheckResult:
+    stdout, stderr = io.StringIO(), io.StringIO()
+    start = time.perf_counter()
+    data = None
+    try:
+        code, data = fn(snapshot, stdout, stderr)
+    except SystemExit as exc:  # a helper that exits on a fatal precondition
+        code = exc.code if isinstance(exc.code, int) else 1
+    except Exception:  # one broken check must not hide the others' results
+        stderr.write(traceback.format_exc())
+        code = 1
+    return CheckResult(
+        name, command, code, time.perf_counter() - start, stdout.getvalue(), stderr.getvalue(), data
+    )
+
+
+def run_checks(snapshot: Snapshot, names: list[str] | None = None, jobs: int | None = None) -> list[CheckResult]:
+    """Run the named checks (default: all) concurrently; results keep CI order."""
+    selected = [check for check in CHECKS if names is None or check[0] in names]
+    with ThreadPoolExecutor(max_workers=jobs or len(selected) or 1) as pool:
+        futures = [pool.submit(run_one, name, command, fn, snapshot) for name, command, fn in selected]
+        return [future.result() for future in futures]
+
+
+def render_text(results: list[CheckResult], load_seconds: float, seconds: float) -> tuple[str, str]:
+    """Return (stdout, stderr) text: each check's own output under a header line."""
+    out: list[str] = []
+    err: list[str] = []
+    for result in results:
+        status = "PASS" if result.ok else f"FAIL (exit {result.exit_code})"
+        out.append(f"== {result.name}: {status} [{result.seconds:.2f}s]\n")
+        out.append(result.stdout)
+        if result.stderr:
+            err.append(f"== {result.name}\n{result.stderr}")
+    failed = [result.name for result in results if not result.ok]
+    out.append(
+        f"\ncatalog check: {len(results) - len(failed)} passed, {len(failed)} failed "
+        f"in {seconds:.2f}s (catalog load {load_seconds:.2f}s)"
+        + (f"; failed: {', '.join(failed)}" if failed else "")
+        + "\n"
+    )
+    return "".join(out), "".join(err)
+
+
+def render_json(results: list[CheckResult], load_seconds: float, seconds: float) -> dict:
+    return {
+        "exit_code": exit_code(results),
+        "seconds": round(seconds, 3),
+        "load_seconds": round(load_seconds, 3),
+        "checks": [
+            {
+                "name": result.name,
+                "command": result.command,
+                "exit_code": result.exit_code,
+                "seconds": round(result.seconds, 3),
+                "stdout": result.stdout,
+                "stderr": result.stderr,
+            }
+            for result in results
+        ],
+    }
+
+
+def render_markdown(results: list[CheckResult], load_seconds: float, seconds: float) -> str:
+    out = [
+        "# Catalog Check",
+        "",
+        f"{sum(r.ok for r in results)} of {len(results)} checks passed in {seconds:.2f}s "
+        f"(catalog load {load_seconds:.2f}s).",
+        "",
+        "| Check | Result | Time | Command |",
+        "|---|---|---:|---|",
+    ]
+    for result in results:
+        status = "pass" if result.ok else f"fail (exit {result.exit_code})"
+        out.append(f"| {result.name} | {status} | {result.seconds:.2f}s | `{result.command}` |")
+    for result in results:
+        if result.ok:
+            continue
+        out.extend(["", f"## {result.name}", "", "```", (result.stdout + result.stderr).rstrip(), "```"])
+    return "\n".join(out) + "\n"
+
+
+def exit_code(results: list[CheckResult]) -> int:
+    return 0 if all(result.ok for result in results) else 1
+
+
+def write_file(path: str, text: str) -> None:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(text, encoding="utf-8")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", help=f"Comma-separated checks to run (default: all of {', '.join(CHECK_NAMES)})")
+    parser.add_argument("--jobs", type=int, default=None, help="Concurrent checks (default: one per check)")
+    parser.add_argument("--json", metavar="PATH", help="Write the per-check JSON report to PATH")
+    parser.add_argument("--markdown", metavar="PATH", help="Write a markdown summary to PATH")
+    parser.add_argument("--contract-json", metavar="PATH",
+                        help="Write the contract report that validate_skill_contract.py --json prints")
+    parser.add_argument("--contract-summary", metavar="PATH",
+                        help="Write the contract text summary that validate_skill_contract.py prints")
+    args = parser.parse_args(argv)
+
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    names = None
+    if args.only:
+        names = [name.strip() for name in args.only.split(",") if name.strip()]
+        unknown = sorted(set(names) - set(CHECK_NAMES))
+        if unknown:
+            parser.error(f"unknown check(s): {', '.join(unknown)}")
+    if (args.contract_json or args.contract_summary) and names is not None and "contract" not in names:
+        parser.error("--contract-json/--contract-summary need the contract check")
+
+    start = time.perf_counter()
+    snapshot = Snapshot.load()
+    load_seconds = time.perf_counter() - start
+    results = run_checks(snapshot, names, args.jobs)
+    seconds = time.perf_counter() - start
+
+    text, errors = render_text(results, load_seconds, seconds)
+    sys.stdout.write(text)
+    sys.stdout.flush()
+    sys.stderr.write(errors)
+
+    if args.json:
+        write_file(args.json, json.dumps(render_json(results, load_seconds, seconds), indent=2) + "\n")
+    if args.markdown:
+        write_file(args.markdown, render_markdown(results, load_seconds, seconds))
+    contract = next((result for result in results if result.name == "contract"), None)
+    if contract is not None and contract.data is not None:
+        if args.contract_json:
+            write_file(args.contract_json, json.dumps(contract.data, indent=2) + "\n")
+        if args.contract_summary:
+            write_file(args.contract_summary, contract.stdout)
+    return exit_code(results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""One read of the skill catalog, shared by in-process catalog tools.
+
+Loads every skills/*/SKILL.md once (text read once, frontmatter parsed once)
+so tools that used to shell out to several scripts, each re-globbing and
+re-parsing the catalog, can hand the same snapshot to every engine.
+"""
+
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SKILLS_ROOT = REPO_ROOT / "skills"
+
+for _path in (
+    SKILLS_ROOT / "skill-evals" / "scripts",
+    SKILLS_ROOT / "skill-creator" / "scripts",
+):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+import validate_skill_contract  # noqa: E402
+from quick_validate import validate_skill_text  # noqa: E402
+
+
+@dataclass
+class Snapshot:
+    """Every SKILL.md under skills_root, read and parsed once."""
+
+    skills_root: Path
+    texts: dict[Path, str] = field(default_factory=dict)
+    frontmatter: dict[Path, dict | None] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, skills_root: Path = SKILLS_ROOT) -> "Snapshot":
+        snapshot = cls(skills_root)
+        for skill_md in sorted(skills_root.glob("*/SKILL.md")):
+            text = skill_md.read_text(encoding="utf-8")
+            snapshot.texts[skill_md] = text
+            snapshot.frontmatter[skill_md] = validate_skill_contract.parse_frontmatter(text)
+        return snapshot
+
+    @property
+    def skill_names(self) -> set[str]:
+        return {path.parent.name for path in self.texts}
+
+    def read_text(self, path: Path) -> str:
+        if path in self.texts:
+            return self.texts[path]
+        return path.read_text(encoding="utf-8")
+
+    def frontmatter_of(self, path: Path) -> dict | None:
+        if path in self.frontmatter:
+            return self.frontmatter[path]
+        return validate_skill_contract.parse_frontmatter(self.read_text(path))
+
+    def validate(self, skill_dir: str) -> tuple[bool, str]:
+        """quick_validate.validate_skill, run on the snapshot's SKILL.md text."""
+        return validate_skill_text(self.read_text(Path(skill_dir) / "SKILL.md"))
+
+    def contract_results(self, strict: bool, selected: set[str] | None = None) -> list[dict]:
+        """validate_skill_contract results for the catalog, without re-reading it."""
+        return [
+            validate_skill_contract.evaluate_skill(
+                skill_dir, self.validate, strict, text=self.read_text(skill_dir / "SKILL.md")
+            )
+            for skill_dir in validate_skill_contract.collect_skills(self.skills_root, selected)
+        ]
@@ -14,17 +14,37 @@ unambiguous target:
 2. `skills/<name>/` paths name a skill that exists.
 3. Skill names in a `## Sibling skills` section name a skill that exists.
 
-Usage:  python3 scripts/check_links.py
+The parsed references are kept as a graph (file -> outgoing links, skill paths,
+sibling entries) persisted between runs and keyed by each file's mtime and size,
+so only edited files are re-read. Target existence is never cached: it is
+re-checked every run, which is what makes deleting a target surface exactly the
+files that pointed at it. The same graph answers the question both cleanups had
+to answer by hand — "what still links to skills/foo?".
+
+Usage:
+    python3 scripts/check_links.py                      # check; reuse the cached graph
+    python3 scripts/check_links.py --no-cache           # check from a cold parse
+    python3 scripts/check_links.py --links-to skills/foo
 """
 
 from __future__ import annotations
 
+import argparse
+import json
 import re
 import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SKILLS_ROOT = REPO_ROOT / "skills"
+sys.path.insert(0, str(SKILLS_ROOT / "skill-evals" / "scripts"))
+from cache_io import write_json_atomic  # noqa: E402
+
+# Parsed references only; target existence is never read from here, so even a
+# graph from last month cannot hide a broken link, only slow the run down.
+DEFAULT_GRAPH_PATH = REPO_ROOT / ".cache" / "link-graph.json"
+GRAPH_VERSION = 1
 
 # Docs that describe current state. Dated artifacts (plans, specs, designs,
 # research, replay results) are deliberately excluded: they record what was true
@@ -91,52 +111,224 @@ def sibling_section(text: str) -> str:
     return rest[: nxt.start()] if nxt else rest
 
 
-def check(skills_root: Path = SKILLS_ROOT, living_docs: list[Path] | None = None) -> list[str]:
-    living = LIVING_DOCS if living_docs is None else living_docs
-    skills = known_skills(skills_root)
-    problems: list[str] = []
+@dataclass
+class FileRefs:
+    """Everything one markdown file points at, as parsed at (mtime_ns, size)."""
+
+    mtime_ns: int
+    size: int
+    # (link as written, resolved absolute target)
+    links: list[tuple[str, str]] = field(default_factory=list)
+    skill_paths: list[str] = field(default_factory=list)
+    siblings: list[str] = field(default_factory=list)
+
+
+def parse_file(path: Path, stat_key: tuple[int, int]) -> FileRefs:
+    refs = FileRefs(*stat_key)
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return refs
+    text = strip_fences(text)
+    for link in MD_LINK.findall(text):
+        target = (path.parent / link.split("#", 1)[0]).resolve()
+        refs.links.append((link, str(target)))
+    refs.skill_paths = sorted(set(SKILL_PATH.findall(text)))
+    refs.siblings = sorted(set(SIBLING_ENTRY.findall(sibling_section(text))))
+    return refs
+
+
+class LinkGraph:
+    """Reference graph over the scanned markdown, refreshed incrementally."""
+
+    def __init__(self, files: dict[str, FileRefs] | None = None) -> None:
+        self.files: dict[str, FileRefs] = files or {}
 
-    for path in markdown_files(skills_root, living):
+    @classmethod
+    def load(cls, path: Path) -> LinkGraph:
+        """Read a persisted graph; an empty one when absent, unreadable, or stale."""
         try:
-            text = path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
-            continue
-        rel = path.relative_to(REPO_ROOT) if path.is_relative_to(REPO_ROOT) else path
-        # assets/ holds templates whose links are placeholders by design.
-        if "assets" in path.parts:
-            continue
-        text = strip_fences(text)
-
-        for link in MD_LINK.findall(text):
-            target = (path.parent / link.split("#", 1)[0]).resolve()
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls()
+        if not isinstance(data, dict) or data.get("version") != GRAPH_VERSION:
+            return cls()
+        # Resolved targets are absolute, so a graph from another checkout is useless.
+        if data.get("repo_root") != str(REPO_ROOT):
+            return cls()
+        files: dict[str, FileRefs] = {}
+        for key, raw in (data.get("files") or {}).items():
             try:
-                as_rel = target.relative_to(REPO_ROOT).as_posix()
-            except ValueError:
-                as_rel = ""
-            if as_rel.startswith(LOCAL_ONLY_PREFIXES):
+                files[key] = FileRefs(
+                    mtime_ns=int(raw["mtime_ns"]),
+                    size=int(raw["size"]),
+                    links=[(str(a), str(b)) for a, b in raw.get("links", [])],
+                    skill_paths=[str(n) for n in raw.get("skill_paths", [])],
+                    siblings=[str(n) for n in raw.get("siblings", [])],
+                )
+            except (KeyError, TypeError, ValueError):
                 continue
-            if not target.exists():
-                problems.append(f"{rel}: broken link -> {link}")
+        return cls(files)
+
+    def save(self, path: Path) -> None:
+        payload = {
+            "version": GRAPH_VERSION,
+            "repo_root": str(REPO_ROOT),
+            "files": {
+                key: {
+                    "mtime_ns": refs.mtime_ns,
+                    "size": refs.size,
+                    "links": [list(pair) for pair in refs.links],
+                    "skill_paths": refs.skill_paths,
+                    "siblings": refs.siblings,
+                }
+                for key, refs in sorted(self.files.items())
+            },
+        }
+        write_json_atomic(path, payload, indent=1)
+
+    def refresh(self, paths: list[Path]) -> list[str]:
+        """Bring the graph in line with `paths`; return the keys that were re-parsed.
+
+        Files whose (mtime_ns, size) is unchanged keep their parsed references;
+        files no longer in `paths` drop out of the graph.
+        """
+        parsed: list[str] = []
+        current: dict[str, FileRefs] = {}
+        for path in paths:
+            # assets/ holds templates whose links are placeholders by design.
+            if "assets" in path.parts:
+                continue
+            key = str(path)
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            stat_key = (st.st_mtime_ns, st.st_size)
+            cached = self.files.get(key)
+            if cached is not None and (cached.mtime_ns, cached.size) == stat_key:
+                current[key] = cached
+                continue
+            current[key] = parse_file(path, stat_key)
+            parsed.append(key)
+        self.files = current
+        return parsed
+
+    def problems(self, skills: set[str]) -> list[str]:
+        problems: list[str] = []
+        exists: dict[str, bool] = {}
+        for key, refs in self.files.items():
+            rel = display_path(Path(key))
+            for link, target in refs.links:
+                as_rel = repo_relative(target)
+                if as_rel.startswith(LOCAL_ONLY_PREFIXES):
+                    continue
+                if target not in exists:
+                    exists[target] = Path(target).exists()
+                if not exists[target]:
+                    problems.append(f"{rel}: broken link -> {link}")
 
-        for name in set(SKILL_PATH.findall(text)):
-            if name not in skills and name not in PLACEHOLDERS:
-                problems.append(f"{rel}: references skills/{name}/ which does not exist")
+            for name in refs.skill_paths:
+                if name not in skills and name not in PLACEHOLDERS:
+                    problems.append(f"{rel}: references skills/{name}/ which does not exist")
 
-        for name in set(SIBLING_ENTRY.findall(sibling_section(text))):
-            if name not in skills:
-                problems.append(f"{rel}: sibling section names `{name}`, which is not a skill")
+            for name in refs.siblings:
+                if name not in skills:
+                    problems.append(f"{rel}: sibling section names `{name}`, which is not a skill")
 
-    return sorted(set(problems))
+        return sorted(set(problems))
+
+    def referrers(self, target: str) -> list[str]:
+        """Files that point at `target` — a skill (`skills/foo`) or any repo path.
+
+        A skill counts as referenced by a `skills/foo/` path, a sibling entry, or
+        a relative link into its directory. A path counts as referenced by a link
+        to it or to anything beneath it.
+        """
+        cleaned = target.strip().rstrip("/")
+        skill = re.fullmatch(r"(?:skills/)?([a-z0-9][a-z0-9-]*)", cleaned)
+        if skill and (cleaned.startswith("skills/") or (SKILLS_ROOT / cleaned).is_dir()):
+            name = skill.group(1)
+            base = str((SKILLS_ROOT / name).resolve())
+        else:
+            name = None
+            candidate = Path(cleaned)
+            base = str(candidate.resolve() if candidate.is_absolute() else (REPO_ROOT / candidate).resolve())
+
+        hits: set[str] = set()
+        for key, refs in self.files.items():
+            if name is not None and (name in refs.skill_paths or name in refs.siblings):
+                hits.add(key)
+                continue
+            for _, linked in refs.links:
+                if linked == base or linked.startswith(base + "/"):
+                    hits.add(key)
+                    break
+        return sorted(str(display_path(Path(key))) for key in hits)
+
+
+def repo_relative(target: str) -> str:
+    try:
+        return Path(target).relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return ""
+
+
+def display_path(path: Path) -> Path:
+    return path.relative_to(REPO_ROOT) if path.is_relative_to(REPO_ROOT) else path
+
+
+def check(
+    skills_root: Path = SKILLS_ROOT,
+    living_docs: list[Path] | None = None,
+    graph: LinkGraph | None = None,
+    skills: set[str] | None = None,
+) -> list[str]:
+    living = LIVING_DOCS if living_docs is None else living_docs
+    skills = known_skills(skills_root) if skills is None else skills
+    graph = LinkGraph() if graph is None else graph
+    graph.refresh(markdown_files(skills_root, living))
+    return graph.problems(skills)
+
+
+def main(argv: list[str] | None = None, stdout=None, stderr=None, skills: set[str] | None = None) -> int:
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    parser = argparse.ArgumentParser(description="Fail on dangling links and skill references.")
+    parser.add_argument(
+        "--graph",
+        type=Path,
+        default=DEFAULT_GRAPH_PATH,
+        help=f"Persisted reference graph (default: {DEFAULT_GRAPH_PATH.relative_to(REPO_ROOT)}).",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Neither read nor write the persisted graph.")
+    parser.add_argument(
+        "--links-to",
+        metavar="TARGET",
+        help="Print the files that reference TARGET (e.g. skills/foo or docs/system/X.md) and exit.",
+    )
+    args = parser.parse_args(argv)
+
+    graph = LinkGraph() if args.no_cache else LinkGraph.load(args.graph)
+    skills = known_skills(SKILLS_ROOT) if skills is None else skills
+    problems = check(graph=graph, skills=skills)
+    if not args.no_cache:
+        try:
+            graph.save(args.graph)
+        except OSError as exc:
+            print(f"warning: could not persist link graph: {exc}", file=stderr)
 
+    if args.links_to:
+        for rel in graph.referrers(args.links_to):
+            print(rel, file=stdout)
+        return 0
 
-def main() -> int:
-    problems = check()
     if problems:
-        print(f"Link check failed ({len(problems)} problems):")
+        print(f"Link check failed ({len(problems)} problems):", file=stdout)
         for p in problems:
-            print(f"  - {p}")
+            print(f"  - {p}", file=stdout)
         return 1
-    print(f"Link check passed ({len(known_skills(SKILLS_ROOT))} skills).")
+    print(f"Link check passed ({len(skills)} skills).", file=stdout)
     return 0
 
 
@@ -90,23 +90,13 @@ def build_page(manifest: dict) -> str:
     return PAGE_TEMPLATE.format(count=len(catalog), data=data)
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
-    parser.add_argument("--manifest", default="skills.json", help="Path to skills.json (default: skills.json)")
-    parser.add_argument("--out", default="docs/catalog/index.html", help="Output HTML path")
-    parser.add_argument("--check", action="store_true", help="Report drift without writing; exit 1 if stale")
-    args = parser.parse_args()
-
-    repo_root = Path(__file__).resolve().parents[1]
-    manifest_path = Path(args.manifest)
-    if not manifest_path.is_absolute():
-        manifest_path = (repo_root / manifest_path).resolve()
-    out_path = Path(args.out)
-    if not out_path.is_absolute():
-        out_path = (repo_root / out_path).resolve()
+def run(manifest_path: Path, out_path: Path, repo_root: Path, check: bool = False, stdout=None, stderr=None) -> int:
+    """Write (or with check, verify) the catalog page for manifest_path."""
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
 
     if not manifest_path.exists():
-        print(f"Manifest not found: {manifest_path} (run generate_skills_manifest.py)", file=sys.stderr)
+        print(f"Manifest not found: {manifest_path} (run generate_skills_manifest.py)", file=stderr)
         return 1
 
     manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
@@ -114,14 +104,14 @@ def main() -> int:
 
     current = out_path.read_text(encoding="utf-8") if out_path.exists() else None
     if current == page:
-        if args.check:
-            print("Catalog is up to date.")
+        if check:
+            print("Catalog is up to date.", file=stdout)
         else:
-            print("No changes.")
+            print("No changes.", file=stdout)
         return 0
 
-    if args.check:
-        print("Catalog is stale (run scripts/gen_catalog.py).", file=sys.stderr)
+    if check:
+        print("Catalog is stale (run scripts/gen_catalog.py).", file=stderr)
         return 1
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -130,9 +120,26 @@ def main() -> int:
         shown = out_path.relative_to(repo_root)
     except ValueError:
         shown = out_path
-    print(f"Wrote {shown} ({len(manifest.get('skills', []))} skills)")
+    print(f"Wrote {shown} ({len(manifest.get('skills', []))} skills)", file=stdout)
     return 0
 
 
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--manifest", default="skills.json", help="Path to skills.json (default: skills.json)")
+    parser.add_argument("--out", default="docs/catalog/index.html", help="Output HTML path")
+    parser.add_argument("--check", action="store_true", help="Report drift without writing; exit 1 if stale")
+    args = parser.parse_args()
+
+    repo_root = Path(__file__).resolve().parents[1]
+    manifest_path = Path(args.manifest)
+    if not manifest_path.is_absolute():
+        manifest_path = (repo_root / manifest_path).resolve()
+    out_path = Path(args.out)
+    if not out_path.is_absolute():
+        out_path = (repo_root / out_path).resolve()
+    return run(manifest_path, out_path, repo_root, check=args.check)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -302,34 +302,35 @@ def _prune_empty_dirs(start: Path, stop: Path) -> None:
         current = current.parent
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
-    parser.add_argument("--skills-root", default="skills", help="Path to skills directory (default: skills)")
-    parser.add_argument("--repo-root", default=None, help="Repo root (default: parent of this script)")
-    parser.add_argument("--check", action="store_true", help="Report drift without writing; exit 1 on drift")
-    parser.add_argument(
-        "--skip-symlinks",
-        action="store_true",
-        help="Only handle Codex sidecars (the committed artifacts); ignore the local-only harness symlinks",
-    )
-    args = parser.parse_args()
-
-    repo_root = Path(args.repo_root).resolve() if args.repo_root else Path(__file__).resolve().parents[1]
-    skills_root = Path(args.skills_root)
-    if not skills_root.is_absolute():
-        skills_root = (repo_root / skills_root).resolve()
+def run(
+    repo_root: Path,
+    skills_root: Path,
+    check: bool = False,
+    skip_symlinks: bool = False,
+    frontmatter_of=None,
+    stdout=None,
+    stderr=None,
+) -> int:
+    """Write (or with check, verify) every adapter for the catalog at skills_root.
+
+    frontmatter_of maps a SKILL.md path to its parsed frontmatter; callers that
+    already parsed the catalog pass it instead of re-reading every file.
+    """
+    frontmatter_of = frontmatter_of or parse_frontmatter
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
 
     if not skills_root.is_dir():
-        print(f"Skills root not found: {skills_root}", file=sys.stderr)
+        print(f"Skills root not found: {skills_root}", file=stderr)
         return 1
 
-    write = not args.check
+    write = not check
     drift: list[str] = []
     errors: list[str] = []
     wrote: list[str] = []
 
     # 1. Dir-level symlinks (local-only; gitignored)
-    if not args.skip_symlinks:
+    if not skip_symlinks:
         for harness in HARNESS_DIRS:
             link = repo_root / harness / "skills"
             ok, error = ensure_symlink(link, write)
@@ -349,7 +350,7 @@ def main() -> int:
     # 2. Codex sidecars
     for skill_md in sorted(skills_root.glob("*/SKILL.md")):
         name = skill_md.parent.name
-        fm = parse_frontmatter(skill_md)
+        fm = frontmatter_of(skill_md)
         sidecar = skill_md.parent / "agents" / "openai.yaml"
 
         if sidecar.exists() and not is_generated(sidecar):
@@ -359,7 +360,7 @@ def main() -> int:
         current = sidecar.read_text(encoding="utf-8") if sidecar.exists() else None
         if current == rendered:
             continue
-        if args.check:
+        if check:
             drift.append(f"{name}: openai.yaml missing or stale")
         else:
             sidecar.parent.mkdir(parents=True, exist_ok=True)
@@ -367,7 +368,7 @@ def main() -> int:
             wrote.append(name)
 
     # 3. Command wrappers -> .claude/commands (local-only, like the skills symlink)
-    if not args.skip_symlinks:
+    if not skip_symlinks:
         commands_root = repo_root / COMMANDS_LINK_DIR
         desired, collisions = plan_command_links(skills_root, commands_root)
         for c in collisions:
@@ -387,23 +388,42 @@ def main() -> int:
                     drift.append(f"{COMMANDS_LINK_DIR}/{link.relative_to(commands_root)} is stale")
 
     if errors:
-        print("Harness adapter errors (resolve, then re-run):", file=sys.stderr)
+        print("Harness adapter errors (resolve, then re-run):", file=stderr)
         for item in errors:
-            print(f"  - {item}", file=sys.stderr)
+            print(f"  - {item}", file=stderr)
         return 1
 
-    if args.check:
+    if check:
         if drift:
-            print("Harness adapter drift (run scripts/gen_harness_adapters.py):", file=sys.stderr)
+            print("Harness adapter drift (run scripts/gen_harness_adapters.py):", file=stderr)
             for item in drift:
-                print(f"  - {item}", file=sys.stderr)
+                print(f"  - {item}", file=stderr)
             return 1
-        print("Harness adapters are up to date.")
+        print("Harness adapters are up to date.", file=stdout)
         return 0
 
-    print(f"Symlinks ensured for {', '.join(HARNESS_DIRS)}; sidecars written: {len(wrote)}")
+    print(f"Symlinks ensured for {', '.join(HARNESS_DIRS)}; sidecars written: {len(wrote)}", file=stdout)
     return 0
 
 
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--skills-root", default="skills", help="Path to skills directory (default: skills)")
+    parser.add_argument("--repo-root", default=None, help="Repo root (default: parent of this script)")
+    parser.add_argument("--check", action="store_true", help="Report drift without writing; exit 1 on drift")
+    parser.add_argument(
+        "--skip-symlinks",
+        action="store_true",
+        help="Only handle Codex sidecars (the committed artifacts); ignore the local-only harness symlinks",
+    )
+    args = parser.parse_args()
+
+    repo_root = Path(args.repo_root).resolve() if args.repo_root else Path(__file__).resolve().parents[1]
+    skills_root = Path(args.skills_root)
+    if not skills_root.is_absolute():
+        skills_root = (repo_root / skills_root).resolve()
+    return run(repo_root, skills_root, check=args.check, skip_symlinks=args.skip_symlinks)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -88,57 +88,80 @@ def iter_skill_mds(skills_root: Path):
         yield skill_md
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
-    parser.add_argument("--skills-root", default="skills", help="Path to skills directory (default: skills)")
-    parser.add_argument("--check", action="store_true", help="Report drift without writing; exit 1 if stale")
-    args = parser.parse_args()
-
-    repo_root = Path(__file__).resolve().parents[1]
-    skills_root = Path(args.skills_root)
-    if not skills_root.is_absolute():
-        skills_root = (repo_root / skills_root).resolve()
+def _read_text(path: Path) -> str:
+    return path.read_text(encoding="utf-8")
+
+
+def run(
+    skills_root: Path,
+    repo_root: Path,
+    check: bool = False,
+    read_text=None,
+    stdout=None,
+    stderr=None,
+) -> int:
+    """Expand (or with check, verify) every opted-in SKILL.md under skills_root.
+
+    read_text lets a caller that already holds the catalog in memory supply the
+    SKILL.md contents instead of re-reading them.
+    """
+    read_text = read_text or _read_text
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
 
     if not skills_root.is_dir():
-        print(f"Skills root not found: {skills_root}", file=sys.stderr)
+        print(f"Skills root not found: {skills_root}", file=stderr)
         return 1
 
     stale: list[str] = []
     written: list[str] = []
 
     for skill_md in iter_skill_mds(skills_root):
-        original = skill_md.read_text(encoding="utf-8")
+        original = read_text(skill_md)
         if not has_directive(original):
             continue  # not opted in: never touch
         try:
             expanded = expand(original, skills_root, repo_root)
         except FileNotFoundError as exc:
-            print(f"ERROR: {skill_md.parent.name}: {exc}", file=sys.stderr)
+            print(f"ERROR: {skill_md.parent.name}: {exc}", file=stderr)
             return 1
 
         if expanded == original:
             continue
-        if args.check:
+        if check:
             stale.append(skill_md.parent.name)
         else:
             skill_md.write_text(expanded, encoding="utf-8")
             written.append(skill_md.parent.name)
 
-    if args.check:
+    if check:
         if stale:
-            print("Stale composed SKILL.md (run scripts/gen_skill_docs.py):", file=sys.stderr)
+            print("Stale composed SKILL.md (run scripts/gen_skill_docs.py):", file=stderr)
             for name in stale:
-                print(f"  - {name}", file=sys.stderr)
+                print(f"  - {name}", file=stderr)
             return 1
-        print("All opted-in skills are up to date.")
+        print("All opted-in skills are up to date.", file=stdout)
         return 0
 
     if written:
-        print(f"Regenerated {len(written)} skill(s): {', '.join(written)}")
+        print(f"Regenerated {len(written)} skill(s): {', '.join(written)}", file=stdout)
     else:
-        print("No changes.")
+        print("No changes.", file=stdout)
     return 0
 
 
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--skills-root", default="skills", help="Path to skills directory (default: skills)")
+    parser.add_argument("--check", action="store_true", help="Report drift without writing; exit 1 if stale")
+    args = parser.parse_args()
+
+    repo_root = Path(__file__).resolve().parents[1]
+    skills_root = Path(args.skills_root)
+    if not skills_root.is_absolute():
+        skills_root = (repo_root / skills_root).resolve()
+    return run(skills_root, repo_root, check=args.check)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -55,25 +55,31 @@ def extract_frontmatter(skill_md_path):
         return None
 
 
-def build_manifest(skills_dir):
-    """Build manifest data from all SKILL.md files."""
+def build_manifest(skills_dir, frontmatter_of=None, stderr=None):
+    """Build manifest data from all SKILL.md files.
+
+    ``frontmatter_of`` maps a SKILL.md path to its parsed frontmatter (or None);
+    callers holding an already-parsed catalog pass it to skip re-reading.
+    """
+    frontmatter_of = frontmatter_of or extract_frontmatter
+    stderr = stderr or sys.stderr
     skills_dir = Path(skills_dir)
     if not skills_dir.is_dir():
-        print(f"Error: {skills_dir} is not a directory", file=sys.stderr)
+        print(f"Error: {skills_dir} is not a directory", file=stderr)
         sys.exit(1)
 
     skills = []
     for skill_md in sorted(skills_dir.glob('*/SKILL.md')):
-        frontmatter = extract_frontmatter(skill_md)
+        frontmatter = frontmatter_of(skill_md)
         if frontmatter is None:
-            print(f"Warning: skipping {skill_md} (invalid frontmatter)", file=sys.stderr)
+            print(f"Warning: skipping {skill_md} (invalid frontmatter)", file=stderr)
             continue
 
         name = frontmatter.get('name', '')
         description = frontmatter.get('description', '')
         version = normalized_version(frontmatter.get('version', ''))
         if not name or not description or version is None:
-            print(f"Warning: skipping {skill_md} (missing name/description or invalid version)", file=sys.stderr)
+            print(f"Warning: skipping {skill_md} (missing name/description or invalid version)", file=stderr)
             continue
 
         entry = {
@@ -150,19 +156,21 @@ def generate_manifest(skills_dir, output_path, catalog_path=None):
     return manifest
 
 
-def check_manifest(skills_dir, output_path):
+def check_manifest(skills_dir, output_path, frontmatter_of=None, stdout=None, stderr=None):
     """Return 0 when output_path already matches generated manifest."""
-    manifest = build_manifest(skills_dir)
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    manifest = build_manifest(skills_dir, frontmatter_of, stderr)
     output_path = Path(output_path)
     expected = render_manifest(manifest)
     if not output_path.exists():
-        print(f"Manifest is stale: {output_path} does not exist.", file=sys.stderr)
+        print(f"Manifest is stale: {output_path} does not exist.", file=stderr)
         return 1
     current = output_path.read_text(encoding='utf-8')
     if current == expected:
-        print("Manifest is up to date.")
+        print("Manifest is up to date.", file=stdout)
         return 0
-    print(f"Manifest is stale (run scripts/generate_skills_manifest.py).", file=sys.stderr)
+    print(f"Manifest is stale (run scripts/generate_skills_manifest.py).", file=stderr)
     return 1
 
 
@@ -32,13 +32,17 @@ from profiles.budget import Verdict, assess, load_policy  # noqa: E402
 from profiles.resolve import resolve  # noqa: E402
 
 
-def main(argv: list[str] | None = None) -> int:
+def main(argv: list[str] | None = None, stdout=None, stderr=None, read_text=None) -> int:
+    """Run the gate. read_text lets an in-process caller supply SKILL.md contents."""
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    read_text = read_text or (lambda path: path.read_text(encoding="utf-8"))
     failures: list[str] = []
     evaluated = 0
 
     catalog = definitions.load_catalog(REPO_ROOT / "skills.json")
     defs = definitions.load_definitions(REPO_ROOT / "profiles", catalog)
-    print(f"definitions: {len(defs)} profiles over a {len(catalog)}-skill catalog")
+    print(f"definitions: {len(defs)} profiles over a {len(catalog)}-skill catalog", file=stdout)
 
     # Every declared composition must resolve, and its members must exist.
     overlays = [n for n, d in sorted(defs.items()) if d.kind == "overlay"]
@@ -52,7 +56,7 @@ def main(argv: list[str] | None = None) -> int:
         if missing:
             failures.append(f"core+{overlay} names skills not in the catalog: {missing}")
         evaluated += 1
-    print(f"compositions resolved: {evaluated} of {len(overlays)}")
+    print(f"compositions resolved: {evaluated} of {len(overlays)}", file=stdout)
 
     # Every reviewed policy must load, and a policy whose limit was never checked
     # against behaviour must not be able to gate.
@@ -73,7 +77,7 @@ def main(argv: list[str] | None = None) -> int:
                 "may not gate")
         print(f"policy {path.name}: limit {policy.limit} {policy.unit} "
               f"({policy.limit_basis}), deployable={policy.deployable}, "
-              f"surfaces={policy.declared_surfaces or 'any'}")
+              f"surfaces={policy.declared_surfaces or 'any'}", file=stdout)
 
     # Non-degeneracy: score a real composition so the gate exercises the arithmetic
     # rather than only loading files.
@@ -82,7 +86,7 @@ def main(argv: list[str] | None = None) -> int:
     entries = []
     for name in members:
         md = REPO_ROOT / "skills" / name / "SKILL.md"
-        parts = md.read_text(encoding="utf-8").split("---")
+        parts = read_text(md).split("---")
         import yaml  # noqa: PLC0415
 
         desc = ((yaml.safe_load(parts[1]) or {}).get("description") or "").strip()
@@ -91,7 +95,7 @@ def main(argv: list[str] | None = None) -> int:
     scored = assess(entries, codex, surface="codex-tui")
     print(f"scored core+engineering: {len(members)} skills, {scored.demand} "
           f"{scored.unit} = {scored.basis_points / 100:.1f}% of {scored.limit} "
-          f"-> {scored.verdict.value}")
+          f"-> {scored.verdict.value}", file=stdout)
     if scored.demand <= 0:
         failures.append("scoring produced zero demand; the gate evaluated nothing")
     if scored.verdict is Verdict.UNSUPPORTED:
@@ -100,14 +104,14 @@ def main(argv: list[str] | None = None) -> int:
     # State the boundary rather than implying coverage.
     print("\nNOT checked here (requires a harness and session rollouts, which CI "
           "has neither of): effective-catalog observation, budget ceiling by "
-          "saturation, degradation, and drift. Those are machine-side.")
+          "saturation, degradation, and drift. Those are machine-side.", file=stdout)
 
     if failures:
-        print("\nFAILURES:", file=sys.stderr)
+        print("\nFAILURES:", file=stderr)
         for f in failures:
-            print(f"  - {f}", file=sys.stderr)
+            print(f"  - {f}", file=stderr)
         return 1
-    print("\nphase-1 profile gate: clean")
+    print("\nphase-1 profile gate: clean", file=stdout)
     return 0
 
 
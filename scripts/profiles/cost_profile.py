@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""Catalog budget profiler: every entry, every policy, one pass.
+
+`ci_check.py` scores one composition against one policy, so it answers "does
+core+engineering fit Codex?". The question it cannot answer is where the budget
+goes. This costs every catalog entry once under every reviewed policy, then
+derives everything else from that one table:
+
+- **Ranking.** Entries ordered by marginal cost — what removing the entry from
+  a listing would recover. Listing cost is additive per line, so an entry's
+  marginal cost is its own `entry_cost`; entries are ranked by the largest share
+  of any policy's limit they take, because a token and a character are not
+  comparable and neither is converted into the other.
+- **Headroom curves.** For each composition (core, core plus each overlay, and
+  full) and each policy, members are added costliest first and the remaining
+  headroom under the SC-04 ceiling is recorded after each one. The point where
+  the curve crosses zero says how many of the heaviest entries a composition
+  can carry, and `trim_to_fit` how many would have to go.
+
+Costs come from untruncated source descriptions (`observe.source_descriptions`),
+never from a rendered listing, for the reason `budget.py` gives. What this does
+**not** cost: harness-bundled and connector entries, and the Codex alias table
+— those exist only in an observed listing, which is `drift_check.py`'s job. A
+curve here is the floor of real demand, not a prediction of it.
+
+The default Codex locator is the resolved `skills/<name>/SKILL.md` path under
+this checkout, because Codex reports a symlink's target; `--locator-root`
+substitutes another install root.
+
+Usage:
+    cost_profile.py                  # ranking + per-composition summary
+    cost_profile.py --json           # full table and curves, for dashboards
+    cost_profile.py --top 40 --curves
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from profiles import definitions  # noqa: E402
+from profiles.budget import BASIS, CEILING_BASIS_POINTS, Policy, entry_cost, load_policy  # noqa: E402
+from profiles.observe import source_descriptions  # noqa: E402
+from profiles.resolve import resolve  # noqa: E402
+
+DEFAULT_TOP = 15
+
+
+def load_policies(policy_dir: Path) -> dict[str, Policy]:
+    """Every reviewed policy, keyed by file stem."""
+    return {path.stem: load_policy(path) for path in sorted(policy_dir.glob("*.yaml"))}
+
+
+def ceiling(policy: Policy) -> int:
+    """Largest demand that is still within the SC-04 ceiling, exactly."""
+    return (policy.limit * CEILING_BASIS_POINTS) // BASIS
+
+
+def cost_table(
+    names: list[str],
+    descriptions: dict[str, str],
+    policies: dict[str, Policy],
+    locator_root: Path,
+) -> dict[str, dict[str, int]]:
+    """`{skill: {policy: cost}}` — each entry costed once per policy."""
+    return {
+        name: {
+            key: entry_cost(name, descriptions.get(name, ""), policy, str(locator_root / name / "SKILL.md"))
+            for key, policy in policies.items()
+        }
+        for name in names
+    }
+
+
+def rank_entries(table: dict[str, dict[str, int]], policies: dict[str, Policy]) -> list[dict]:
+    """Entries by the largest share of any policy limit they take, heaviest first."""
+    ranked = []
+    for name, costs in table.items():
+        shares = {
+            key: (cost * BASIS) // policies[key].limit if policies[key].limit else 0
+            for key, cost in costs.items()
+        }
+        ranked.append({
+            "skill": name,
+            "costs": costs,
+            "limit_bps": shares,
+            "max_limit_bps": max(shares.values(), default=0),
+        })
+    ranked.sort(key=lambda row: (-row["max_limit_bps"], row["skill"]))
+    return ranked
+
+
+def compositions(defs: dict, catalog: dict[str, dict]) -> dict[str, tuple[str, ...]]:
+    """Every composition worth profiling: core alone, core plus each overlay, full.
+
+    `core` alone is not deployable (resolve refuses it), but it is the floor every
+    overlay pays, so its curve is reported for reference.
+    """
+    out: dict[str, tuple[str, ...]] = {}
+    for name, profile in sorted(defs.items()):
+        if profile.kind == "baseline":
+            out[name] = definitions.resolved_members(profile, catalog)
+    for name, profile in sorted(defs.items()):
+        if profile.kind == "overlay":
+            out[f"core+{name}"] = resolve(("core", name), defs, catalog).members
+    for name, profile in sorted(defs.items()):
+        if profile.kind == "inspection":
+            out[name] = resolve((name,), defs, catalog).members
+    return out
+
+
+def headroom_curve(members: tuple[str, ...], table: dict[str, dict[str, int]], key: str,
+                   policy: Policy) -> dict:
+    """Cumulative demand and ceiling headroom, adding members costliest first."""
+    top = ceiling(policy)
+    ordered = sorted(members, key=lambda name: (-table[name][key], name))
+    points = []
+    running = 0
+    fits = 0
+    for name in ordered:
+        running += table[name][key]
+        if running <= top:
+            fits += 1
+        points.append({
+            "skill": name,
+            "cost": table[name][key],
+            "cumulative": running,
+            "headroom": top - running,
+            "limit_bps": (running * BASIS) // policy.limit if policy.limit else 0,
+        })
+
+    # Fewest costliest entries whose removal brings demand under the ceiling.
+    trim = 0
+    remaining = running
+    for point in points:
+        if remaining <= top:
+            break
+        remaining -= point["cost"]
+        trim += 1
+
+    return {
+        "policy": key,
+        "unit": policy.unit,
+        "limit": policy.limit,
+        "ceiling": top,
+        "demand": running,
+        "limit_bps": (running * BASIS) // policy.limit if policy.limit else 0,
+        "headroom": top - running,
+        "within_ceiling": running <= top,
+        "fits_costliest": fits,
+        "trim_to_fit": trim,
+        "gating": policy.deployable and not policy.provisional,
+        "curve": points,
+    }
+
+
+def profile(skills_root: Path, profiles_dir: Path, catalog_path: Path, policy_dir: Path,
+            locator_root: Path | None = None) -> dict:
+    """Build the whole report: cost table, ranking, and per-composition curves."""
+    catalog = definitions.load_catalog(catalog_path)
+    defs = definitions.load_definitions(profiles_dir, catalog)
+    policies = load_policies(policy_dir)
+    if not policies:
+        raise ValueError(f"no budget policies under {policy_dir}")
+    descriptions = source_descriptions(skills_root)
+    table = cost_table(sorted(catalog), descriptions, policies,
+                       locator_root or skills_root.resolve())
+
+    return {
+        "catalog_size": len(catalog),
+        "policies": {
+            key: {
+                "harness": policy.harness,
+                "model": policy.model,
+                "unit": policy.unit,
+                "limit": policy.limit,
+                "ceiling": ceiling(policy),
+                "limit_basis": policy.limit_basis,
+                "deployable": policy.deployable,
+            }
+            for key, policy in policies.items()
+        },
+        "entries": rank_entries(table, policies),
+        "compositions": {
+            name: {
+                "members": len(members),
+                "policies": {
+                    key: headroom_curve(members, table, key, policy)
+                    for key, policy in policies.items()
+                },
+            }
+            for name, members in compositions(defs, catalog).items()
+        },
+        "not_costed": [
+            "harness-bundled entries",
+            "account connectors and plugins",
+            "the Codex alias table",
+        ],
+    }
+
+
+def render_text(report: dict, top: int = DEFAULT_TOP, curves: bool = False) -> str:
+    keys = list(report["policies"])
+    lines = [f"catalog: {report['catalog_size']} skills, {len(keys)} policies"]
+    for key, policy in report["policies"].items():
+        lines.append(f"  {key}: limit {policy['limit']} {policy['unit']}, ceiling {policy['ceiling']} "
+                     f"({policy['limit_basis']}), deployable={policy['deployable']}")
+
+    lines += ["", f"costliest entries (top {min(top, len(report['entries']))}, by largest share of a limit):"]
+    lines.append("  " + f"{'skill':<32}" + "".join(f"{key:>20}" for key in keys))
+    for row in report["entries"][:top]:
+        cells = "".join(
+            f"{row['costs'][key]:>10} {row['limit_bps'][key] / 100:>7.2f}%" for key in keys
+        )
+        lines.append(f"  {row['skill']:<32}{cells}")
+
+    lines += ["", "compositions (demand / ceiling, headroom, costliest entries to drop to fit):"]
+    for name, composition in report["compositions"].items():
+        lines.append(f"  {name} ({composition['members']} skills)")
+        for key, result in composition["policies"].items():
+            state = "fits" if result["within_ceiling"] else f"drop {result['trim_to_fit']}"
+            gate = "" if result["gating"] else " [non-gating]"
+            lines.append(
+                f"    {key:<20} {result['demand']:>6} / {result['ceiling']:<6} {result['unit']:<10} "
+                f"{result['limit_bps'] / 100:>6.1f}%  headroom {result['headroom']:>6}  {state}{gate}"
+            )
+            if curves:
+                for point in result["curve"]:
+                    lines.append(f"      {point['skill']:<32} +{point['cost']:<5} "
+                                 f"{point['cumulative']:>6}  headroom {point['headroom']:>6}")
+
+    lines += ["", f"not costed: {', '.join(report['not_costed'])}; real demand is at least this."]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--skills-root", type=Path, default=REPO_ROOT / "skills")
+    parser.add_argument("--profiles-dir", type=Path, default=REPO_ROOT / "profiles")
+    parser.add_argument("--catalog", type=Path, default=REPO_ROOT / "skills.json")
+    parser.add_argument("--policies", type=Path, default=REPO_ROOT / "profiles" / "policies")
+    parser.add_argument("--locator-root", type=Path, default=None,
+                        help="install root Codex reports locators under (default: the resolved skills root)")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="entries shown in the text ranking")
+    parser.add_argument("--curves", action="store_true", help="print every headroom curve point")
+    parser.add_argument("--json", dest="as_json", action="store_true", help="emit machine-readable output")
+    args = parser.parse_args(argv)
+
+    report = profile(args.skills_root, args.profiles_dir, args.catalog, args.policies, args.locator_root)
+    if args.as_json:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        sys.stdout.write(render_text(report, args.top, args.curves))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
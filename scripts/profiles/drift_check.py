@@ -57,6 +57,9 @@ from profiles import rollout_codex as rc  # noqa: E402
 # records absolute paths and installed membership for one machine, and this
 # repository is public (R30).
 DEFAULT_BASELINE = Path.home() / ".agents" / ".dojo-profile-baseline.json"
+# Packed parses of listing blocks, keyed by block SHA-256. Gitignored like every
+# other cache here; it holds the same machine-local paths the baseline does.
+DEFAULT_PARSE_CACHE = REPO_ROOT / ".cache" / "codex-listings"
 
 EXIT_CLEAN = 0
 EXIT_CANNOT_EVALUATE = 1
@@ -280,10 +283,12 @@ def _saturation_findings(obs: rc.RolloutObservation, current: Baseline) -> list[
 
 
 def run(baseline_path: Path, *, cwd: str | None = None, update: bool = False,
-        as_json: bool = False, max_blind_days: int | None = None) -> int:
+        as_json: bool = False, max_blind_days: int | None = None,
+        parse_cache: rc.ParseCache | None = None) -> int:
     errors: list[tuple[Path, str]] = []
     observations = rc.observations(
-        cwd=cwd, surface=rc.SURFACE_TUI, errors=errors, limit=1)
+        cwd=cwd, surface=rc.SURFACE_TUI, errors=errors, limit=1,
+        cache=parse_cache or rc.PARSE_CACHE)
 
     # Every path that cannot establish a *fresh, well-classified* observation
     # runs through one gate. The first version of this threshold guarded only
@@ -421,9 +426,12 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--max-blind-days", type=int, default=None,
                         help="escalate to exit 3 when the check has been unable "
                              "to evaluate for longer than this")
+    parser.add_argument("--parse-cache", action="store_true",
+                        help=f"keep parsed listing blocks on disk under {DEFAULT_PARSE_CACHE}")
     args = parser.parse_args(argv)
     return run(args.baseline, cwd=args.cwd, update=args.update,
-           as_json=args.as_json, max_blind_days=args.max_blind_days)
+           as_json=args.as_json, max_blind_days=args.max_blind_days,
+           parse_cache=rc.ParseCache(DEFAULT_PARSE_CACHE) if args.parse_cache else None)
 
 
 if __name__ == "__main__":
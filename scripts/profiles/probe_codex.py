@@ -3,8 +3,10 @@
 
 ``codex debug prompt-input`` renders the model-visible prompt as JSON, including
 the whole ``<skills_instructions>`` block. This module parses that block. There
-is no LLM in the loop and no cached state: every call re-runs the binary, so
-staleness is checked rather than assumed.
+is no LLM in the loop and no cached observation: every call re-runs the binary,
+so staleness is checked rather than assumed. Only the *parse* is cached, keyed
+by the SHA-256 of the block itself, so an identical block is never parsed twice
+and a changed one can never be served a stale parse.
 
 Two rules this parser exists to enforce, both learned from getting them wrong:
 
@@ -25,13 +27,20 @@ from __future__ import annotations
 
 import argparse
 import collections
+import hashlib
 import json
 import re
 import subprocess
 import sys
+import zlib
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
+_SKILL_EVALS = Path(__file__).resolve().parents[2] / "skills" / "skill-evals" / "scripts"
+if str(_SKILL_EVALS) not in sys.path:
+    sys.path.insert(0, str(_SKILL_EVALS))
+from cache_io import write_atomic  # noqa: E402
+
 # From render.rs. Kept here as named constants so a vendor bump is a one-line diff.
 APPROX_BYTES_PER_TOKEN = 4
 SKILL_METADATA_CONTEXT_WINDOW_PERCENT = 2
@@ -58,6 +67,11 @@ ENTRY_RE = re.compile(r"^- (?P<body>.*?) \((?P<kind>[a-z ]+): (?P<locator>.*)\)$
 NAME_ONLY_RE = re.compile(r"^(?P<name>\S+):$")
 NAME_DESC_RE = re.compile(r"^(?P<name>\S+): (?P<description>.*)$", re.DOTALL)
 
+# Bump when `_pack`'s layout or the parser's output changes, so packed listings
+# from an older parser stop matching instead of being served.
+PARSE_CACHE_VERSION = 1
+PARSE_CACHE_MAX_ENTRIES = 256
+
 
 SKILLS_INTRO_WITH_ABSOLUTE_PATHS = (
     "A skill is a set of instructions provided through a `SKILL.md` source. Below is the list of "
@@ -216,8 +230,125 @@ def extract_block(prompt_input: list) -> str:
     raise LookupError("no <skills_instructions> block in prompt-input")
 
 
-def parse_block(block: str) -> Listing:
-    """Parse a captured block into entries, render mode, and charged cost."""
+class ParseCache:
+    """Parse results keyed by block SHA-256, in memory and optionally on disk.
+
+    A result is held as immutable rows of the parse-derived fields and rebuilt
+    into a fresh `Listing` on every hit. `classify` and `probe` mutate the
+    listing they are handed, so a shared object would let one caller's
+    classification leak into another's. On disk the rows are packed compactly
+    (zlib-compressed JSON) under `directory`.
+
+    Most rollouts in a history carry one of a handful of distinct blocks, so a
+    whole-history sweep parses each of those once. With `directory` set the
+    packed form also persists across runs; an unreadable or stale file is a miss.
+    """
+
+    def __init__(self, directory: Path | str | None = None, max_entries: int = PARSE_CACHE_MAX_ENTRIES):
+        self.directory = Path(directory) if directory else None
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._rows: dict[str, tuple] = {}
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.bin"
+
+    def get(self, key: str) -> tuple | None:
+        rows = self._rows.get(key)
+        if rows is None and self.directory is not None:
+            try:
+                rows = _unpack(self._path(key).read_bytes())
+            except (OSError, ValueError, TypeError, zlib.error):
+                return None
+            self._remember(key, rows)
+        return rows
+
+    def put(self, key: str, rows: tuple) -> None:
+        self._remember(key, rows)
+        if self.directory is not None:
+            # The in-memory entry above still serves this process if this fails.
+            write_atomic(self._path(key), _pack(rows))
+
+    def clear(self) -> None:
+        self._rows.clear()
+        self.hits = self.misses = 0
+
+    def _remember(self, key: str, rows: tuple) -> None:
+        self._rows[key] = rows
+        while len(self._rows) > self.max_entries:
+            self._rows.pop(next(iter(self._rows)))
+
+
+# Shared by every caller in the process; in memory only unless a caller passes
+# its own disk-backed cache.
+PARSE_CACHE = ParseCache()
+
+
+def block_key(block: str) -> str:
+    return hashlib.sha256(block.encode("utf-8")).hexdigest()
+
+
+def _to_rows(listing: Listing) -> tuple:
+    """The parse-derived fields only: classification and fingerprint are not parsed."""
+    return (
+        listing.render_mode,
+        tuple((e.name, e.description, e.locator_kind, e.locator, e.rendered, e.cost_tokens)
+              for e in listing.entries),
+        tuple(listing.root_lines),
+        listing.entry_cost_tokens,
+        listing.root_table_cost_tokens,
+        listing.block_chars,
+        listing.warning,
+    )
+
+
+def _from_rows(rows: tuple) -> Listing:
+    render_mode, entries, root_lines, entry_cost, root_cost, block_chars, warning = rows
+    return Listing(
+        render_mode=render_mode,
+        entries=[Entry(*entry) for entry in entries],
+        root_lines=list(root_lines),
+        entry_cost_tokens=entry_cost,
+        root_table_cost_tokens=root_cost,
+        block_chars=block_chars,
+        warning=warning,
+    )
+
+
+def _pack(rows: tuple) -> bytes:
+    payload = [PARSE_CACHE_VERSION, *rows]
+    return zlib.compress(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def _unpack(data: bytes) -> tuple:
+    version, render_mode, entries, root_lines, *counts = json.loads(zlib.decompress(data))
+    if version != PARSE_CACHE_VERSION:
+        raise ValueError(f"packed listing is version {version}, expected {PARSE_CACHE_VERSION}")
+    return (render_mode, tuple(tuple(entry) for entry in entries), tuple(root_lines), *counts)
+
+
+def parse_block(block: str, cache: ParseCache | None = PARSE_CACHE) -> Listing:
+    """Parse a captured block into entries, render mode, and charged cost.
+
+    Every call returns a listing the caller owns. Pass `cache=None` to bypass
+    the parse cache entirely. A block that fails to parse is never cached, so
+    it fails the same way every time.
+    """
+    if cache is None:
+        return _parse_block(block)
+    key = block_key(block)
+    rows = cache.get(key)
+    if rows is not None:
+        cache.hits += 1
+        return _from_rows(rows)
+    cache.misses += 1
+    listing = _parse_block(block)
+    cache.put(key, _to_rows(listing))
+    return listing
+
+
+def _parse_block(block: str) -> Listing:
     if INTRO_ALIASES in block:
         render_mode = "alias"
     elif INTRO_ABSOLUTE in block:
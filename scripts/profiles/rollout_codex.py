@@ -65,7 +65,7 @@ from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from .probe_codex import Listing, _absolute, parse_block
+from .probe_codex import PARSE_CACHE, Listing, ParseCache, _absolute, parse_block
 
 BLOCK_OPEN = "<skills_instructions>"
 BLOCK_CLOSE = "</skills_instructions>"
@@ -299,12 +299,12 @@ def _meta_from(path: Path, lines: list[str]) -> RolloutMeta:
     )
 
 
-def read_rollout(path: Path | str) -> RolloutObservation | None:
+def read_rollout(path: Path | str, cache: ParseCache | None = PARSE_CACHE) -> RolloutObservation | None:
     """Parse one rollout, or None when it carries no skills block.
 
     A session that never made a model call has sent nothing and recorded
     nothing — that is an absent observation, not an empty one, and the caller
-    must be able to tell the difference.
+    must be able to tell the difference. `cache` is handed to `parse_block`.
     """
     path = Path(path)
     lines = path.read_text(errors="replace").splitlines()
@@ -341,7 +341,7 @@ def read_rollout(path: Path | str) -> RolloutObservation | None:
             break
     if block is None:
         return None
-    return RolloutObservation(meta=_meta_from(path, lines), listing=parse_block(block))
+    return RolloutObservation(meta=_meta_from(path, lines), listing=parse_block(block, cache))
 
 
 def default_sessions_root() -> Path:
@@ -379,7 +379,8 @@ def find_rollouts(sessions_root: Path | str | None = None) -> list[Path]:
 
 def observations(sessions_root: Path | str | None = None, *, cwd: str | Path | None = None,
                  surface: str | None = None, limit: int | None = None,
-                 errors: list | None = None) -> list[RolloutObservation]:
+                 errors: list | None = None,
+                 cache: ParseCache | None = PARSE_CACHE) -> list[RolloutObservation]:
     """Parsed observations, newest first, optionally filtered by cwd and surface.
 
     A rollout whose block cannot be parsed is **skipped, not fatal, and never
@@ -392,12 +393,16 @@ def observations(sessions_root: Path | str | None = None, *, cwd: str | Path | N
 
     Counting the skips matters more than skipping quietly: a sweep that silently
     dropped a third of its input would report a confident, wrong history.
+
+    Rollouts in one history mostly repeat a few distinct blocks, and the parse
+    is filtered *before* cwd and surface, so `cache` (the process-wide parse
+    cache by default) is what keeps a sweep from re-parsing the same block.
     """
     wanted_cwd = str(Path(cwd).resolve()) if cwd else None
     found: list[RolloutObservation] = []
     for path in find_rollouts(sessions_root):
         try:
-            observation = read_rollout(path)
+            observation = read_rollout(path, cache)
         except ValueError as exc:
             if errors is not None:
                 errors.append((path, str(exc)))
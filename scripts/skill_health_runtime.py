@@ -11,57 +11,228 @@ Design notes:
   entry is non-dojo and ignored.
 - Misfire is displayed with its eligible denominator, labeled experimental, and
   is never a ranking input (the signal is under validation upstream).
+- The endpoint is read a page at a time (`limit`/`cursor` query parameters,
+  `nextCursor` in the response) and rows are validated and aggregated as each
+  page arrives, so memory is bounded by the page size plus one merged row per
+  skill. A server that ignores the paging parameters returns one page with no
+  `nextCursor`, which is the single-shot fetch this replaced. A page of exactly
+  `limit` rows with no `nextCursor` is ambiguous, so it is re-requested with a
+  limit one higher: a server that then sends the extra row pages under a token
+  this client does not know, and the load fails rather than truncating.
+- Pages can be revalidated with `If-None-Match`/`If-Modified-Since` against an
+  on-disk cache, so an unchanged window costs a 304 per page, not a download.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import urllib.error
+import urllib.parse
+import sys
 import urllib.request
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+_SKILL_EVALS = Path(__file__).resolve().parents[1] / "skills" / "skill-evals" / "scripts"
+if str(_SKILL_EVALS) not in sys.path:
+    sys.path.insert(0, str(_SKILL_EVALS))
+from cache_io import write_json_atomic  # noqa: E402
 
 DEFAULT_URL = "http://127.0.0.1:3141/api/v2/analytics/skills/health"
+DEFAULT_PAGE_SIZE = 500
+# Per page request, not per load: paging keeps each response small.
+DEFAULT_TIMEOUT = 5
 
 # Fields every health row must carry for the join to be meaningful.
 _REQUIRED_ROW_KEYS = ("name", "invocations", "neverFired")
 
 
-def load_health_rows(*, url: str | None, path: str | None) -> list[dict]:
-    """Return the `data` rows from a health payload (file or live endpoint).
+class PageCache:
+    """On-disk health pages keyed by page URL, with the validators to revalidate.
 
-    Raises RuntimeError on connection failure, timeout, non-JSON, a missing
-    `data` list, or an item that lacks the required keys — never a partial or
-    fabricated result.
+    Each entry holds a page's rows, its `nextCursor`, and the `ETag` /
+    `Last-Modified` the server sent. A corrupt or unreadable entry is treated as
+    a miss, and a page whose entry could not be written is simply downloaded in
+    full on the next load instead of revalidated.
     """
-    source = path or url or "<none>"
-    try:
-        if path is not None:
-            with open(path, "r", encoding="utf-8") as fh:
-                raw = fh.read()
-        else:
-            if url is None:
-                raise RuntimeError("load_health_rows requires either url or path")
-            with urllib.request.urlopen(url, timeout=5) as resp:
-                raw = resp.read().decode("utf-8")
-    except RuntimeError:
-        raise
-    except Exception as exc:  # noqa: BLE001 — surface any I/O failure honestly
-        raise RuntimeError(f"could not read skill health from {source}: {exc}") from exc
 
+    def __init__(self, root: str | os.PathLike):
+        self.root = os.fspath(root)
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.root, hashlib.sha256(url.encode()).hexdigest() + ".json")
+
+    def load(self, url: str) -> dict | None:
+        try:
+            with open(self._path(url), encoding="utf-8") as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or not isinstance(entry.get("rows"), list):
+            return None
+        return entry
+
+    def store(self, url: str, entry: dict) -> None:
+        write_json_atomic(self._path(url), entry)
+
+
+def _check_row(row, source: str) -> dict:
+    if not isinstance(row, dict) or any(key not in row for key in _REQUIRED_ROW_KEYS):
+        raise RuntimeError(
+            f"skill health from {source} has a malformed row "
+            f"(each row needs {', '.join(_REQUIRED_ROW_KEYS)}): {row!r}"
+        )
+    return row
+
+
+def _parse_payload(raw, source: str) -> dict:
     try:
         payload = json.loads(raw)
     except json.JSONDecodeError as exc:
         raise RuntimeError(f"skill health from {source} was not valid JSON: {exc}") from exc
-
     if not isinstance(payload, dict) or not isinstance(payload.get("data"), list):
         raise RuntimeError(f"skill health from {source} is missing a 'data' list")
+    return payload
+
 
+def _page_url(url: str, page_size: int, cursor: str | None) -> str:
+    """`url` with its `limit`/`cursor` query parameters set for one page."""
+    parts = urllib.parse.urlsplit(url)
+    query = [
+        (key, value)
+        for key, value in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if key not in ("limit", "cursor")
+    ]
+    query.append(("limit", str(page_size)))
+    if cursor is not None:
+        query.append(("cursor", cursor))
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+
+
+def _fetch_page(page_url: str, *, timeout: float, cache: PageCache | None) -> tuple[list, str | None]:
+    """Return one page's (rows, nextCursor), revalidating a cached copy if present."""
+    entry = cache.load(page_url) if cache is not None else None
+    headers = {"Accept": "application/json"}
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    request = urllib.request.Request(page_url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as resp:
+            raw = resp.read()
+            resp_headers = resp.headers
+    except urllib.error.HTTPError as exc:
+        if exc.code != 304 or entry is None:
+            raise
+        return entry["rows"], entry.get("next_cursor")
+
+    payload = _parse_payload(raw, page_url)
     rows = payload["data"]
-    for row in rows:
-        if not isinstance(row, dict) or any(key not in row for key in _REQUIRED_ROW_KEYS):
+    next_cursor = payload.get("nextCursor")
+    etag, last_modified = resp_headers.get("ETag"), resp_headers.get("Last-Modified")
+    if cache is not None and (etag or last_modified):
+        # Only valid pages are cached, so a 304 can never replay a bad row.
+        for row in rows:
+            _check_row(row, page_url)
+        cache.store(page_url, {
+            "etag": etag,
+            "last_modified": last_modified,
+            "rows": rows,
+            "next_cursor": next_cursor,
+        })
+    return rows, next_cursor
+
+
+def iter_health_rows(
+    *,
+    url: str | None,
+    path: str | None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    timeout: float = DEFAULT_TIMEOUT,
+    cache_dir: str | os.PathLike | None = None,
+) -> Iterator[dict]:
+    """Yield validated health rows from a file, or page by page from the endpoint.
+
+    Raises RuntimeError (possibly after some rows were yielded) on connection
+    failure, timeout, non-JSON, a missing `data` list, a malformed row, a
+    cursor that repeats, or a server that honours `limit` without a `nextCursor`. Callers that must not act on a partial result consume
+    the whole iterator before using what it produced, as `load_health_rows` and
+    `load_merged_rows` do.
+    """
+    source = path or url or "<none>"
+    if path is None and url is None:
+        raise RuntimeError("load_health_rows requires either url or path")
+    if path is not None:
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                raw = fh.read()
+        except Exception as exc:  # noqa: BLE001 — surface any I/O failure honestly
+            raise RuntimeError(f"could not read skill health from {source}: {exc}") from exc
+        for row in _parse_payload(raw, source)["data"]:
+            yield _check_row(row, source)
+        return
+
+    cache = PageCache(cache_dir) if cache_dir is not None else None
+
+    def fetch(limit: int, cursor: str | None, page: int) -> tuple[list, str | None]:
+        try:
+            return _fetch_page(_page_url(url, limit, cursor), timeout=timeout, cache=cache)
+        except RuntimeError:
+            raise
+        except Exception as exc:  # noqa: BLE001 — surface any I/O failure honestly
             raise RuntimeError(
-                f"skill health from {source} has a malformed row "
-                f"(each row needs {', '.join(_REQUIRED_ROW_KEYS)}): {row!r}"
-            )
-    return rows
+                f"could not read skill health from {source} (page {page}): {exc}"
+            ) from exc
+
+    cursor: str | None = None
+    seen: set[str] = set()
+    page = 1
+    while True:
+        rows, next_cursor = fetch(page_size, cursor, page)
+        for row in rows:
+            yield _check_row(row, source)
+        if next_cursor is None:
+            # More rows than `limit` means the server ignored paging and sent
+            # the whole window. Exactly `limit` rows is ambiguous: ask for one
+            # more row at the same cursor, and a server that returns it is
+            # paging under a continuation token this client does not know.
+            if len(rows) == page_size:
+                probe, _ = fetch(page_size + 1, cursor, page)
+                if len(probe) > page_size:
+                    raise RuntimeError(
+                        f"skill health from {source} (page {page}) honoured the "
+                        f"{page_size}-row limit but sent no nextCursor; refusing a "
+                        "truncated result"
+                    )
+            return
+        cursor = next_cursor
+        if cursor in seen:
+            raise RuntimeError(f"skill health from {source} repeated page cursor {cursor!r}")
+        seen.add(cursor)
+        page += 1
+
+
+def load_health_rows(*, url: str | None, path: str | None, **options) -> list[dict]:
+    """Return the `data` rows from a health payload (file or live endpoint).
+
+    Raises RuntimeError on connection failure, timeout, non-JSON, a missing
+    `data` list, or an item that lacks the required keys — never a partial or
+    fabricated result. `options` are passed to `iter_health_rows`.
+    """
+    return list(iter_health_rows(url=url, path=path, **options))
+
+
+def load_merged_rows(*, url: str | None, path: str | None, **options) -> list[dict]:
+    """Like `load_health_rows`, but aggregated per skill as the pages stream in.
+
+    Holds one merged row per skill instead of every per-version row, and raises
+    the same RuntimeError cases without returning a partial aggregate.
+    """
+    return list(aggregate_rows(iter_health_rows(url=url, path=path, **options)).values())
 
 
 def _newest(a: str | None, b: str | None) -> str | None:
@@ -73,7 +244,7 @@ def _newest(a: str | None, b: str | None) -> str | None:
     return max(present) if present else None
 
 
-def aggregate_rows(rows: list[dict]) -> dict[str, dict]:
+def aggregate_rows(rows: Iterable[dict]) -> dict[str, dict]:
     """Collapse health rows sharing a name into one merged row per skill.
 
     AgentMonitor keys rows by `(name, version)`, so a skill that changed version
@@ -82,7 +253,7 @@ def aggregate_rows(rows: list[dict]) -> dict[str, dict]:
     `invocations`/`misfires`/`misfireEligible`, hold `neverFired` only if every
     row never fired, keep the newest `lastInvokedAt`, and recompute
     `misfireRate` from the summed totals so it stays consistent with what the
-    report displays.
+    report displays. `rows` may be a lazy iterator; it is consumed once.
     """
     merged: dict[str, dict] = {}
     for row in rows:
@@ -14,6 +14,10 @@ Combines two deterministic signals into one per-skill view:
 This is reporting, not a gate — CI enforces the contract separately. Use it to
 answer "which skills are healthy, and is the catalog's trigger routing clean?"
 
+Both engines run in this process as library calls against one catalog snapshot
+(each SKILL.md read and parsed once), concurrently. With runtime flags, the
+AgentMonitor health rows are fetched alongside them and joined in-process.
+
 Usage:
     skills_health.py            # human-readable report
     skills_health.py --json     # machine-readable report
@@ -21,26 +25,41 @@ Usage:
 
 import argparse
 import json
-import subprocess
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 import skill_health_runtime as runtime  # noqa: E402  (I/O-free import)
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
-CONTRACT = REPO_ROOT / "skills" / "skill-evals" / "scripts" / "validate_skill_contract.py"
-TRIGGERS = REPO_ROOT / "skills" / "skill-evals" / "scripts" / "run_trigger_evals.py"
+# AgentMonitor pages with their ETags; every page is revalidated before use,
+# so the window the report covers is always the server's current one.
+HEALTH_CACHE_DIR = REPO_ROOT / ".cache" / "skill-health"
+
+
+def _contract_payload(snapshot) -> dict:
+    """What `validate_skill_contract.py --json` prints, evaluated in-process."""
+    import validate_skill_contract
 
+    results = snapshot.contract_results(strict=False)
+    if not results:
+        raise RuntimeError(f"no skills under {snapshot.skills_root}")
+    return {"summary": validate_skill_contract.summarize(results, False), "skills": results}
 
-def _run_json(args: list[str]) -> dict:
-    proc = subprocess.run(args, capture_output=True, text=True)
-    # Both tools print JSON to stdout and use exit codes to flag issues; we read
-    # the payload regardless of exit code (a failing contract is still valid JSON).
-    out = proc.stdout.strip()
-    if not out:
-        raise RuntimeError(f"no JSON from {' '.join(args)}\n{proc.stderr}")
-    return json.loads(out)
+
+def _triggers_payload(snapshot) -> dict:
+    """What `run_trigger_evals.py --from-triggers` prints, evaluated in-process."""
+    import run_trigger_evals
+
+    skills = run_trigger_evals.build_skill_index(
+        snapshot.skills_root, None,
+        frontmatter_of=lambda path: snapshot.frontmatter_of(path) or {},
+    )
+    if not skills:
+        raise RuntimeError(f"no skills available for scoring under {snapshot.skills_root}")
+    return run_trigger_evals.evaluate_declared_triggers(skills)
 
 
 def _dojo_skill_names(skills_root: Path) -> list[str]:
@@ -48,14 +67,43 @@ def _dojo_skill_names(skills_root: Path) -> list[str]:
 
     Matches how the contract validator scopes the catalog (globs
     `skills_root/*/SKILL.md`), so findings scope stays identical to the full
-    report without running the eval subprocesses.
+    report without loading the eval engines.
     """
     return sorted(p.parent.name for p in skills_root.glob("*/SKILL.md"))
 
 
-def build_report(skills_root: Path) -> dict:
-    contract = _run_json([sys.executable, str(CONTRACT), "--skills-root", str(skills_root), "--json"])
-    triggers = _run_json([sys.executable, str(TRIGGERS), "--from-triggers", "--skills-root", str(skills_root)])
+def _in_background(fn, **kwargs) -> Future:
+    """Run `fn(**kwargs)` on a daemon thread and return its Future.
+
+    Unlike a ThreadPoolExecutor worker, a daemon thread is not joined at exit,
+    so abandoning the future (after a failed static report) never waits out
+    the runtime fetch's network timeout.
+    """
+    future: Future = Future()
+
+    def work() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(**kwargs))
+        except BaseException as exc:  # noqa: BLE001 — re-raised by future.result()
+            future.set_exception(exc)
+
+    threading.Thread(target=work, name="skill-health-runtime", daemon=True).start()
+    return future
+
+
+def build_report(skills_root: Path, snapshot=None) -> dict:
+    # The eval engines (and PyYAML) load only here, so findings mode and the
+    # runtime module stay free of them.
+    from catalog_snapshot import Snapshot
+
+    snapshot = snapshot or Snapshot.load(skills_root)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        contract_future = pool.submit(_contract_payload, snapshot)
+        triggers_future = pool.submit(_triggers_payload, snapshot)
+        contract = contract_future.result()
+        triggers = triggers_future.result()
 
     # Group trigger assertions by skill
     trig_by_skill: dict[str, list[dict]] = {}
@@ -152,6 +200,10 @@ def main() -> int:
         "--health-json", default=None,
         help="Read health data from a saved JSON file instead of the endpoint (implies --runtime)",
     )
+    parser.add_argument(
+        "--no-health-cache", action="store_true",
+        help="Download every health page instead of revalidating cached pages",
+    )
     parser.add_argument(
         "--findings", action="store_true",
         help="Print paste-ready BACKLOG findings for never-fired skills (requires runtime; writes nothing)",
@@ -172,14 +224,19 @@ def main() -> int:
     )
     url = None if args.health_json else (args.agentmonitor_url or runtime.DEFAULT_URL)
     source = args.health_json or url
+    load_options = {
+        "url": url,
+        "path": args.health_json,
+        "cache_dir": None if args.no_health_cache else HEALTH_CACHE_DIR,
+    }
 
     # Findings mode is deliberately decoupled from the static report: it needs
     # only the dojo catalog (for scoping) and the health rows, so it never runs
-    # the contract/trigger eval subprocesses. A failure there must not suppress
-    # a valid findings run, and findings must not invoke skill-evals (per spec).
+    # the contract/trigger evals. A failure there must not suppress a valid
+    # findings run, and findings must not invoke skill-evals (per spec).
     if args.findings:
         try:
-            rows = runtime.load_health_rows(url=url, path=args.health_json)
+            rows = runtime.load_merged_rows(**load_options)
         except RuntimeError as exc:
             print(f"Failed to load runtime skill health: {exc}", file=sys.stderr)
             return 1
@@ -191,18 +248,25 @@ def main() -> int:
         print(runtime.render_findings(report))
         return 0
 
+    # The runtime fetch is network I/O, so it overlaps the static evaluation.
+    # If the static report fails the fetch is abandoned, not awaited.
+    rows_future = (
+        _in_background(runtime.load_merged_rows, **load_options)
+        if runtime_active else None
+    )
     try:
         report = build_report(skills_root)
-    except (RuntimeError, json.JSONDecodeError) as exc:
+    except (RuntimeError, OSError, ValueError) as exc:
+        if rows_future is not None:
+            rows_future.cancel()
         print(f"Failed to build health report: {exc}", file=sys.stderr)
         return 1
 
     # Load + enrich happen before any report is printed, so a requested-but-failed
     # runtime load yields no partial report.
-    if runtime_active:
+    if rows_future is not None:
         try:
-            rows = runtime.load_health_rows(url=url, path=args.health_json)
-            runtime.enrich_report(report, rows, source=source)
+            runtime.enrich_report(report, rows_future.result(), source=source)
         except RuntimeError as exc:
             print(f"Failed to load runtime skill health: {exc}", file=sys.stderr)
             return 1
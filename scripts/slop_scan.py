@@ -79,38 +79,46 @@ def default_files() -> list[Path]:
     return files
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
-    parser.add_argument("paths", nargs="*", help="Files to scan (default: skill prose + core docs)")
-    parser.add_argument("--list", action="store_true", help="Print patterns and exit")
-    parser.add_argument("--warn-only", action="store_true", help="Report hits but exit 0")
-    args = parser.parse_args()
-
-    if args.list:
-        for label, pat in PATTERNS:
-            print(f"{label:16} {pat}")
-        return 0
-
-    files = [Path(p) for p in args.paths] if args.paths else default_files()
+def scan_files(files: list[Path], warn_only: bool = False, read_text=None, stdout=None, stderr=None) -> int:
+    """Report every hit in files; return the CLI exit code."""
+    read_text = read_text or (lambda path: path.read_text(encoding="utf-8"))
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
 
     total = 0
     for path in files:
         if not path.exists():
             continue
-        for lineno, label, match in scan_text(path.read_text(encoding="utf-8")):
+        for lineno, label, match in scan_text(read_text(path)):
             try:
                 shown = path.relative_to(REPO_ROOT)
             except ValueError:
                 shown = path
-            print(f"{shown}:{lineno}: [{label}] {match!r}")
+            print(f"{shown}:{lineno}: [{label}] {match!r}", file=stdout)
             total += 1
 
     if total:
-        print(f"\n{total} slop hit(s) found.", file=sys.stderr)
-        return 0 if args.warn_only else 1
-    print("No slop detected.")
+        print(f"\n{total} slop hit(s) found.", file=stderr)
+        return 0 if warn_only else 1
+    print("No slop detected.", file=stdout)
     return 0
 
 
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", help="Files to scan (default: skill prose + core docs)")
+    parser.add_argument("--list", action="store_true", help="Print patterns and exit")
+    parser.add_argument("--warn-only", action="store_true", help="Report hits but exit 0")
+    args = parser.parse_args()
+
+    if args.list:
+        for label, pat in PATTERNS:
+            print(f"{label:16} {pat}")
+        return 0
+
+    files = [Path(p) for p in args.paths] if args.paths else default_files()
+    return scan_files(files, warn_only=args.warn_only)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -18,6 +18,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from instruction_audit import run_instruction_audit  # noqa: E402
 from score import compute_trust_score, format_score_json, format_score_markdown  # noqa: E402
+from skill_snapshot import SkillSnapshot  # noqa: E402
 from structural_audit import run_structural_audit  # noqa: E402
 
 # Repo root (two levels up from scripts/)
@@ -46,24 +47,20 @@ DANGEROUS_PATTERNS = [
 ]
 
 
-def run_code_audit_regex(skill_path: Path) -> list[dict]:
+def run_code_audit_regex(skill_path: Path, snapshot: SkillSnapshot | None = None) -> list[dict]:
     """Regex-based code checks (always available, no external deps)."""
-    scripts_dir = skill_path / "scripts"
-    if not scripts_dir.exists():
-        return []
-
+    snapshot = snapshot or SkillSnapshot(skill_path)
     findings = []
-    for fpath in scripts_dir.rglob("*"):
-        if not fpath.is_file() or fpath.suffix not in (".py", ".sh", ".bash", ".js", ".ts"):
+    for entry in snapshot.under("scripts"):
+        if entry.suffix not in (".py", ".sh", ".bash", ".js", ".ts"):
             continue
-        if any(part == "__pycache__" for part in fpath.parts):
+        if "__pycache__" in entry.rel.parts:
             continue
-        try:
-            content = fpath.read_text(encoding="utf-8", errors="replace")
-        except OSError:
+        content = entry.text()
+        if content is None:
             continue
 
-        rel = str(fpath.relative_to(skill_path))
+        rel = str(entry.rel)
         lines = content.split("\n")
 
         for i, line in enumerate(lines, 1):
@@ -186,9 +183,9 @@ def run_code_audit_semgrep(skill_path: Path) -> list[dict]:
     return findings
 
 
-def run_code_audit(skill_path: Path) -> list[dict]:
+def run_code_audit(skill_path: Path, snapshot: SkillSnapshot | None = None) -> list[dict]:
     """Run full Layer 3 audit: regex checks + semgrep (if available)."""
-    findings = run_code_audit_regex(skill_path)
+    findings = run_code_audit_regex(skill_path, snapshot)
     findings.extend(run_code_audit_semgrep(skill_path))
     return findings
 
@@ -205,15 +202,17 @@ def run_audit(skill_path: str, quick: bool = False, layers: list[int] | None = N
     has_scripts = (path / "scripts").exists()
     all_findings = []
     run_layers = layers or [1, 2, 3]
+    # One walk, and at most one read per file, shared by every layer.
+    snapshot = SkillSnapshot(path)
 
     if 1 in run_layers:
-        all_findings.extend(run_structural_audit(str(path)))
+        all_findings.extend(run_structural_audit(str(path), snapshot))
 
     if 2 in run_layers:
-        all_findings.extend(run_instruction_audit(str(path)))
+        all_findings.extend(run_instruction_audit(str(path), snapshot))
 
     if 3 in run_layers and not quick:
-        all_findings.extend(run_code_audit(path))
+        all_findings.extend(run_code_audit(path, snapshot))
 
     score = compute_trust_score(all_findings, has_scripts=has_scripts)
 
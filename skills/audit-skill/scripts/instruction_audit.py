@@ -8,6 +8,12 @@ import math
 from pathlib import Path
 from typing import Callable
 
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+from skill_snapshot import SkillSnapshot  # noqa: E402
+
 # --- Code block stripping ---
 
 
@@ -109,26 +115,22 @@ OVERREACH_PATTERNS = [
 ]
 
 
-def collect_markdown_files(skill_path: Path) -> list[tuple[Path, str]]:
+def collect_markdown_files(skill_path: Path, snapshot: SkillSnapshot | None = None) -> list[tuple[Path, str]]:
     """Gather all markdown files to audit: SKILL.md, commands/*.md, references/*.md."""
+    snapshot = snapshot or SkillSnapshot(skill_path)
     files = []
-    skill_md = skill_path / "SKILL.md"
-    if skill_md.exists():
-        files.append(skill_md)
+    if snapshot.skill_md is not None:
+        files.append(snapshot.skill_md)
 
     for subdir in ("commands", "references"):
-        d = skill_path / subdir
-        if d.exists():
-            files.extend(sorted(d.rglob("*.md")))
+        files.extend(
+            sorted(
+                (entry for entry in snapshot.under(subdir) if entry.rel.name.endswith(".md")),
+                key=lambda entry: entry.path,
+            )
+        )
 
-    result = []
-    for f in files:
-        try:
-            content = f.read_text(encoding="utf-8", errors="replace")
-            result.append((f, content))
-        except OSError:
-            pass
-    return result
+    return [(entry.path, entry.text()) for entry in files if entry.text() is not None]
 
 
 def _scan_patterns(
@@ -343,10 +345,10 @@ def overreach_scan(skill_path: Path, files: list[tuple[Path, str]]) -> list[dict
     return findings
 
 
-def run_instruction_audit(skill_path: str) -> list[dict]:
+def run_instruction_audit(skill_path: str, snapshot: SkillSnapshot | None = None) -> list[dict]:
     """Run all instruction-level checks and return findings."""
     path = Path(skill_path)
-    files = collect_markdown_files(path)
+    files = collect_markdown_files(path, snapshot)
     findings = []
     findings.extend(prompt_injection_scan(path, files))
     findings.extend(encoding_scan(path, files))
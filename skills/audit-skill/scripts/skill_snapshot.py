@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Per-skill file snapshot shared by every audit layer.
+
+One os.walk lists the skill and stats each file once. Contents are read on
+first use and decoded once, so a reference file that Layer 1 sizes and Layer 2
+scans is still read a single time. Text decoding matches
+Path.read_text(errors="replace"): UTF-8 with universal newlines, so line
+numbers agree with the per-file reads this replaces.
+"""
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+import yaml
+
+_SKILL_CREATOR_DIR = str(
+    Path(__file__).resolve().parent.parent.parent / "skill-creator" / "scripts"
+)
+if _SKILL_CREATOR_DIR not in sys.path:
+    sys.path.insert(0, _SKILL_CREATOR_DIR)
+
+from quick_validate import _extract_frontmatter  # noqa: E402
+
+_UNSET = object()
+
+
+class SkillFile:
+    """One file in the snapshot; bytes and text are loaded lazily and kept."""
+
+    def __init__(self, path: Path, rel: Path, st: os.stat_result | None):
+        self.path = path
+        self.rel = rel
+        self.size = st.st_size if st is not None else 0
+        self.is_file = st is not None and stat.S_ISREG(st.st_mode)
+        self._data = _UNSET
+        self._text = _UNSET
+
+    @property
+    def suffix(self) -> str:
+        return self.path.suffix
+
+    def in_dir(self, name: str) -> bool:
+        """True if the file lives under the top-level directory `name`."""
+        return len(self.rel.parts) > 1 and self.rel.parts[0] == name
+
+    def data(self) -> bytes | None:
+        if self._data is _UNSET:
+            try:
+                self._data = self.path.read_bytes()
+            except OSError:
+                self._data = None
+        return self._data
+
+    def text(self) -> str | None:
+        """Decoded contents, or None if the file could not be read."""
+        if self._text is _UNSET:
+            data = self.data()
+            self._text = (
+                None
+                if data is None
+                else data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+            )
+        return self._text
+
+
+class SkillSnapshot:
+    """Every file under a skill directory, listed by a single walk."""
+
+    def __init__(self, skill_path):
+        self.root = Path(skill_path)
+        self.files: list[SkillFile] = []
+        self._by_rel: dict[Path, SkillFile] = {}
+        self._frontmatter = _UNSET
+        for current, _dirs, names in os.walk(self.root):
+            base = Path(current)
+            for name in names:
+                path = base / name
+                try:
+                    st = path.stat()
+                except OSError:
+                    st = None
+                entry = SkillFile(path, path.relative_to(self.root), st)
+                self.files.append(entry)
+                self._by_rel[entry.rel] = entry
+
+    def get(self, rel: str) -> SkillFile | None:
+        entry = self._by_rel.get(Path(rel))
+        return entry if entry is not None and entry.is_file else None
+
+    @property
+    def skill_md(self) -> SkillFile | None:
+        return self.get("SKILL.md")
+
+    def under(self, name: str) -> list[SkillFile]:
+        """Regular files below the top-level directory `name`, in walk order."""
+        return [entry for entry in self.files if entry.is_file and entry.in_dir(name)]
+
+    def frontmatter(self):
+        """Parsed SKILL.md frontmatter: a dict, or None if absent or invalid."""
+        if self._frontmatter is _UNSET:
+            self._frontmatter = None
+            skill_md = self.skill_md
+            text = skill_md.text() if skill_md is not None else None
+            match = _extract_frontmatter(text) if text is not None else None
+            if match:
+                try:
+                    parsed = yaml.safe_load(match.group(1))
+                except yaml.YAMLError:
+                    parsed = None
+                if isinstance(parsed, dict):
+                    self._frontmatter = parsed
+        return self._frontmatter
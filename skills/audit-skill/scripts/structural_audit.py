@@ -1,21 +1,29 @@
 #!/usr/bin/env python3
-"""Layer 1: Structural audit for agent skills."""
+"""Layer 1: Structural audit for agent skills.
+
+Every check reads the skill through a SkillSnapshot, so one walk and at most
+one read per file serve the whole layer (and Layer 2, when audit_skill.py
+passes the same snapshot on).
+"""
 
-import os
 import re
 import sys
 from pathlib import Path
 
-import yaml
-
-# Import validate_skill and _extract_frontmatter from quick_validate.py
+# Import validate_skill_text from quick_validate.py
 _SKILL_CREATOR_DIR = str(
     Path(__file__).resolve().parent.parent.parent / "skill-creator" / "scripts"
 )
 if _SKILL_CREATOR_DIR not in sys.path:
     sys.path.insert(0, _SKILL_CREATOR_DIR)
 
-from quick_validate import _extract_frontmatter, validate_skill  # noqa: E402
+from quick_validate import validate_skill_text  # noqa: E402
+
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+from skill_snapshot import SkillSnapshot  # noqa: E402
 
 # Tool risk classification
 TOOL_RISK = {
@@ -54,9 +62,14 @@ NETWORK_PATTERNS = [
 ]
 
 
-def check_frontmatter(skill_path: Path) -> list[dict]:
+def check_frontmatter(skill_path: Path, snapshot: SkillSnapshot | None = None) -> list[dict]:
     """Validate skill via quick_validate and convert to findings."""
-    valid, message = validate_skill(str(skill_path))
+    snapshot = snapshot or SkillSnapshot(skill_path)
+    skill_md = snapshot.skill_md
+    if skill_md is None:
+        valid, message = False, "SKILL.md not found"
+    else:
+        valid, message = validate_skill_text(skill_md.text() or "")
     if valid:
         return []
     return [
@@ -73,23 +86,11 @@ def check_frontmatter(skill_path: Path) -> list[dict]:
     ]
 
 
-def allowed_tools_blast_radius(skill_path: Path) -> list[dict]:
+def allowed_tools_blast_radius(skill_path: Path, snapshot: SkillSnapshot | None = None) -> list[dict]:
     """Analyze allowed-tools for dangerous permissions."""
-    skill_md = skill_path / "SKILL.md"
-    if not skill_md.exists():
-        return []
-
-    content = skill_md.read_text(encoding="utf-8")
-    match = _extract_frontmatter(content)
-    if not match:
-        return []
-
-    try:
-        fm = yaml.safe_load(match.group(1))
-    except yaml.YAMLError:
-        return []
-
-    if not isinstance(fm, dict):
+    snapshot = snapshot or SkillSnapshot(skill_path)
+    fm = snapshot.frontmatter()
+    if fm is None:
         return []
 
     tools = fm.get("allowed-tools")
@@ -156,52 +157,50 @@ def allowed_tools_blast_radius(skill_path: Path) -> list[dict]:
     return findings
 
 
-def file_inventory(skill_path: Path) -> list[dict]:
+def file_inventory(skill_path: Path, snapshot: SkillSnapshot | None = None) -> list[dict]:
     """Flag suspicious files, excessive file count, or large total size."""
+    snapshot = snapshot or SkillSnapshot(skill_path)
     findings = []
     total_size = 0
     file_count = 0
 
-    for root, dirs, files in os.walk(skill_path):
+    for entry in snapshot.files:
         # Skip hidden directories and __pycache__
-        dirs[:] = [d for d in dirs if not d.startswith(".") and d != "__pycache__"]
-        for fname in files:
-            fpath = Path(root) / fname
-            rel = fpath.relative_to(skill_path)
-            file_count += 1
-            try:
-                total_size += fpath.stat().st_size
-            except OSError:
-                pass
-
-            ext = fpath.suffix.lower()
-            if ext in SUSPICIOUS_EXTENSIONS:
-                findings.append(
-                    {
-                        "id": "STRUCT-020",
-                        "severity": "HIGH",
-                        "layer": 1,
-                        "category": "suspicious-file",
-                        "message": f"Binary/compiled file detected: {rel}",
-                        "file": str(rel),
-                        "line": None,
-                        "remediation": "Remove compiled/binary files. Skills should contain source only.",
-                    }
-                )
+        if any(d.startswith(".") or d == "__pycache__" for d in entry.rel.parts[:-1]):
+            continue
+        fname = entry.rel.name
+        rel = entry.rel
+        file_count += 1
+        total_size += entry.size
 
-            if fname.startswith(".") and fname not in (".gitkeep", ".gitignore"):
-                findings.append(
-                    {
-                        "id": "STRUCT-021",
-                        "severity": "MEDIUM",
-                        "layer": 1,
-                        "category": "hidden-file",
-                        "message": f"Hidden file detected: {rel}",
-                        "file": str(rel),
-                        "line": None,
-                        "remediation": "Remove hidden files unless they serve a documented purpose.",
-                    }
-                )
+        ext = entry.suffix.lower()
+        if ext in SUSPICIOUS_EXTENSIONS:
+            findings.append(
+                {
+                    "id": "STRUCT-020",
+                    "severity": "HIGH",
+                    "layer": 1,
+                    "category": "suspicious-file",
+                    "message": f"Binary/compiled file detected: {rel}",
+                    "file": str(rel),
+                    "line": None,
+                    "remediation": "Remove compiled/binary files. Skills should contain source only.",
+                }
+            )
+
+        if fname.startswith(".") and fname not in (".gitkeep", ".gitignore"):
+            findings.append(
+                {
+                    "id": "STRUCT-021",
+                    "severity": "MEDIUM",
+                    "layer": 1,
+                    "category": "hidden-file",
+                    "message": f"Hidden file detected: {rel}",
+                    "file": str(rel),
+                    "line": None,
+                    "remediation": "Remove hidden files unless they serve a documented purpose.",
+                }
+            )
 
     if file_count > 50:
         findings.append(
@@ -234,47 +233,34 @@ def file_inventory(skill_path: Path) -> list[dict]:
     return findings
 
 
-def network_inference(skill_path: Path) -> list[dict]:
+def network_inference(skill_path: Path, snapshot: SkillSnapshot | None = None) -> list[dict]:
     """Detect network access in scripts not declared in compatibility."""
-    scripts_dir = skill_path / "scripts"
-    if not scripts_dir.exists():
+    snapshot = snapshot or SkillSnapshot(skill_path)
+    scripts = snapshot.under("scripts")
+    if not scripts:
         return []
 
     # Check if compatibility mentions network
-    skill_md = skill_path / "SKILL.md"
-    compatibility_mentions_network = False
-    if skill_md.exists():
-        content = skill_md.read_text(encoding="utf-8")
-        match = _extract_frontmatter(content)
-        if match:
-            try:
-                fm = yaml.safe_load(match.group(1))
-                compat = (fm or {}).get("compatibility", "")
-                if isinstance(compat, str) and re.search(
-                    r"(network|internet|online|http|api|fetch|download)", compat, re.I
-                ):
-                    compatibility_mentions_network = True
-            except yaml.YAMLError:
-                pass
+    compat = (snapshot.frontmatter() or {}).get("compatibility", "")
+    compatibility_mentions_network = isinstance(compat, str) and bool(
+        re.search(r"(network|internet|online|http|api|fetch|download)", compat, re.I)
+    )
 
     findings = []
     compiled = [re.compile(p, re.IGNORECASE) for p in NETWORK_PATTERNS]
 
-    for fpath in scripts_dir.rglob("*"):
-        if not fpath.is_file():
-            continue
-        if any(part == "__pycache__" for part in fpath.parts):
+    for entry in scripts:
+        if "__pycache__" in entry.rel.parts:
             continue
-        try:
-            text = fpath.read_text(encoding="utf-8", errors="replace")
-        except OSError:
+        text = entry.text()
+        if text is None:
             continue
 
         for i, line in enumerate(text.split("\n"), 1):
             for pat in compiled:
                 if pat.search(line):
                     severity = "HIGH" if not compatibility_mentions_network else "LOW"
-                    rel = fpath.relative_to(skill_path)
+                    rel = entry.rel
                     findings.append(
                         {
                             "id": "STRUCT-030",
@@ -298,13 +284,14 @@ def network_inference(skill_path: Path) -> list[dict]:
     return findings
 
 
-def size_check(skill_path: Path) -> list[dict]:
+def size_check(skill_path: Path, snapshot: SkillSnapshot | None = None) -> list[dict]:
     """Flag oversized markdown files."""
+    snapshot = snapshot or SkillSnapshot(skill_path)
     findings = []
 
-    skill_md = skill_path / "SKILL.md"
-    if skill_md.exists():
-        lines = skill_md.read_text(encoding="utf-8").count("\n")
+    skill_md = snapshot.skill_md
+    if skill_md is not None:
+        lines = (skill_md.text() or "").count("\n")
         if lines > 1000:
             findings.append(
                 {
@@ -332,12 +319,11 @@ def size_check(skill_path: Path) -> list[dict]:
                 }
             )
 
-    refs_dir = skill_path / "references"
-    if refs_dir.exists():
-        for fpath in refs_dir.rglob("*.md"):
-            lines = fpath.read_text(encoding="utf-8").count("\n")
+    for entry in snapshot.under("references"):
+        if entry.rel.name.endswith(".md"):
+            lines = (entry.text() or "").count("\n")
             if lines > 2000:
-                rel = fpath.relative_to(skill_path)
+                rel = entry.rel
                 findings.append(
                     {
                         "id": "STRUCT-041",
@@ -354,15 +340,16 @@ def size_check(skill_path: Path) -> list[dict]:
     return findings
 
 
-def run_structural_audit(skill_path: str) -> list[dict]:
+def run_structural_audit(skill_path: str, snapshot: SkillSnapshot | None = None) -> list[dict]:
     """Run all structural checks and return findings."""
     path = Path(skill_path)
+    snapshot = snapshot or SkillSnapshot(path)
     findings = []
-    findings.extend(check_frontmatter(path))
-    findings.extend(allowed_tools_blast_radius(path))
-    findings.extend(file_inventory(path))
-    findings.extend(network_inference(path))
-    findings.extend(size_check(path))
+    findings.extend(check_frontmatter(path, snapshot))
+    findings.extend(allowed_tools_blast_radius(path, snapshot))
+    findings.extend(file_inventory(path, snapshot))
+    findings.extend(network_inference(path, snapshot))
+    findings.extend(size_check(path, snapshot))
     return findings
 
 
@@ -13,16 +13,23 @@ Subcommands:
     generate  Create an image from a text prompt.
     edit      Edit an existing image with a text instruction.
     compose   Combine multiple images with a text instruction.
+    batch     Run many generate/edit/compose jobs from a JSONL file.
 
 Usage:
     uv run generate_image.py generate --prompt "a sunset" --filename sunset.png
     uv run generate_image.py edit --prompt "add clouds" --input-image photo.png --filename edited.png
     uv run generate_image.py compose --prompt "merge styles" --input-images a.png b.png --filename merged.png
+    uv run generate_image.py batch --input jobs.jsonl --out-dir out --concurrency 4
 """
 
 import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import json
 import os
+import re
 import sys
+import time
 from pathlib import Path
 
 # Image output requires an image-capable model; general aliases such as
@@ -37,6 +44,16 @@ ASPECT_CHOICES = [
     "9:16", "16:9", "21:9", "4:1", "1:4", "8:1", "1:8",
 ]
 RESOLUTION_CHOICES = ["1K", "2K", "4K"]
+MAX_INPUT_IMAGES = 14
+# Longest edge the model works at for each output tier. Input pixels beyond it
+# are discarded server-side, so uploading them only costs latency.
+RESOLUTION_MAX_DIM = {"1K": 1024, "2K": 2048, "4K": 4096}
+UPLOAD_JPEG_QUALITY = 90
+
+DEFAULT_CONCURRENCY = 4
+MAX_BATCH_JOBS = 500
+# HTTP statuses worth retrying: rate limiting and server-side unavailability.
+TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
 
 
 # ---------------------------------------------------------------------------
@@ -78,6 +95,16 @@ def save_image(pil_image, output_path: Path) -> None:
         pil_image.save(str(output_path), format="JPEG")
 
 
+def auto_resolution(width: int, height: int) -> str:
+    """Pick the output resolution tier that matches an input image's size."""
+    max_dim = max(width, height)
+    if max_dim >= 3000:
+        return "4K"
+    if max_dim >= 1500:
+        return "2K"
+    return "1K"
+
+
 def build_config(resolution: str | None, aspect_ratio: str | None):
     """Build a GenerateContentConfig with optional ImageConfig."""
     from google.genai import types
@@ -121,6 +148,126 @@ def process_response(response, output_path: Path) -> None:
         sys.exit(1)
 
 
+def write_response_image(response, output_path: Path) -> list[str]:
+    """Write the first image part to `output_path`; return any text parts.
+
+    Batch-mode counterpart of `process_response`: raises instead of exiting,
+    and writes the returned bytes as-is when they are already in the format
+    the extension asks for, so Pillow only runs when a conversion is needed.
+    """
+    texts: list[str] = []
+    for part in response.parts:
+        if part.text is not None:
+            texts.append(part.text)
+            continue
+        if part.inline_data is None:
+            continue
+        image_data = part.inline_data.data
+        if isinstance(image_data, str):
+            import base64
+            image_data = base64.b64decode(image_data)
+        mime = (getattr(part.inline_data, "mime_type", None) or "").lower()
+        wants_png = output_path.suffix.lower() == ".png"
+        if mime == ("image/png" if wants_png else "image/jpeg"):
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_bytes(image_data)
+        else:
+            from PIL import Image as PILImage
+            from io import BytesIO
+
+            save_image(PILImage.open(BytesIO(image_data)), output_path)
+        return texts
+    raise RuntimeError("No image was generated in the response.")
+
+
+def create_client(api_key: str):
+    from google import genai
+
+    return genai.Client(api_key=api_key)
+
+
+# ---------------------------------------------------------------------------
+# Upload optimisation
+# ---------------------------------------------------------------------------
+
+def encode_for_upload(path: str, max_dim: int) -> tuple[bytes, str, int]:
+    """Downsize an input image to fit `max_dim` and re-encode it compactly.
+
+    Opaque images become JPEG, images with transparency stay PNG. When the
+    image already fits and re-encoding would not shrink it, the original bytes
+    are kept. Returns (data, mime_type, original_size).
+    """
+    from io import BytesIO
+    from PIL import Image as PILImage
+
+    raw = Path(path).read_bytes()
+    with PILImage.open(BytesIO(raw)) as img:
+        source_mime = PILImage.MIME.get(img.format or "")
+        original_size = img.size
+        # JPEG can decode at 1/2..1/8 scale; never decode more pixels than needed.
+        img.draft(None, (max_dim, max_dim))
+        img.load()
+        width, height = img.size
+        scale = min(1.0, max_dim / max(width, height))
+        image = img
+        if scale < 1.0:
+            target = (max(1, round(width * scale)), max(1, round(height * scale)))
+            image = img.resize(target, PILImage.Resampling.LANCZOS)
+        has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+        out = BytesIO()
+        if has_alpha:
+            image.save(out, format="PNG", optimize=True)
+            mime = "image/png"
+        else:
+            image.convert("RGB").save(out, format="JPEG", quality=UPLOAD_JPEG_QUALITY, optimize=True)
+            mime = "image/jpeg"
+    data = out.getvalue()
+    resized = image.size != original_size
+    if not resized and len(data) >= len(raw) and source_mime in {"image/jpeg", "image/png", "image/webp"}:
+        return raw, source_mime, len(raw)
+    return data, mime, len(raw)
+
+
+def prepare_input_images(paths: list[str], resolution: str, optimize: bool) -> tuple[list, int, int]:
+    """Load input images for upload; returns (contents, bytes_before, bytes_after).
+
+    With `optimize`, each image is downsized to the target resolution and
+    re-encoded, decoding on a thread pool so a dozen large photos decode in
+    parallel. Without it, images go up at full resolution as before.
+    """
+    if not optimize:
+        from PIL import Image as PILImage
+
+        size = sum(Path(p).stat().st_size for p in paths)
+        return [PILImage.open(p) for p in paths], size, size
+
+    from google.genai import types
+
+    max_dim = RESOLUTION_MAX_DIM[resolution]
+    workers = max(1, min(8, len(paths)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        encoded = list(pool.map(lambda p: encode_for_upload(p, max_dim), paths))
+    parts = [types.Part.from_bytes(data=data, mime_type=mime) for data, mime, _ in encoded]
+    return parts, sum(size for _, _, size in encoded), sum(len(data) for data, _, _ in encoded)
+
+
+def format_upload_savings(before: int, after: int) -> str:
+    saved = before - after
+    percent = (saved / before * 100) if before else 0.0
+    return (
+        f"Upload optimisation: {before / 1_000_000:.2f} MB -> {after / 1_000_000:.2f} MB "
+        f"(saved {saved / 1_000_000:.2f} MB, {percent:.0f}%)"
+    )
+
+
+def detect_resolution(path: str) -> str:
+    """Resolution tier for an edit input; reads only the image header."""
+    from PIL import Image as PILImage
+
+    with PILImage.open(path) as img:
+        return auto_resolution(*img.size)
+
+
 # ---------------------------------------------------------------------------
 # Subcommand handlers
 # ---------------------------------------------------------------------------
@@ -129,9 +276,7 @@ def cmd_generate(args: argparse.Namespace) -> None:
     """Handle the 'generate' subcommand."""
     api_key = get_api_key(args.api_key)
 
-    from google import genai
-
-    client = genai.Client(api_key=api_key)
+    client = create_client(api_key)
     output_path = Path(args.filename)
     config = build_config(args.resolution, args.aspect)
 
@@ -153,10 +298,9 @@ def cmd_edit(args: argparse.Namespace) -> None:
     """Handle the 'edit' subcommand."""
     api_key = get_api_key(args.api_key)
 
-    from google import genai
     from PIL import Image as PILImage
 
-    client = genai.Client(api_key=api_key)
+    client = create_client(api_key)
     output_path = Path(args.filename)
 
     # Load input image
@@ -171,22 +315,26 @@ def cmd_edit(args: argparse.Namespace) -> None:
     resolution = args.resolution
     if resolution is None:
         width, height = input_image.size
-        max_dim = max(width, height)
-        if max_dim >= 3000:
-            resolution = "4K"
-        elif max_dim >= 1500:
-            resolution = "2K"
-        else:
-            resolution = "1K"
+        resolution = auto_resolution(width, height)
         print(f"Auto-detected resolution: {resolution} (from input {width}x{height})")
 
+    if args.no_optimize_inputs:
+        upload = [input_image]
+    else:
+        try:
+            upload, before, after = prepare_input_images([args.input_image], resolution, True)
+        except Exception as e:
+            print(f"Error preparing input image: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(format_upload_savings(before, after))
+
     config = build_config(resolution, args.aspect)
     print(f"Editing image with resolution {resolution}...")
 
     try:
         response = client.models.generate_content(
             model=args.model,
-            contents=[input_image, args.prompt],
+            contents=[*upload, args.prompt],
             config=config,
         )
         process_response(response, output_path)
@@ -203,8 +351,8 @@ def cmd_compose(args: argparse.Namespace) -> None:
     if len(args.input_images) < 1:
         print("Error: At least one input image is required.", file=sys.stderr)
         sys.exit(1)
-    if len(args.input_images) > 14:
-        print("Error: Maximum 14 input images supported.", file=sys.stderr)
+    if len(args.input_images) > MAX_INPUT_IMAGES:
+        print(f"Error: Maximum {MAX_INPUT_IMAGES} input images supported.", file=sys.stderr)
         sys.exit(1)
 
     # Verify all files exist before calling API
@@ -213,13 +361,17 @@ def cmd_compose(args: argparse.Namespace) -> None:
             print(f"Error: Image not found: {path}", file=sys.stderr)
             sys.exit(1)
 
-    from google import genai
-    from PIL import Image as PILImage
-
-    client = genai.Client(api_key=api_key)
+    client = create_client(api_key)
     output_path = Path(args.filename)
 
-    images = [PILImage.open(p) for p in args.input_images]
+    optimize = not args.no_optimize_inputs
+    try:
+        images, before, after = prepare_input_images(args.input_images, args.resolution, optimize)
+    except Exception as e:
+        print(f"Error preparing input images: {e}", file=sys.stderr)
+        sys.exit(1)
+    if optimize:
+        print(format_upload_savings(before, after))
     contents = [args.prompt] + images
 
     config = build_config(args.resolution, args.aspect)
@@ -237,6 +389,257 @@ def cmd_compose(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+# ---------------------------------------------------------------------------
+# Batch mode
+# ---------------------------------------------------------------------------
+
+def _slugify(value: str) -> str:
+    value = re.sub(r"[^a-z0-9]+", "-", value.strip().lower())
+    value = re.sub(r"-{2,}", "-", value).strip("-")
+    return value[:60] if value else "job"
+
+
+def _normalize_job(item, line_no: int) -> dict:
+    """Validate one JSONL job; a bare string line is a generate prompt."""
+    job = {"prompt": item} if isinstance(item, str) else item
+    if not isinstance(job, dict):
+        raise ValueError(f"line {line_no}: expected a string or an object")
+    if not str(job.get("prompt", "")).strip():
+        raise ValueError(f"line {line_no}: missing prompt")
+    command = job.get("command")
+    if command is None:
+        if job.get("input_images"):
+            command = "compose"
+        elif job.get("input_image"):
+            command = "edit"
+        else:
+            command = "generate"
+    if command not in {"generate", "edit", "compose"}:
+        raise ValueError(f"line {line_no}: unknown command {command!r}")
+    if command == "edit" and not job.get("input_image"):
+        raise ValueError(f"line {line_no}: edit requires input_image")
+    if command == "compose":
+        images = job.get("input_images") or []
+        if not 1 <= len(images) <= MAX_INPUT_IMAGES:
+            raise ValueError(f"line {line_no}: compose takes 1-{MAX_INPUT_IMAGES} input_images")
+    for key in ("resolution", "aspect"):
+        allowed = RESOLUTION_CHOICES if key == "resolution" else ASPECT_CHOICES
+        if job.get(key) is not None and job[key] not in allowed:
+            raise ValueError(f"line {line_no}: invalid {key} {job[key]!r}")
+    return {**job, "command": command, "prompt": str(job["prompt"]).strip()}
+
+
+def read_jobs(path: Path) -> list[dict]:
+    if not path.exists():
+        raise ValueError(f"Input file not found: {path}")
+    jobs: list[dict] = []
+    for line_no, raw in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            item = json.loads(line) if line.startswith("{") else line
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"line {line_no}: invalid JSON: {exc}") from exc
+        jobs.append(_normalize_job(item, line_no))
+    if not jobs:
+        raise ValueError("No jobs found in input file.")
+    if len(jobs) > MAX_BATCH_JOBS:
+        raise ValueError(f"Too many jobs ({len(jobs)}). Max is {MAX_BATCH_JOBS}.")
+    return jobs
+
+
+def job_output_path(out_dir: Path, index: int, job: dict) -> Path:
+    if job.get("filename"):
+        return out_dir / Path(job["filename"]).name
+    return out_dir / f"{index:03d}-{_slugify(job['prompt'][:80])}.jpg"
+
+
+def is_transient_error(exc: Exception) -> bool:
+    """Rate limits, server unavailability and timeouts; everything else is final."""
+    code = getattr(exc, "code", None) or getattr(exc, "status_code", None)
+    if isinstance(code, int) and code in TRANSIENT_STATUS_CODES:
+        return True
+    name = exc.__class__.__name__.lower()
+    if "timeout" in name or "ratelimit" in name:
+        return True
+    msg = str(exc).lower()
+    return any(
+        needle in msg
+        for needle in (
+            "429", "resource_exhausted", "rate limit", "503", "unavailable",
+            "timeout", "timed out", "deadline", "connection reset",
+        )
+    )
+
+
+def retry_delay(exc: Exception, attempt: int) -> float:
+    """Server-supplied retry-after when present, else capped exponential backoff."""
+    for attr in ("retry_after", "retry_after_seconds"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, (int, float)) and value >= 0:
+            return float(value)
+    match = re.search(r"retry(?:[- ]after|Delay)[\"':= ]+([0-9]+(?:\.[0-9]+)?)", str(exc), re.IGNORECASE)
+    if match:
+        return float(match.group(1))
+    return min(60.0, 2.0 ** attempt)
+
+
+def build_job_contents(job: dict, resolution: str, optimize: bool) -> tuple[list, int, int]:
+    """Request contents for a job plus its (bytes_before, bytes_after) upload size."""
+    if job["command"] == "generate":
+        return [job["prompt"]], 0, 0
+    if job["command"] == "edit":
+        images, before, after = prepare_input_images([job["input_image"]], resolution, optimize)
+        return [*images, job["prompt"]], before, after
+    images, before, after = prepare_input_images(job["input_images"], resolution, optimize)
+    return [job["prompt"], *images], before, after
+
+
+async def run_batch(args: argparse.Namespace, client, jobs: list[dict], results: list[dict]) -> None:
+    """Run every job over one shared client, appending a result record per job.
+
+    Records are appended as jobs start, so after a --fail-fast abort `results`
+    still holds every finished, failed and cancelled job for the summary.
+    """
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    sem = asyncio.Semaphore(args.concurrency)
+
+    async def run_job(index: int, job: dict) -> None:
+        label = f"[job {index}/{len(jobs)}]"
+        output_path = job_output_path(out_dir, index, job)
+        record = {
+            "job": index,
+            "command": job["command"],
+            "output": str(output_path),
+            "status": "ok",
+            "attempts": 0,
+            "latency_s": 0.0,
+        }
+        results.append(record)
+        if output_path.exists() and not args.force:
+            record.update(status="failed", error=f"Output already exists: {output_path} (use --force)")
+            print(f"{label} failed: {record['error']}", file=sys.stderr)
+            return
+        started = time.monotonic()
+        try:
+            resolution = job.get("resolution") or args.resolution
+            if resolution is None:
+                # Same rule as the edit subcommand; generate/compose default to 1K.
+                if job["command"] == "edit":
+                    resolution = await asyncio.to_thread(detect_resolution, job["input_image"])
+                else:
+                    resolution = "1K"
+            config = build_config(resolution, job.get("aspect") or args.aspect)
+            for attempt in range(1, args.max_attempts + 1):
+                record["attempts"] = attempt
+                try:
+                    # A slot covers preparing the inputs and sending them, so
+                    # --concurrency bounds the decoded images held at once. The
+                    # contents are rebuilt per attempt and dropped before any
+                    # backoff, which therefore holds neither a slot nor images.
+                    async with sem:
+                        contents, before, after = await asyncio.to_thread(
+                            build_job_contents, job, resolution, not args.no_optimize_inputs
+                        )
+                        if before != after:
+                            record["upload_bytes_saved"] = before - after
+                        try:
+                            response = await client.aio.models.generate_content(
+                                model=job.get("model", args.model),
+                                contents=contents,
+                                config=config,
+                            )
+                        finally:
+                            del contents
+                    break
+                except Exception as exc:
+                    if attempt == args.max_attempts or not is_transient_error(exc):
+                        raise
+                    delay = retry_delay(exc, attempt)
+                    print(
+                        f"{label} attempt {attempt}/{args.max_attempts} failed "
+                        f"({exc.__class__.__name__}); retrying in {delay:.1f}s",
+                        file=sys.stderr,
+                    )
+                    await asyncio.sleep(delay)
+            texts = await asyncio.to_thread(write_response_image, response, output_path)
+            if texts:
+                record["text"] = "\n".join(texts)
+            print(f"{label} saved {output_path}", file=sys.stderr)
+        except asyncio.CancelledError:
+            record.update(status="cancelled", error="batch aborted before this job finished")
+            raise
+        except Exception as exc:
+            record.update(status="failed", error=str(exc))
+            print(f"{label} failed: {exc}", file=sys.stderr)
+            if args.fail_fast:
+                raise
+        finally:
+            record["latency_s"] = round(time.monotonic() - started, 3)
+
+    tasks = [asyncio.create_task(run_job(i, job)) for i, job in enumerate(jobs, start=1)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        # Let cancelled jobs record their status before the summary is written.
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def write_summary(args: argparse.Namespace, jobs: list[dict], results: list[dict],
+                  aborted: str | None = None) -> tuple[dict, Path]:
+    """Write the per-job summary JSON; jobs that never started are not listed."""
+    results = sorted(results, key=lambda record: record["job"])
+    summary = {
+        "total": len(jobs),
+        "upload_bytes_saved": sum(r.get("upload_bytes_saved", 0) for r in results),
+        "ok": sum(1 for r in results if r["status"] == "ok"),
+        "failed": sum(1 for r in results if r["status"] == "failed"),
+        "jobs": results,
+    }
+    if aborted is not None:
+        summary["aborted"] = aborted
+        summary["cancelled"] = sum(1 for r in results if r["status"] == "cancelled")
+        summary["not_started"] = len(jobs) - len(results)
+    summary_path = Path(args.summary) if args.summary else Path(args.out_dir) / "batch-summary.json"
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    summary_path.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+    return summary, summary_path
+
+
+def cmd_batch(args: argparse.Namespace) -> None:
+    """Handle the 'batch' subcommand."""
+    if not 1 <= args.concurrency <= 16:
+        print("Error: --concurrency must be between 1 and 16.", file=sys.stderr)
+        sys.exit(1)
+    if not 1 <= args.max_attempts <= 10:
+        print("Error: --max-attempts must be between 1 and 10.", file=sys.stderr)
+        sys.exit(1)
+    try:
+        jobs = read_jobs(Path(args.input))
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    client = create_client(get_api_key(args.api_key))
+    results: list[dict] = []
+    try:
+        asyncio.run(run_batch(args, client, jobs, results))
+    except Exception as exc:
+        _, summary_path = write_summary(args, jobs, results, aborted=str(exc))
+        print(f"Error: batch aborted: {exc}. Partial summary: {summary_path}", file=sys.stderr)
+        sys.exit(1)
+
+    summary, summary_path = write_summary(args, jobs, results)
+    print(f"Batch finished: {summary['ok']} ok, {summary['failed']} failed. Summary: {summary_path}")
+    if summary["failed"]:
+        sys.exit(1)
+
+
 # ---------------------------------------------------------------------------
 # Argument parsing
 # ---------------------------------------------------------------------------
@@ -267,6 +670,15 @@ def _add_common_args(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def _add_upload_args(parser: argparse.ArgumentParser) -> None:
+    """Add the input-image upload flag shared by edit, compose, and batch."""
+    parser.add_argument(
+        "--no-optimize-inputs",
+        action="store_true",
+        help="Upload input images at full resolution instead of downsizing them to the target resolution",
+    )
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Generate, edit, or compose images with the Gemini API",
@@ -285,6 +697,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--input-image", "-i", required=True,
         help="Path to the input image to edit",
     )
+    _add_upload_args(edit_parser)
 
     # compose
     compose_parser = subparsers.add_parser("compose", help="Combine multiple images")
@@ -293,6 +706,30 @@ def build_parser() -> argparse.ArgumentParser:
         "--input-images", "-I", nargs="+", required=True,
         help="Paths to input images (1-14)",
     )
+    _add_upload_args(compose_parser)
+
+    # batch
+    batch_parser = subparsers.add_parser(
+        "batch", help="Run generate/edit/compose jobs from JSONL over one shared client"
+    )
+    batch_parser.add_argument("--input", required=True, help="JSONL file, one job per line")
+    batch_parser.add_argument("--out-dir", required=True, help="Directory for job outputs")
+    batch_parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    batch_parser.add_argument("--max-attempts", type=int, default=4)
+    batch_parser.add_argument("--summary", help="Per-job results JSON (default: <out-dir>/batch-summary.json)")
+    batch_parser.add_argument("--force", action="store_true", help="Overwrite existing outputs")
+    batch_parser.add_argument("--fail-fast", action="store_true")
+    batch_parser.add_argument(
+        "--resolution", "-r", choices=RESOLUTION_CHOICES,
+        help="Default resolution for jobs that do not set one (edits auto-detect, others 1K)",
+    )
+    batch_parser.add_argument(
+        "--aspect", "-a", choices=ASPECT_CHOICES,
+        help="Default aspect ratio for jobs that do not set one",
+    )
+    batch_parser.add_argument("--api-key", "-k", help="Gemini API key (overrides GEMINI_API_KEY env var)")
+    batch_parser.add_argument("--model", "-m", default=DRAFT_MODEL, help="Default model for jobs")
+    _add_upload_args(batch_parser)
 
     return parser
 
@@ -305,6 +742,7 @@ def main() -> None:
         "generate": cmd_generate,
         "edit": cmd_edit,
         "compose": cmd_compose,
+        "batch": cmd_batch,
     }
     dispatch[args.command](args)
 
@@ -9,6 +9,9 @@ from __future__ import annotations
 import argparse
 import asyncio
 import base64
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import hashlib
 import json
 import os
 from pathlib import Path
@@ -24,6 +27,7 @@ DEFAULT_SIZE = "1024x1024"
 DEFAULT_QUALITY = "auto"
 DEFAULT_OUTPUT_FORMAT = "png"
 DEFAULT_CONCURRENCY = 5
+DEFAULT_POSTPROCESS_WORKERS = min(4, os.cpu_count() or 1)
 DEFAULT_DOWNSCALE_SUFFIX = "-web"
 
 ALLOWED_SIZES = {"1024x1024", "1536x1024", "1024x1536", "auto"}
@@ -32,6 +36,7 @@ ALLOWED_BACKGROUNDS = {"transparent", "opaque", "auto", None}
 
 MAX_IMAGE_BYTES = 50 * 1024 * 1024
 MAX_BATCH_JOBS = 500
+CHECKPOINT_SUFFIX = ".checkpoint.jsonl"
 
 
 def _die(message: str, code: int = 1) -> None:
@@ -412,6 +417,85 @@ def _job_output_paths(
     ]
 
 
+def _checkpoint_path(out_dir: Path) -> Path:
+    resolved = out_dir.resolve()
+    return resolved.with_name(resolved.name + CHECKPOINT_SUFFIX)
+
+
+def _payload_hash(payload: Dict[str, Any]) -> str:
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _read_checkpoint(path: Path) -> Dict[int, Dict[str, Any]]:
+    """Latest record per job index; tolerates a torn final line."""
+    records: Dict[int, Dict[str, Any]] = {}
+    if not path.exists():
+        return records
+    for raw in path.read_text(encoding="utf-8").splitlines():
+        try:
+            record = json.loads(raw)
+            records[int(record["job"])] = record
+        except (ValueError, KeyError, TypeError):
+            continue
+    return records
+
+
+def _checkpoint_satisfied(
+    record: Optional[Dict[str, Any]], payload_hash: str, outputs: List[Path]
+) -> bool:
+    if not record or record.get("status", "completed") != "completed":
+        return False
+    if record.get("payload_hash") != payload_hash:
+        return False
+    if record.get("outputs") != [str(p) for p in outputs]:
+        return False
+    return all(p.exists() for p in outputs)
+
+
+def _checkpoint_interrupted(record: Optional[Dict[str, Any]], outputs: List[Path]) -> bool:
+    """True if the journal shows these outputs were being written and never finished."""
+    return (
+        record is not None
+        and record.get("status") == "started"
+        and record.get("outputs") == [str(p) for p in outputs]
+    )
+
+
+class _CheckpointJournal:
+    """Append-only record of batch jobs, one JSON object per line.
+
+    Never truncated: a run without --resume still appends, so an aborted run
+    cannot erase the record of images already paid for.
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = path.open("a", encoding="utf-8")
+
+    def start(self, job: int, payload_hash: str, outputs: List[Path]) -> None:
+        """Mark outputs as being written; only these may be overwritten on resume."""
+        self._write(job, "started", payload_hash, outputs)
+
+    def record(self, job: int, payload_hash: str, outputs: List[Path]) -> None:
+        self._write(job, "completed", payload_hash, outputs)
+
+    def _write(self, job: int, status: str, payload_hash: str, outputs: List[Path]) -> None:
+        entry = {
+            "job": job,
+            "status": status,
+            "payload_hash": payload_hash,
+            "outputs": [str(p) for p in outputs],
+            f"{status}_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+        self._handle.write(json.dumps(entry, sort_keys=True) + "\n")
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+    def close(self) -> None:
+        self._handle.close()
+
+
 def _extract_retry_after_seconds(exc: Exception) -> Optional[float]:
     # Best-effort: openai SDK errors vary by version. Prefer a conservative fallback.
     for attr in ("retry_after", "retry_after_seconds"):
@@ -446,31 +530,103 @@ def _is_transient_error(exc: Exception) -> bool:
     return "timeout" in msg or "timed out" in msg or "connection reset" in msg
 
 
+class _AdaptiveLimiter:
+    """AIMD concurrency window shared by every job in a batch.
+
+    A rate-limit response halves the window (once per congestion event: only
+    requests started after the last cut can cut again) and pauses every job
+    until the largest retry-after seen has elapsed. Each success widens the
+    window by 1/window, so it regrows by about one slot per window of
+    successes, up to --concurrency.
+    """
+
+    def __init__(self, max_window: int):
+        self.max_window = max_window
+        self.window = float(max_window)
+        self.min_window = float(max_window)
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.rate_limits = 0
+        self._last_cut = 0.0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> float:
+        async with self._cond:
+            while True:
+                delay = self.paused_until - time.monotonic()
+                if delay <= 0 and self.in_flight < max(1, int(self.window)):
+                    self.in_flight += 1
+                    return time.monotonic()
+                try:
+                    await asyncio.wait_for(self._cond.wait(), timeout=delay if delay > 0 else None)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def release(self, started: float, outcome: str, retry_after: Optional[float] = None) -> None:
+        """Return a slot; `outcome` is "ok", "rate_limited" or "error"."""
+        async with self._cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if outcome == "ok":
+                self.window = min(float(self.max_window), self.window + 1.0 / self.window)
+            elif outcome == "rate_limited":
+                self.rate_limits += 1
+                if started >= self._last_cut:
+                    self.window = max(1.0, self.window / 2.0)
+                    self.min_window = min(self.min_window, self.window)
+                    self._last_cut = now
+                if retry_after:
+                    self.paused_until = max(self.paused_until, now + retry_after)
+            self._cond.notify_all()
+
+
 async def _generate_one_with_retries(
     client: Any,
     payload: Dict[str, Any],
     *,
     attempts: int,
     job_label: str,
+    limiter: _AdaptiveLimiter,
+    stats: Dict[str, Any],
 ) -> Any:
     last_exc: Optional[Exception] = None
     for attempt in range(1, attempts + 1):
+        stats["attempts"] = attempt
+        started = await limiter.acquire()
         try:
-            return await client.images.generate(**payload)
+            result = await client.images.generate(**payload)
         except Exception as exc:
             last_exc = exc
+            rate_limited = _is_rate_limit_error(exc)
+            sleep_s = _extract_retry_after_seconds(exc)
+            if sleep_s is None:
+                sleep_s = min(60.0, 2.0**attempt)
+            if rate_limited:
+                # The shared pause replaces a per-job sleep: every job waits it out.
+                await limiter.release(started, "rate_limited", sleep_s)
+            else:
+                await limiter.release(started, "error")
             if not _is_transient_error(exc):
                 raise
             if attempt == attempts:
                 raise
-            sleep_s = _extract_retry_after_seconds(exc)
-            if sleep_s is None:
-                sleep_s = min(60.0, 2.0**attempt)
+            stats["retries"] += 1
+            if rate_limited:
+                stats["rate_limited"] += 1
+                print(
+                    f"{job_label} attempt {attempt}/{attempts} rate limited; window now "
+                    f"{int(limiter.window)}, all jobs paused {sleep_s:.1f}s",
+                    file=sys.stderr,
+                )
+                continue
             print(
                 f"{job_label} attempt {attempt}/{attempts} failed ({exc.__class__.__name__}); retrying in {sleep_s:.1f}s",
                 file=sys.stderr,
             )
             await asyncio.sleep(sleep_s)
+            continue
+        await limiter.release(started, "ok")
+        return result
     raise last_exc or RuntimeError("unknown error")
 
 
@@ -535,14 +691,40 @@ async def _run_generate_batch(args: argparse.Namespace) -> int:
         return 0
 
     client = _create_async_client()
-    sem = asyncio.Semaphore(args.concurrency)
+    # `limiter` gates network calls only, adapting its window to rate limits.
+    # Decode/write/downscale runs on a bounded thread pool so Pillow work never
+    # stalls the event loop; `pipeline` caps jobs holding undecoded results, so
+    # a backed-up pool stops new requests instead of buffering base64 payloads
+    # without limit.
+    limiter = _AdaptiveLimiter(args.concurrency)
+    workers = args.postprocess_workers
+    pipeline = asyncio.Semaphore(args.concurrency + 2 * workers)
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image-postprocess")
+    loop = asyncio.get_running_loop()
+
+    # Completed jobs are journalled beside --out-dir so a re-run with --resume
+    # skips every image already paid for.
+    checkpoint_path = _checkpoint_path(out_dir)
+    completed = _read_checkpoint(checkpoint_path) if args.resume else {}
+    journal = _CheckpointJournal(checkpoint_path)
 
     any_failed = False
+    job_stats: List[Dict[str, Any]] = []
+    batch_started = time.monotonic()
 
     async def run_job(i: int, job: Dict[str, Any]) -> Tuple[int, Optional[str]]:
         nonlocal any_failed
         prompt = str(job["prompt"]).strip()
         job_label = f"[job {i}/{len(jobs)}]"
+        stats: Dict[str, Any] = {
+            "job": i,
+            "status": "ok",
+            "attempts": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "latency_s": 0.0,
+        }
+        job_stats.append(stats)
 
         fields = _merge_non_null(base_fields, job.get("fields", {}))
         fields = _merge_non_null(fields, {k: job.get(k) for k in base_fields.keys()})
@@ -567,30 +749,65 @@ async def _run_generate_batch(args: argparse.Namespace) -> int:
             n=n,
             explicit_out=job.get("out"),
         )
+        written = list(outputs)
+        if args.downscale_max_dim is not None:
+            written += [_derive_downscale_path(p, args.downscale_suffix) for p in outputs]
+        payload_hash = _payload_hash(
+            {
+                "request": payload,
+                "downscale_max_dim": args.downscale_max_dim,
+                "downscale_suffix": args.downscale_suffix,
+            }
+        )
+        if _checkpoint_satisfied(completed.get(i), payload_hash, written):
+            print(f"{job_label} skipped (checkpointed)", file=sys.stderr)
+            stats["status"] = "skipped"
+            return i, None
+        # Only outputs the journal shows were mid-write when a run stopped are
+        # partial; anything else on disk is a finished image and needs --force.
+        force = args.force or (args.resume and _checkpoint_interrupted(completed.get(i), written))
+        # Checked before paying for a generation, and before `journal.start`, so
+        # an aborted run never marks a finished image as partial.
+        if not force:
+            for path in written:
+                if path.exists():
+                    _die(f"Output already exists: {path} (use --force to overwrite)")
         try:
-            async with sem:
+            async with pipeline:
                 print(f"{job_label} starting", file=sys.stderr)
                 started = time.time()
-                result = await _generate_one_with_retries(
-                    client,
-                    payload,
-                    attempts=args.max_attempts,
-                    job_label=job_label,
+                try:
+                    result = await _generate_one_with_retries(
+                        client,
+                        payload,
+                        attempts=args.max_attempts,
+                        job_label=job_label,
+                        limiter=limiter,
+                        stats=stats,
+                    )
+                finally:
+                    stats["latency_s"] = round(time.time() - started, 3)
+                print(f"{job_label} completed in {stats['latency_s']:.1f}s", file=sys.stderr)
+                images = [item.b64_json for item in result.data]
+                journal.start(i, payload_hash, written)
+                await loop.run_in_executor(
+                    pool,
+                    functools.partial(
+                        _decode_write_and_downscale,
+                        images,
+                        outputs,
+                        force=force,
+                        downscale_max_dim=args.downscale_max_dim,
+                        downscale_suffix=args.downscale_suffix,
+                        output_format=effective_output_format,
+                    ),
                 )
-                elapsed = time.time() - started
-                print(f"{job_label} completed in {elapsed:.1f}s", file=sys.stderr)
-            images = [item.b64_json for item in result.data]
-            _decode_write_and_downscale(
-                images,
-                outputs,
-                force=args.force,
-                downscale_max_dim=args.downscale_max_dim,
-                downscale_suffix=args.downscale_suffix,
-                output_format=effective_output_format,
-            )
+            journal.record(i, payload_hash, written)
             return i, None
         except Exception as exc:
             any_failed = True
+            stats["status"] = "failed"
+            stats["error"] = str(exc)
             print(f"{job_label} failed: {exc}", file=sys.stderr)
             if args.fail_fast:
                 raise
@@ -600,11 +817,33 @@ async def _run_generate_batch(args: argparse.Namespace) -> int:
 
     try:
         await asyncio.gather(*tasks)
-    except Exception:
+    except BaseException:
         for t in tasks:
             if not t.done():
                 t.cancel()
         raise
+    finally:
+        pool.shutdown(wait=True)
+        journal.close()
+
+    summary = {
+        "jobs": sorted(job_stats, key=lambda item: item["job"]),
+        "totals": {
+            status: sum(1 for item in job_stats if item["status"] == status)
+            for status in ("ok", "failed", "skipped")
+        },
+        "retries": sum(item["retries"] for item in job_stats),
+        "rate_limited": limiter.rate_limits,
+        "window": {
+            "max": limiter.max_window,
+            "min": int(limiter.min_window),
+            "final": int(limiter.window),
+        },
+        "elapsed_s": round(time.monotonic() - batch_started, 3),
+    }
+    print(json.dumps(summary, sort_keys=True), file=sys.stderr)
+    if args.summary:
+        Path(args.summary).write_text(json.dumps(summary, indent=2, sort_keys=True) + "\n", encoding="utf-8")
 
     return 1 if any_failed else 0
 
@@ -840,6 +1079,18 @@ def main() -> int:
     batch_parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
     batch_parser.add_argument("--max-attempts", type=int, default=3)
     batch_parser.add_argument("--fail-fast", action="store_true")
+    batch_parser.add_argument("--summary", help="Write the per-job latency/retry JSON summary here")
+    batch_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip jobs the checkpoint journal next to --out-dir records as complete",
+    )
+    batch_parser.add_argument(
+        "--postprocess-workers",
+        type=int,
+        default=DEFAULT_POSTPROCESS_WORKERS,
+        help="Threads for decode/write/downscale, separate from --concurrency",
+    )
     batch_parser.set_defaults(func=_generate_batch)
 
     edit_parser = subparsers.add_parser("edit", help="Edit an existing image")
@@ -856,6 +1107,8 @@ def main() -> int:
         _die("--concurrency must be between 1 and 25")
     if getattr(args, "max_attempts", 3) < 1 or getattr(args, "max_attempts", 3) > 10:
         _die("--max-attempts must be between 1 and 10")
+    if not 1 <= getattr(args, "postprocess_workers", 1) <= 32:
+        _die("--postprocess-workers must be between 1 and 32")
     if args.output_compression is not None and not (0 <= args.output_compression <= 100):
         _die("--output-compression must be between 0 and 100")
     if args.command == "generate-batch" and not args.out_dir:
@@ -12,14 +12,21 @@ imperative marker (must / never / always / do not / don't) and each bullet that
 starts with a common imperative verb counts as one instruction. Judgment checks
 (requirements checkable from report text, do-nots being topic-specific) stay
 with the drafting session.
+
+``--watch`` keeps the lint loop interactive while drafting: the prompt is split
+into its skeleton blocks, each block's partial results are cached by content
+hash, and every save re-lints only the blocks that changed, streaming JSON
+lines. ``--cache`` persists the same per-block cache between one-shot runs.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import re
 import sys
+import time
 from pathlib import Path
 
 BUDGETS = {"web": 40, "terminal": 60}
@@ -94,6 +101,10 @@ def count_instructions(text: str) -> int:
 
 def seed_block(text: str) -> str:
     """Return the seed-sources / background region, or '' when absent."""
+    return "\n".join(seed_lines(text))
+
+
+def seed_lines(text: str) -> list[str]:
     lines = text.splitlines()
     collected: list[str] = []
     inside = False
@@ -106,13 +117,17 @@ def seed_block(text: str) -> str:
         elif SEED_BLOCK_START_RE.match(line):
             inside = True
             collected.append(line)
-    return "\n".join(collected)
+    return collected
 
 
 def unsourced_magnitudes(text: str) -> list[str]:
     """Magnitudes seeded without a retrievable identifier, in document order."""
+    return floating_magnitudes(seed_block(text))
+
+
+def floating_magnitudes(seed: str) -> list[str]:
     found: list[str] = []
-    for entry in SEED_ENTRY_SPLIT_RE.split(seed_block(text)):
+    for entry in SEED_ENTRY_SPLIT_RE.split(seed):
         if IDENTIFIER_RE.search(entry):
             continue
         for match in MAGNITUDE_RE.finditer(entry):
@@ -122,18 +137,40 @@ def unsourced_magnitudes(text: str) -> list[str]:
     return found
 
 
+def slot_names(text: str) -> list[str]:
+    return [match.split()[0] if (match := m.group(1).strip()) else "(unnamed)"
+            for m in SLOT_RE.finditer(text)]
+
+
+def harness_trailer(text: str) -> str | None:
+    match = HARNESS_TRAILER_RE.search(text)
+    return match.group("trailer") if match else None
+
+
 def evaluate(text: str, executor: str) -> dict:
+    return summarize({
+        "slots": slot_names(text),
+        "comments": "<!--" in text,
+        "trailer": harness_trailer(text),
+        "instructions": count_instructions(text),
+        "blocks": [name for name, pattern, _ in REQUIRED_BLOCKS if pattern.search(text)],
+        "floating": unsourced_magnitudes(text),
+        "summary_tokens": [t for t in SUMMARY_TOKENS if t in text],
+    }, executor)
+
+
+def summarize(facts: dict, executor: str) -> dict:
+    """Turn whole-prompt facts into the check list ``evaluate`` reports."""
     checks = []
 
-    slots = [match.split()[0] if (match := m.group(1).strip()) else "(unnamed)"
-             for m in SLOT_RE.finditer(text)]
+    slots = facts["slots"]
     checks.append({
         "name": "unfilled_slots",
         "status": "fail" if slots else "pass",
         "detail": f"unfilled slots: {', '.join(slots)}" if slots else "no unfilled slots",
     })
 
-    has_comments = "<!--" in text
+    has_comments = facts["comments"]
     checks.append({
         "name": "drafting_comments",
         "status": "fail" if has_comments else "pass",
@@ -141,16 +178,16 @@ def evaluate(text: str, executor: str) -> dict:
         if has_comments else "no drafting comments",
     })
 
-    harness_trailer = HARNESS_TRAILER_RE.search(text)
+    trailer = facts["trailer"]
     checks.append({
         "name": "harness_debris",
-        "status": "fail" if harness_trailer else "pass",
-        "detail": f"trailing harness debris: {harness_trailer.group('trailer')}"
-        if harness_trailer else "no trailing harness debris",
+        "status": "fail" if trailer else "pass",
+        "detail": f"trailing harness debris: {trailer}"
+        if trailer else "no trailing harness debris",
     })
 
     budget = BUDGETS[executor]
-    count = count_instructions(text)
+    count = facts["instructions"]
     if count > budget:
         status = "fail"
     elif count >= WARN_FRACTION * budget:
@@ -164,14 +201,14 @@ def evaluate(text: str, executor: str) -> dict:
     })
 
     for name, pattern, label in REQUIRED_BLOCKS:
-        present = bool(pattern.search(text))
+        present = name in facts["blocks"]
         checks.append({
             "name": name,
             "status": "pass" if present else "fail",
             "detail": f"{label} {'present' if present else 'missing'}",
         })
 
-    floating = unsourced_magnitudes(text)
+    floating = facts["floating"]
     checks.append({
         "name": "seeded_statistics",
         "status": "warn" if floating else "pass",
@@ -181,7 +218,7 @@ def evaluate(text: str, executor: str) -> dict:
         if floating else "no unsourced seeded magnitudes",
     })
 
-    missing_tokens = [t for t in SUMMARY_TOKENS if t not in text]
+    missing_tokens = [t for t in SUMMARY_TOKENS if t not in facts["summary_tokens"]]
     checks.append({
         "name": "summary_block",
         "status": "fail" if missing_tokens else "pass",
@@ -200,6 +237,173 @@ def evaluate(text: str, executor: str) -> dict:
     }
 
 
+# --- incremental mode -----------------------------------------------------
+
+# Blocks open at the lines the seed scan already treats as boundaries (headings,
+# bold lead-ins, seed/background openers). Every other check is line-local, so
+# merging per-block facts reproduces ``evaluate`` exactly. The two exceptions,
+# a ``{{`` left open across blocks and line breaks other than "\n" (which
+# ``splitlines`` honours but block splitting does not), fall back to a full
+# pass rather than risk a divergent result.
+LINE_RE = re.compile(r"[^\n]*\n|[^\n]+\Z")
+OTHER_LINE_BREAK_RE = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+CACHE_VERSION = 1
+
+
+def split_blocks(text: str) -> list[tuple[int, str]]:
+    """``(start offset, block text)`` for each skeleton block, in order."""
+    blocks: list[tuple[int, str]] = []
+    block_start = 0
+    for match in LINE_RE.finditer(text):
+        line = match.group(0).rstrip("\n")
+        opens = SEED_BLOCK_END_RE.match(line) or SEED_BLOCK_START_RE.match(line)
+        if opens and match.start() > block_start:
+            blocks.append((block_start, text[block_start:match.start()]))
+            block_start = match.start()
+    blocks.append((block_start, text[block_start:]))
+    return blocks
+
+
+def block_facts(block: str) -> dict:
+    return {
+        "slots": slot_names(block),
+        "open_slot": "{{" in SLOT_RE.sub("", block),
+        "comments": "<!--" in block,
+        "trailer": harness_trailer(block),
+        "instructions": count_instructions(block),
+        "blocks": [name for name, pattern, _ in REQUIRED_BLOCKS if pattern.search(block)],
+        "seed_lines": seed_lines(block),
+        "summary_tokens": [t for t in SUMMARY_TOKENS if t in block],
+    }
+
+
+class BlockCache:
+    """Per-block facts keyed by the SHA-256 of the block text."""
+
+    def __init__(self, entries: dict[str, dict] | None = None) -> None:
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, path: Path) -> BlockCache:
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls()
+        if not isinstance(payload, dict) or payload.get("version") != CACHE_VERSION:
+            return cls()
+        return cls(payload.get("blocks") or {})
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": CACHE_VERSION, "blocks": self.entries}
+        path.write_text(json.dumps(payload, sort_keys=True) + "\n", encoding="utf-8")
+
+    def lookup(self, block: str) -> tuple[str, dict, bool]:
+        """Return ``(digest, facts, cached)``, linting the block on a miss."""
+        digest = hashlib.sha256(block.encode("utf-8")).hexdigest()
+        facts = self.entries.get(digest)
+        if facts is not None:
+            return digest, facts, True
+        facts = block_facts(block)
+        self.entries[digest] = facts
+        return digest, facts, False
+
+    def retain(self, digests: set[str]) -> None:
+        """Drop blocks no longer in the prompt so a long session stays bounded."""
+        self.entries = {d: f for d, f in self.entries.items() if d in digests}
+
+
+def evaluate_incremental(text: str, executor: str,
+                         cache: BlockCache) -> tuple[dict, list[dict]]:
+    """``evaluate`` built from cached block facts.
+
+    Returns the result and one event per block that had to be re-linted.
+    """
+    if OTHER_LINE_BREAK_RE.search(text):
+        return evaluate(text, executor), []
+
+    relinted: list[dict] = []
+    merged: list[dict] = []
+    digests: set[str] = set()
+    line = 1
+    previous = 0
+    for start, block in split_blocks(text):
+        line += text.count("\n", previous, start)
+        previous = start
+        digest, facts, cached = cache.lookup(block)
+        digests.add(digest)
+        merged.append(facts)
+        if not cached:
+            relinted.append({
+                "index": len(merged) - 1,
+                "line": line,
+                "hash": digest[:12],
+                "instructions": facts["instructions"],
+                "slots": facts["slots"],
+                "comments": facts["comments"],
+            })
+    cache.retain(digests)
+
+    if any(f["open_slot"] for f in merged):
+        slots = slot_names(text)
+    else:
+        slots = [name for f in merged for name in f["slots"]]
+    seed = "\n".join(line for f in merged for line in f["seed_lines"])
+    result = summarize({
+        "slots": slots,
+        "comments": any(f["comments"] for f in merged),
+        # Only the final block can end the prompt, so only it can carry debris.
+        "trailer": merged[-1]["trailer"],
+        "instructions": sum(f["instructions"] for f in merged),
+        "blocks": [name for name, _, _ in REQUIRED_BLOCKS
+                   if any(name in f["blocks"] for f in merged)],
+        "floating": floating_magnitudes(seed),
+        "summary_tokens": [t for t in SUMMARY_TOKENS
+                           if any(t in f["summary_tokens"] for f in merged)],
+    }, executor)
+    return result, relinted
+
+
+def watch(path: Path, executor: str, cache: BlockCache, *, interval: float,
+          cache_path: Path | None = None, out=None, max_passes: int | None = None) -> int:
+    """Re-lint ``path`` on every change, streaming JSON lines to ``out``.
+
+    Each pass emits a ``block`` event per re-linted block, then one ``result``
+    event carrying the full ``evaluate`` payload.
+    """
+    out = out or sys.stdout
+    seen: tuple[int, int] | None = None
+    passes = 0
+    while max_passes is None or passes < max_passes:
+        try:
+            stat = path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature != seen:
+                text = path.read_text(encoding="utf-8")
+        except OSError as exc:
+            # Editors that save by rename briefly leave no file behind.
+            if seen is not None:
+                print(json.dumps({"event": "error", "file": str(path), "detail": str(exc)}),
+                      file=out, flush=True)
+                seen = None
+            time.sleep(interval)
+            continue
+        if signature != seen:
+            seen = signature
+            passes += 1
+            result, relinted = evaluate_incremental(text, executor, cache)
+            for event in relinted:
+                print(json.dumps({"event": "block", **event}), file=out)
+            print(json.dumps({"event": "result", "file": str(path),
+                              "relinted": len(relinted), **result}), file=out, flush=True)
+            if cache_path is not None:
+                cache.save(cache_path)
+            if max_passes is not None and passes >= max_passes:
+                break
+        time.sleep(interval)
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
     parser.add_argument("file", help="Assembled prompt markdown file")
@@ -208,16 +412,40 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--json", action="store_true", help="Emit JSON")
     parser.add_argument("--strict", action="store_true",
                         help="Treat warnings as failures")
+    parser.add_argument("--watch", action="store_true",
+                        help="Re-lint on every save, streaming JSON lines, until interrupted")
+    parser.add_argument("--interval", type=float, default=0.5,
+                        help="Seconds between change checks in --watch (default: 0.5)")
+    parser.add_argument("--cache", type=Path, default=None,
+                        help="Persist per-block lint results here between runs")
     args = parser.parse_args(argv)
 
     path = Path(args.file)
+    if args.interval <= 0:
+        parser.error("--interval must be positive")
+    cache = BlockCache.load(args.cache) if args.cache else BlockCache()
+
+    if args.watch:
+        if not path.is_file():
+            print(f"error: cannot read {path}: no such file", file=sys.stderr)
+            return 2
+        try:
+            return watch(path, args.executor, cache, interval=args.interval,
+                         cache_path=args.cache)
+        except KeyboardInterrupt:
+            return 0
+
     try:
         text = path.read_text(encoding="utf-8")
     except OSError as exc:
         print(f"error: cannot read {path}: {exc}", file=sys.stderr)
         return 2
 
-    result = evaluate(text, executor=args.executor)
+    if args.cache:
+        result, _ = evaluate_incremental(text, args.executor, cache)
+        cache.save(args.cache)
+    else:
+        result = evaluate(text, executor=args.executor)
     result["file"] = str(path)
 
     if args.json:
@@ -20,6 +20,7 @@ look at the page to fill in a verdict; a liveness check here would only tempt a
 from __future__ import annotations
 
 import argparse
+import bisect
 import json
 import re
 import sys
@@ -59,6 +60,26 @@ def line_of(text: str, offset: int) -> int:
     return text.count("\n", 0, offset) + 1
 
 
+def line_starts(text: str) -> list[int]:
+    """Offset at which each line begins, for repeated line lookups.
+
+    ``line_of`` rescans the document from the top on every call; executor
+    reports run to hundreds of citations over 100+ KB, so extraction builds
+    this table once and bisects into it instead.
+    """
+    starts = [0]
+    index = text.find("\n")
+    while index != -1:
+        starts.append(index + 1)
+        index = text.find("\n", index + 1)
+    return starts
+
+
+def line_at(starts: list[int], offset: int) -> int:
+    """``line_of`` against a precomputed ``line_starts`` table."""
+    return bisect.bisect_right(starts, offset)
+
+
 def extract_citations(text: str) -> list[dict]:
     """Every citation in the report, in document order, as C1..Cn."""
     found: list[tuple[int, str, str]] = []
@@ -68,18 +89,25 @@ def extract_citations(text: str) -> list[dict]:
         linked_spans.append(match.span())
         found.append((match.start(), match.group("url"), match.group("text").strip()))
 
+    # Both scans run left to right and link spans never overlap, so one cursor
+    # walking the spans alongside the bare matches replaces a per-URL search.
+    span_index = 0
     for match in BARE_URL_RE.finditer(text):
-        if any(start <= match.start() < end for start, end in linked_spans):
+        start = match.start()
+        while span_index < len(linked_spans) and linked_spans[span_index][1] <= start:
+            span_index += 1
+        if span_index < len(linked_spans) and linked_spans[span_index][0] <= start:
             continue
-        found.append((match.start(), match.group(0).rstrip(").,;"), ""))
+        found.append((start, match.group(0).rstrip(").,;"), ""))
 
     found.sort(key=lambda item: item[0])
+    starts = line_starts(text)
     return [
         {
             "id": f"C{index}",
             "url": url,
             "anchor_text": anchor,
-            "line": line_of(text, offset),
+            "line": line_at(starts, offset),
             "offset": offset,
         }
         for index, (offset, url, anchor) in enumerate(found, start=1)
@@ -128,16 +156,26 @@ def extract_claims(text: str, citations: list[dict]) -> list[dict]:
     can actually check. Uncited prose is a different finding (an unsupported
     assertion), caught by the rubric pass rather than the citation sample.
     """
+    starts = line_starts(text)
+    # Sentences come back in document order and never overlap, so a merge-join
+    # against offset-sorted citations visits each citation once.
+    ordered = sorted(citations, key=lambda c: c["offset"])
+    cursor = 0
     claims = []
     for start, end, raw in sentences(text):
-        attached = [c["id"] for c in citations if start <= c["offset"] < end]
+        while cursor < len(ordered) and ordered[cursor]["offset"] < start:
+            cursor += 1
+        attached = []
+        while cursor < len(ordered) and ordered[cursor]["offset"] < end:
+            attached.append(ordered[cursor]["id"])
+            cursor += 1
         if not attached:
             continue
         body = raw.strip()
         claims.append({
             "id": f"Q{len(claims) + 1}",
             "text": body,
-            "line": line_of(text, start),
+            "line": line_at(starts, start),
             "quantitative": bool(MAGNITUDE_RE.search(body)),
             "attribution": bool(ATTRIBUTION_RE.search(body)),
             "citations": attached,
@@ -8,10 +8,16 @@ import datetime as dt
 import json
 import os
 import platform
+import queue
 import shutil
 import subprocess
+import sys
 import tempfile
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable, TextIO
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 MAC_PERM_SCRIPT = SCRIPT_DIR / "macos_permissions.swift"
@@ -28,6 +34,10 @@ TEST_PNG = (
     b"\xf8\xff\xff?\x00\x05\xfe\x02\xfeA\xad\x1c\x1c\x00\x00\x00\x00IEND"
     b"\xaeB`\x82"
 )
+DEFAULT_SESSION_BUFFER = 8
+SESSION_KEYS = {
+    "id", "path", "region", "window_id", "active_window", "display", "repeat", "interval",
+}
 
 
 def parse_region(value: str) -> tuple[int, int, int, int]:
@@ -366,57 +376,274 @@ def capture_macos(
     run(cmd)
 
 
-def capture_linux(args: argparse.Namespace, output: Path) -> None:
-    scrot = shutil.which("scrot")
-    gnome = shutil.which("gnome-screenshot")
-    imagemagick = shutil.which("import")
-    xdotool = shutil.which("xdotool")
+@dataclass(frozen=True)
+class LinuxTools:
+    """Resolved paths of the Linux capture tools; probe once, reuse per shot."""
+
+    scrot: str | None
+    gnome: str | None
+    imagemagick: str | None
+    xdotool: str | None
+
+    @classmethod
+    def detect(cls) -> LinuxTools:
+        return cls(
+            scrot=shutil.which("scrot"),
+            gnome=shutil.which("gnome-screenshot"),
+            imagemagick=shutil.which("import"),
+            xdotool=shutil.which("xdotool"),
+        )
+
+
+def capture_linux(
+    args: argparse.Namespace, output: Path, tools: LinuxTools | None = None
+) -> None:
+    tools = tools or LinuxTools.detect()
+    scrot, gnome, imagemagick, xdotool = tools.scrot, tools.gnome, tools.imagemagick, tools.xdotool
 
     if args.region is not None:
         x, y, w, h = args.region
         if scrot:
-            run(["scrot", "-a", f"{x},{y},{w},{h}", str(output)])
+            run([scrot, "-a", f"{x},{y},{w},{h}", str(output)])
             return
         if imagemagick:
             geometry = f"{w}x{h}+{x}+{y}"
-            run(["import", "-window", "root", "-crop", geometry, str(output)])
+            run([imagemagick, "-window", "root", "-crop", geometry, str(output)])
             return
         raise SystemExit("region capture requires scrot or ImageMagick (import)")
 
     if args.window_id is not None:
         if imagemagick:
-            run(["import", "-window", str(args.window_id), str(output)])
+            run([imagemagick, "-window", str(args.window_id), str(output)])
             return
         raise SystemExit("window-id capture requires ImageMagick (import)")
 
     if args.active_window:
         if scrot:
-            run(["scrot", "-u", str(output)])
+            run([scrot, "-u", str(output)])
             return
         if gnome:
-            run(["gnome-screenshot", "-w", "-f", str(output)])
+            run([gnome, "-w", "-f", str(output)])
             return
         if imagemagick and xdotool:
             win_id = (
-                subprocess.check_output(["xdotool", "getactivewindow"], text=True)
+                subprocess.check_output([xdotool, "getactivewindow"], text=True)
                 .strip()
             )
-            run(["import", "-window", win_id, str(output)])
+            run([imagemagick, "-window", win_id, str(output)])
             return
         raise SystemExit("active-window capture requires scrot, gnome-screenshot, or import+xdotool")
 
     if scrot:
-        run(["scrot", str(output)])
+        run([scrot, str(output)])
         return
     if gnome:
-        run(["gnome-screenshot", "-f", str(output)])
+        run([gnome, "-f", str(output)])
         return
     if imagemagick:
-        run(["import", "-window", "root", str(output)])
+        run([imagemagick, "-window", "root", str(output)])
         return
     raise SystemExit("no supported screenshot tool found (scrot, gnome-screenshot, or import)")
 
 
+# --- capture sessions -------------------------------------------------------
+#
+# A session reads one JSON capture request per stdin line and writes one JSON
+# result per frame to stdout. Platform checks, permission probes, and tool
+# lookups happen once, when the session starts. Frames are captured into a
+# local staging directory. A writer thread moves them to their destinations
+# through a bounded queue, so a slow destination delays the capture loop only
+# once the buffer is full. Interval frames stay on schedule while earlier
+# frames are still being written.
+
+Backend = Callable[[argparse.Namespace, Path], None]
+
+
+def resolve_session_backend(args: argparse.Namespace, system: str, test_mode: bool) -> Backend:
+    if test_mode:
+        return lambda _request, path: write_test_png(path)
+    if system == "Darwin":
+        ensure_macos_permissions()
+
+        def capture_macos_frame(request: argparse.Namespace, path: Path) -> None:
+            if request.active_window:
+                # Resolving the frontmost window costs a swift run per frame;
+                # look the id up once with --list-windows and pass window_id.
+                raise SystemExit("macOS sessions take window_id, not active_window")
+            capture_macos(request, path, window_id=request.window_id, display=request.display)
+
+        return capture_macos_frame
+    if system == "Linux":
+        tools = LinuxTools.detect()
+        if not (tools.scrot or tools.gnome or tools.imagemagick):
+            raise SystemExit(
+                "no supported screenshot tool found (scrot, gnome-screenshot, or import)"
+            )
+
+        def capture_linux_frame(request: argparse.Namespace, path: Path) -> None:
+            if request.display is not None:
+                raise SystemExit("display selection is supported on macOS only")
+            capture_linux(request, path, tools)
+
+        return capture_linux_frame
+    if system == "Windows":
+        raise SystemExit(
+            "Windows support lives in scripts/take_screenshot.ps1; run it with PowerShell"
+        )
+    raise SystemExit(f"unsupported platform: {system}")
+
+
+def parse_session_request(line: str, fmt: str) -> dict:
+    """Validate one JSONL capture request; raise ValueError with the reason."""
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"invalid JSON: {exc.msg}") from exc
+    if not isinstance(request, dict):
+        raise ValueError("request must be a JSON object")
+    unknown = set(request) - SESSION_KEYS
+    if unknown:
+        raise ValueError(f"unknown keys: {', '.join(sorted(unknown))}")
+
+    region = request.get("region")
+    if region is not None:
+        if isinstance(region, list):
+            region = ",".join(str(part) for part in region)
+        try:
+            region = parse_region(str(region))
+        except argparse.ArgumentTypeError as exc:
+            raise ValueError(str(exc)) from exc
+    window_id = request.get("window_id")
+    display = request.get("display")
+    for key, value in (("window_id", window_id), ("display", display)):
+        if value is not None and (not isinstance(value, int) or isinstance(value, bool)):
+            raise ValueError(f"{key} must be an integer")
+    active_window = bool(request.get("active_window", False))
+    targets = sum([region is not None, window_id is not None, active_window])
+    if targets > 1:
+        raise ValueError("choose one of region, window_id, or active_window")
+
+    repeat = request.get("repeat", 1)
+    interval = request.get("interval", 0)
+    if not isinstance(repeat, int) or isinstance(repeat, bool) or repeat < 1:
+        raise ValueError("repeat must be a positive integer")
+    if not isinstance(interval, (int, float)) or isinstance(interval, bool) or interval < 0:
+        raise ValueError("interval must be a non-negative number")
+
+    return {
+        "id": request.get("id"),
+        "path": request.get("path"),
+        "repeat": repeat,
+        "interval": float(interval),
+        "capture": argparse.Namespace(
+            format=fmt,
+            interactive=False,
+            region=region,
+            window_id=window_id,
+            display=display,
+            active_window=active_window,
+        ),
+    }
+
+
+class FrameWriter:
+    """Move staged frames to their destinations on a thread, in order."""
+
+    def __init__(self, out: TextIO, buffer: int) -> None:
+        self.out = out
+        self.failures = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=buffer)
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def submit(self, result: dict, staged: Path | None = None, final: Path | None = None) -> None:
+        # Blocks once `buffer` frames are pending: that is the backpressure.
+        self._queue.put((result, staged, final))
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _drain(self) -> None:
+        while (item := self._queue.get()) is not None:
+            result, staged, final = item
+            if staged is not None and final is not None:
+                try:
+                    ensure_parent(final)
+                    shutil.move(str(staged), str(final))
+                    result = {**result, "path": str(final), "status": "ok"}
+                except OSError as exc:
+                    result = {**result, "status": "error", "detail": str(exc)}
+            if result.get("status") != "ok":
+                self.failures += 1
+            print(json.dumps(result), file=self.out, flush=True)
+
+
+def names_directory(requested: str) -> bool:
+    """True if resolve_output_path would generate a filename inside `requested`."""
+    return requested.endswith(("/", "\\")) or Path(requested).expanduser().is_dir()
+
+
+def session_frame_path(
+    args: argparse.Namespace, system: str, request: dict, frame: int, seq: int
+) -> Path:
+    requested = request["path"]
+    if requested and not names_directory(requested):
+        base = resolve_output_path(requested, args.mode, args.format, system)
+        if request["repeat"] == 1:
+            return base
+        return base.with_name(f"{base.stem}-f{frame:04d}{base.suffix}")
+    # Generated names carry a sequence number: several frames share one second.
+    base = resolve_output_path(requested or args.path, args.mode, args.format, system)
+    return base.with_name(f"{base.stem}-{seq:04d}{base.suffix}")
+
+
+def run_session(
+    args: argparse.Namespace,
+    system: str,
+    test_mode: bool,
+    stream: TextIO | None = None,
+    out: TextIO | None = None,
+) -> int:
+    stream = stream or sys.stdin
+    backend = resolve_session_backend(args, system, test_mode)
+    writer = FrameWriter(out or sys.stdout, args.buffer)
+    staging = Path(tempfile.mkdtemp(prefix="codex-shot-session-"))
+    seq = 0
+    try:
+        for lineno, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                request = parse_session_request(line, args.format)
+            except ValueError as exc:
+                writer.submit({"id": lineno, "status": "error", "detail": str(exc)})
+                continue
+            request_id = request["id"] if request["id"] is not None else lineno
+            started = time.monotonic()
+            for frame in range(request["repeat"]):
+                # Schedule against the first frame so slow captures never drift.
+                delay = started + frame * request["interval"] - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                seq += 1
+                result = {"id": request_id, "frame": frame}
+                staged = staging / f"{seq:06d}.{args.format}"
+                try:
+                    final = session_frame_path(args, system, request, frame, seq)
+                    backend(request["capture"], staged)
+                except (SystemExit, Exception) as exc:
+                    # One failed frame (a tool exiting non-zero, an unwritable
+                    # path) is reported and the session carries on.
+                    writer.submit({**result, "status": "error", "detail": str(exc) or type(exc).__name__})
+                    continue
+                writer.submit(result, staged, final)
+    finally:
+        writer.close()
+        shutil.rmtree(staging, ignore_errors=True)
+    return 1 if writer.failures else 0
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -467,8 +694,30 @@ def main() -> None:
         action="store_true",
         help="use interactive selection where the OS tool supports it",
     )
+    parser.add_argument(
+        "--session",
+        action="store_true",
+        help="read JSONL capture requests from stdin and emit one JSON result per frame",
+    )
+    parser.add_argument(
+        "--buffer",
+        type=int,
+        default=DEFAULT_SESSION_BUFFER,
+        help="--session: frames staged before capture waits on writes "
+        f"(default: {DEFAULT_SESSION_BUFFER})",
+    )
     args = parser.parse_args()
 
+    if args.session and (
+        args.region or args.window_id is not None or args.active_window
+        or args.app or args.window_name or args.list_windows or args.interactive
+    ):
+        raise SystemExit(
+            "--session takes capture targets per request; only --path, --mode, and --format apply"
+        )
+    if args.buffer < 1:
+        raise SystemExit("--buffer must be at least 1")
+
     if args.region and args.window_id is not None:
         raise SystemExit("choose either --region or --window-id, not both")
     if args.region and args.active_window:
@@ -498,6 +747,8 @@ def main() -> None:
         override = test_platform_override()
         if override:
             system = override
+    if args.session:
+        raise SystemExit(run_session(args, system, test_mode))
     window_ids: list[int] = []
     display_ids: list[int] = []
 
@@ -4,18 +4,115 @@ Skill Packager - Creates a distributable .skill file from a skill folder.
 
 Usage:
     package_skill.py <path/to/skill-folder> [output-directory]
+    package_skill.py --catalog <path/to/skills-root> [output-directory] [--jobs N] [--force]
 
 Examples:
     package_skill.py skills/my-skill
     package_skill.py skills/my-skill ./dist
+    package_skill.py --catalog skills ./dist
+
+Archives are reproducible: entries are sorted, timestamps and permissions are
+fixed, and the skill-standardizer ignore rules drop caches and editor litter,
+so the same skill content always yields the same bytes. Catalog mode packages
+every skill in parallel, skips skills whose content hash matches the archive
+already recorded in the output directory's index, and writes a SHA256SUMS file
+covering every archive.
 """
 
+import argparse
+import hashlib
+import json
+import os
 import sys
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from quick_validate import validate_skill
 
+_STANDARDIZER_DIR = str(
+    Path(__file__).resolve().parent.parent.parent / "skill-standardizer" / "scripts"
+)
+if _STANDARDIZER_DIR not in sys.path:
+    sys.path.insert(0, _STANDARDIZER_DIR)
+
+try:
+    from skill_standardizer_lib import IGNORE_FILE_SUFFIXES, IGNORE_NAMES  # noqa: E402
+except ImportError:
+    # skill-creator can be installed without skill-standardizer beside it; keep
+    # packaging working with a copy of its ignore rules (a test pins the two).
+    IGNORE_NAMES = {".DS_Store", "__pycache__", ".git", ".pytest_cache"}
+    IGNORE_FILE_SUFFIXES = {".pyc", ".pyo"}
+
+# 1980-01-01 is the earliest timestamp a zip entry can carry.
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+COMPRESS_LEVEL = 9
+# Part of every content hash, so a change to the archive layout invalidates
+# archives built by an older packager.
+ARCHIVE_FORMAT = 1
+INDEX_NAME = "catalog-index.json"
+CHECKSUMS_NAME = "SHA256SUMS"
+
+
+def collect_files(skill_path):
+    """Files to archive as sorted (arcname, path) pairs.
+
+    Hidden and ignored directories are pruned and ignored file names and
+    suffixes are skipped, matching skill_standardizer_lib.hash_directory.
+    """
+    skill_path = Path(skill_path)
+    entries = []
+    for current, dirnames, filenames in os.walk(skill_path):
+        dirnames[:] = [
+            name for name in dirnames
+            if name not in IGNORE_NAMES and not name.startswith(".")
+        ]
+        for name in filenames:
+            if name in IGNORE_NAMES or Path(name).suffix in IGNORE_FILE_SUFFIXES:
+                continue
+            file_path = Path(current) / name
+            if not file_path.is_file():
+                continue
+            arcname = file_path.relative_to(skill_path.parent).as_posix()
+            entries.append((arcname, file_path))
+    entries.sort(key=lambda entry: entry[0])
+    return entries
+
+
+def _entry_mode(file_path):
+    return 0o755 if os.access(file_path, os.X_OK) else 0o644
+
+
+def content_hash(entries):
+    """Hash of everything that determines the archive bytes."""
+    digest = hashlib.sha256(f"skill-archive-v{ARCHIVE_FORMAT}\n".encode("utf-8"))
+    for arcname, file_path in entries:
+        digest.update(f"{arcname}\0{_entry_mode(file_path):o}\0".encode("utf-8"))
+        digest.update(hashlib.sha256(file_path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_archive(entries, destination):
+    """Write a deterministic zip to destination, replacing it atomically."""
+    destination = Path(destination)
+    partial = destination.with_name(destination.name + ".partial")
+    with zipfile.ZipFile(partial, "w") as archive:
+        for arcname, file_path in entries:
+            info = zipfile.ZipInfo(arcname, date_time=FIXED_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 3
+            info.external_attr = (0o100000 | _entry_mode(file_path)) << 16
+            archive.writestr(info, file_path.read_bytes(), compresslevel=COMPRESS_LEVEL)
+    os.replace(partial, destination)
+
 
 def package_skill(skill_path, output_dir=None):
     """Package a skill folder into a .skill file."""
@@ -47,13 +144,10 @@ def package_skill(skill_path, output_dir=None):
     skill_filename = output_path / f"{skill_path.name}.skill"
 
     try:
-        with zipfile.ZipFile(skill_filename, "w", zipfile.ZIP_DEFLATED) as archive:
-            for file_path in skill_path.rglob("*"):
-                if not file_path.is_file():
-                    continue
-                arcname = file_path.relative_to(skill_path.parent)
-                archive.write(file_path, arcname)
-                print(f"  Added: {arcname}")
+        entries = collect_files(skill_path)
+        write_archive(entries, skill_filename)
+        for arcname, _ in entries:
+            print(f"  Added: {arcname}")
 
         print(f"\n[OK] Successfully packaged skill to: {skill_filename}")
         return skill_filename
@@ -62,23 +156,143 @@ def package_skill(skill_path, output_dir=None):
         return None
 
 
+def discover_skills(skills_root):
+    """Skill folders under skills_root, skipping `_`/`.` support directories."""
+    return [
+        child
+        for child in sorted(Path(skills_root).iterdir(), key=lambda p: p.name)
+        if child.is_dir()
+        and not child.name.startswith((".", "_"))
+        and child.name not in IGNORE_NAMES
+        and (child / "SKILL.md").is_file()
+    ]
+
+
+def load_index(output_path):
+    try:
+        payload = json.loads((output_path / INDEX_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    skills = payload.get("skills") if isinstance(payload, dict) else None
+    return skills if isinstance(skills, dict) else {}
+
+
+def _package_catalog_entry(skill_path, output_path, previous, force):
+    name = skill_path.name
+    archive = output_path / f"{name}.skill"
+    entries = collect_files(skill_path)
+    digest = content_hash(entries)
+
+    if (
+        not force
+        and previous.get("content_hash") == digest
+        and archive.is_file()
+        and file_sha256(archive) == previous.get("sha256")
+    ):
+        return name, "unchanged", dict(previous), None
+
+    valid, message = validate_skill(skill_path)
+    if not valid:
+        return name, "invalid", None, message
+    write_archive(entries, archive)
+    record = {
+        "archive": archive.name,
+        "content_hash": digest,
+        "files": len(entries),
+        "sha256": file_sha256(archive),
+    }
+    return name, "packaged", record, None
+
+
+def package_catalog(skills_root, output_dir=None, jobs=None, force=False):
+    """Package every skill under skills_root; returns True when all succeed."""
+    skills_root = Path(skills_root).resolve()
+    if not skills_root.is_dir():
+        print(f"[ERROR] Skills root not found: {skills_root}")
+        return False
+
+    output_path = Path(output_dir).resolve() if output_dir else Path.cwd()
+    output_path.mkdir(parents=True, exist_ok=True)
+    previous = load_index(output_path)
+    skills = discover_skills(skills_root)
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        futures = [
+            pool.submit(
+                _package_catalog_entry,
+                skill_path,
+                output_path,
+                previous.get(skill_path.name, {}),
+                force,
+            )
+            for skill_path in skills
+        ]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as exc:  # one unreadable skill must not sink the catalog
+                results.append((None, "error", None, str(exc)))
+
+    index = {}
+    ok = True
+    counts = {"packaged": 0, "unchanged": 0}
+    for skill_path, (name, status, record, message) in zip(skills, results):
+        name = name or skill_path.name
+        if record is None:
+            ok = False
+            print(f"[ERROR] {name}: {message}")
+            continue
+        counts[status] += 1
+        index[name] = record
+        print(f"[{'OK' if status == 'packaged' else 'SKIP'}] {name}: {status}")
+
+    (output_path / INDEX_NAME).write_text(
+        json.dumps({"format": ARCHIVE_FORMAT, "skills": index}, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+    (output_path / CHECKSUMS_NAME).write_text(
+        "".join(f"{record['sha256']}  {record['archive']}\n" for _, record in sorted(index.items())),
+        encoding="utf-8",
+    )
+    print(
+        f"\n[INFO] {counts['packaged']} packaged, {counts['unchanged']} unchanged, "
+        f"{len(skills) - len(index)} failed; index at {output_path / INDEX_NAME}"
+    )
+    return ok
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: package_skill.py <path/to/skill-folder> [output-directory]")
-        print("\nExample:")
-        print("  package_skill.py skills/my-skill")
-        print("  package_skill.py skills/my-skill ./dist")
-        sys.exit(1)
-
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
-
-    print(f"Packaging skill: {skill_path}")
-    if output_dir:
-        print(f"Output directory: {output_dir}")
+    parser = argparse.ArgumentParser(
+        description="Package a skill folder (or a whole catalog) into .skill archives."
+    )
+    parser.add_argument("path", help="Skill folder, or the skills root with --catalog")
+    parser.add_argument("output_dir", nargs="?", help="Output directory (default: cwd)")
+    parser.add_argument("--catalog", action="store_true",
+                        help="Package every skill under PATH and write a checksum index")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Parallel workers for --catalog (default: CPU count)")
+    parser.add_argument("--force", action="store_true",
+                        help="Rebuild catalog archives even when their content is unchanged")
+    args = parser.parse_args()
+
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    if args.catalog:
+        print(f"Packaging catalog: {args.path}")
+        if args.output_dir:
+            print(f"Output directory: {args.output_dir}")
+        print()
+        ok = package_catalog(args.path, args.output_dir, jobs=args.jobs, force=args.force)
+        sys.exit(0 if ok else 1)
+
+    print(f"Packaging skill: {args.path}")
+    if args.output_dir:
+        print(f"Output directory: {args.output_dir}")
     print()
 
-    result = package_skill(skill_path, output_dir)
+    result = package_skill(args.path, args.output_dir)
     sys.exit(0 if result else 1)
 
 
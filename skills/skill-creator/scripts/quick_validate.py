@@ -5,14 +5,17 @@ if command -v python >/dev/null 2>&1; then
 fi
 exec python3 "$0" "$@"
 ":"""
-"""Quick validation script for skills (minimal, portable)."""
+"""Quick validation script for skills (minimal, portable).
+
+PyYAML is imported on first use rather than at module load, so callers that
+only sometimes validate (the PreToolUse payload hook) pay for it only when
+they do.
+"""
 
 import re
 import sys
 from pathlib import Path
 
-import yaml
-
 MAX_SKILL_NAME_LENGTH = 64
 MAX_DESCRIPTION_LENGTH = 1024
 MAX_COMPATIBILITY_LENGTH = 500
@@ -51,11 +54,21 @@ def validate_skill(skill_path):
     if not skill_md.exists():
         return False, "SKILL.md not found"
 
-    content = skill_md.read_text(encoding="utf-8")
+    return validate_skill_text(skill_md.read_text(encoding="utf-8"))
+
+
+def validate_skill_text(content: str):
+    """Validate SKILL.md content without touching the filesystem.
+
+    Returns the same (valid, message) pair as validate_skill. Raises ImportError
+    if the content has frontmatter but PyYAML is not installed.
+    """
     match = _extract_frontmatter(content)
     if not match:
         return False, "Invalid or missing YAML frontmatter"
 
+    import yaml
+
     frontmatter_text = match.group(1)
     try:
         frontmatter = yaml.safe_load(frontmatter_text)
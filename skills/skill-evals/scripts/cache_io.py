@@ -0,0 +1,38 @@
+"""Best-effort atomic writes for the repo's local `.cache/` files.
+
+Every cache here is an optimisation whose loss costs recomputation, never
+correctness, so a write that fails must not fail the tool that asked for it.
+A reader must also never see a half-written file: data goes to a sibling temp
+file named with the writer's pid (so concurrent writers cannot collide) and is
+moved into place with `os.replace`. On any OSError the temp file is removed and
+the call reports False.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+def write_atomic(path: str | os.PathLike, data: bytes | str) -> bool:
+    """Replace `path` with `data` (str is written as UTF-8); False if it could not."""
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(data.encode("utf-8") if isinstance(data, str) else data)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def write_json_atomic(path: str | os.PathLike, payload: Any, **dumps_options: Any) -> bool:
+    """`write_atomic` for a JSON document; `dumps_options` go to `json.dumps`."""
+    return write_atomic(path, json.dumps(payload, **dumps_options) + "\n")
@@ -0,0 +1,215 @@
+#!/bin/sh
+""":"
+if command -v python >/dev/null 2>&1; then
+    exec python "$0" "$@"
+fi
+exec python3 "$0" "$@"
+":"""
+"""Catalog-wide routing-collision matrix over the trigger-eval TF-IDF vectors.
+
+`run_trigger_evals.py` answers "does this phrase route to its owner?". This
+answers the catalog-level question behind it: which skills' descriptions crowd
+each other lexically? It takes the vectors `build_skill_index` already builds
+(name + description, corpus-wide IDF, L2-normalised), computes every pairwise
+cosine through a token inverted index, and keeps a sparse top-k neighbour list
+per skill. Pairs at or above `--threshold` are reported as collisions with the
+shared tokens that drive them, i.e. the words to rewrite.
+
+The result is cached in `.cache/routing-matrix.json` against a hash of every
+SKILL.md plus the parameters, so an unchanged catalog is a file read.
+
+Usage:
+    routing_matrix.py                       # collisions + nearest neighbours
+    routing_matrix.py --json --top-k 10     # machine-readable
+    routing_matrix.py --check               # exit 1 if any pair collides
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from cache_io import write_json_atomic  # noqa: E402
+from run_trigger_evals import build_skill_index  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_CACHE = REPO_ROOT / ".cache" / "routing-matrix.json"
+DEFAULT_TOP_K = 5
+# Cosine at or above this between two skills' name+description vectors is a
+# collision. The mean pair in the catalog sits near 0.03; only a handful of
+# genuinely overlapping pairs clear 0.30.
+COLLISION_THRESHOLD = 0.30
+SHARED_TOKENS = 5
+# Bump when the scoring inputs change so old cache entries stop matching.
+MATRIX_VERSION = 1
+
+
+def catalog_hash(skills_root: Path, top_k: int, threshold: float) -> str:
+    """Hash of every SKILL.md's bytes plus the matrix parameters."""
+    digest = hashlib.sha256(f"v{MATRIX_VERSION}\0{top_k}\0{threshold!r}\0".encode())
+    for skill_md in sorted(skills_root.glob("*/SKILL.md")):
+        digest.update(skill_md.parent.name.encode("utf-8") + b"\0")
+        digest.update(hashlib.sha256(skill_md.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def similarity_rows(skills: dict[str, dict[str, Any]]) -> dict[str, dict[str, float]]:
+    """Sparse pairwise cosine: for each skill, every other skill sharing a token.
+
+    Vectors are L2-normalised, so the dot product is the cosine. Walking a token
+    -> postings index only touches pairs that share at least one token, instead
+    of all skills x skills.
+    """
+    postings: dict[str, list[tuple[str, float]]] = defaultdict(list)
+    for skill in sorted(skills):
+        for token, weight in skills[skill]["vector"].items():
+            postings[token].append((skill, weight))
+
+    rows: dict[str, dict[str, float]] = {}
+    for skill in sorted(skills):
+        acc: dict[str, float] = defaultdict(float)
+        for token, weight in skills[skill]["vector"].items():
+            for other, other_weight in postings[token]:
+                if other != skill:
+                    acc[other] += weight * other_weight
+        rows[skill] = dict(acc)
+    return rows
+
+
+def shared_tokens(a: dict[str, float], b: dict[str, float], limit: int = SHARED_TOKENS) -> list[str]:
+    """Tokens contributing most to the cosine of two vectors, largest first."""
+    common = [(a[t] * b[t], t) for t in a.keys() & b.keys()]
+    return [t for _, t in sorted(common, key=lambda item: (-item[0], item[1]))[:limit]]
+
+
+def build_matrix(
+    skills: dict[str, dict[str, Any]],
+    top_k: int = DEFAULT_TOP_K,
+    threshold: float = COLLISION_THRESHOLD,
+) -> dict[str, Any]:
+    """Top-k neighbours per skill and every pair at or above `threshold`."""
+    rows = similarity_rows(skills)
+    neighbours = {}
+    for skill, row in rows.items():
+        # Ties break by name so the report is stable.
+        best = heapq.nsmallest(top_k, row.items(), key=lambda item: (-item[1], item[0]))
+        neighbours[skill] = [
+            {"skill": other, "similarity": round(sim, 4)} for other, sim in best if sim > 0
+        ]
+
+    collisions = []
+    for skill, row in rows.items():
+        for other, sim in row.items():
+            if skill < other and sim >= threshold:
+                collisions.append(
+                    {
+                        "skills": [skill, other],
+                        "similarity": round(sim, 4),
+                        "shared_tokens": shared_tokens(skills[skill]["vector"], skills[other]["vector"]),
+                    }
+                )
+    collisions.sort(key=lambda item: (-item["similarity"], item["skills"]))
+
+    pairs = sum(len(row) for row in rows.values()) // 2
+    return {
+        "summary": {
+            "skills": len(skills),
+            "pairs_sharing_tokens": pairs,
+            "top_k": top_k,
+            "threshold": threshold,
+            "collisions": len(collisions),
+        },
+        "collisions": collisions,
+        "neighbours": neighbours,
+    }
+
+
+def load_cached(path: Path, key: str) -> dict[str, Any] | None:
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if isinstance(entry, dict) and entry.get("catalog_hash") == key and isinstance(entry.get("matrix"), dict):
+        return entry["matrix"]
+    return None
+
+
+def store_cached(path: Path, key: str, matrix: dict[str, Any]) -> None:
+    # Unwritten, the next run rebuilds the pair index from the catalog again.
+    write_json_atomic(path, {"catalog_hash": key, "matrix": matrix})
+
+
+def routing_matrix(
+    skills_root: Path,
+    top_k: int = DEFAULT_TOP_K,
+    threshold: float = COLLISION_THRESHOLD,
+    cache_path: Path | None = DEFAULT_CACHE,
+) -> tuple[dict[str, Any], bool]:
+    """Return (matrix, from_cache) for the catalog under `skills_root`."""
+    key = catalog_hash(skills_root, top_k, threshold)
+    if cache_path is not None:
+        cached = load_cached(cache_path, key)
+        if cached is not None:
+            return cached, True
+    matrix = build_matrix(build_skill_index(skills_root, None), top_k, threshold)
+    matrix["catalog_hash"] = key
+    if cache_path is not None:
+        store_cached(cache_path, key, matrix)
+    return matrix, False
+
+
+def render_text(matrix: dict[str, Any]) -> str:
+    s = matrix["summary"]
+    lines = [
+        f"Routing matrix: {s['skills']} skills, {s['pairs_sharing_tokens']} pairs share a token",
+        f"  collisions (cosine >= {s['threshold']}): {s['collisions']}",
+    ]
+    for item in matrix["collisions"]:
+        a, b = item["skills"]
+        lines.append(f"  {item['similarity']:.4f}  {a} <-> {b}  shared: {', '.join(item['shared_tokens'])}")
+    lines += ["", "Nearest neighbour per skill:"]
+    for skill, near in sorted(matrix["neighbours"].items()):
+        top = f"{near[0]['skill']} ({near[0]['similarity']:.4f})" if near else "-"
+        lines.append(f"  {skill:<32} {top}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--skills-root", default="skills", help="Path to skills directory (default: skills)")
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K, help=f"Neighbours kept per skill (default: {DEFAULT_TOP_K})")
+    parser.add_argument(
+        "--threshold", type=float, default=COLLISION_THRESHOLD,
+        help=f"Cosine at or above which a pair collides (default: {COLLISION_THRESHOLD})",
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON output")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if any pair collides")
+    parser.add_argument("--no-cache", action="store_true", help="Recompute even if the catalog is unchanged")
+    args = parser.parse_args()
+    if args.top_k < 1:
+        parser.error("--top-k must be at least 1")
+
+    skills_root = Path(args.skills_root)
+    if not skills_root.is_absolute():
+        skills_root = (REPO_ROOT / skills_root).resolve()
+    if not skills_root.is_dir():
+        print(f"Skills root not found: {skills_root}", file=sys.stderr)
+        return 1
+
+    matrix, _ = routing_matrix(
+        skills_root, args.top_k, args.threshold, cache_path=None if args.no_cache else DEFAULT_CACHE
+    )
+    if args.json:
+        print(json.dumps(matrix, indent=2))
+    else:
+        sys.stdout.write(render_text(matrix))
+    return 1 if args.check and matrix["collisions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
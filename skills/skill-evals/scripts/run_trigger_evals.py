@@ -16,14 +16,27 @@ prompt that should route to no skill is asserted against a floor.
 
 The `--from-triggers` mode is unchanged in contract: every declared trigger phrase
 must self-route to its owner without being tied or beaten by another skill.
+
+`--jobs N` shards cases (and declared-trigger owners) across N worker processes
+that each hold the same read-only skill index; shards are contiguous and merged
+in order, so the output is identical to a serial run. `--save-baseline` records,
+after a passing run only, a fingerprint of every catalog skill's description and
+declared triggers plus the cases that passed. `--skip-passed` skips a case only
+when no catalog skill changed since that baseline and the case passed in it
+under the same mode and `--skills` selection. IDF is corpus-wide and any skill
+may outrank a case's owner, so one changed description can move any case: a
+changed catalog skips nothing. Declared triggers are always re-checked.
 """
 
 import argparse
+import hashlib
 import json
 import math
 import re
 import sys
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -115,7 +128,8 @@ def _tfidf_vector(tokens: list[str], idf: dict[str, float]) -> dict[str, float]:
     if not tokens:
         return {}
     tf = Counter(tokens)
-    vec = {t: (1.0 + math.log(c)) * idf.get(t, _default_idf(idf)) for t, c in tf.items()}
+    default = _default_idf(idf)
+    vec = {t: (1.0 + math.log(c)) * idf.get(t, default) for t, c in tf.items()}
     norm = math.sqrt(sum(v * v for v in vec.values())) or 1.0
     return {t: v / norm for t, v in vec.items()}
 
@@ -126,20 +140,28 @@ def _default_idf(idf: dict[str, float]) -> float:
     return max(idf.values()) if idf else 1.0
 
 
-def build_skill_index(skills_root: Path, selected: set[str] | None) -> dict[str, dict[str, Any]]:
+def build_skill_index(
+    skills_root: Path,
+    selected: set[str] | None,
+    frontmatter_of=None,
+) -> dict[str, dict[str, Any]]:
     """Index skills into TF-IDF vectors.
 
     IDF is always computed over the *entire* catalog under `skills_root`, even when
     `selected` narrows the returned/scored set, so subset scores stay comparable to
     full-catalog scores. Each returned skill_data carries a shared `idf` reference
     so `score_trigger` can vectorize a prompt with the same weighting.
+
+    `frontmatter_of(skill_md)` lets an in-process caller that already parsed the
+    catalog supply each skill's frontmatter dict; it defaults to reading the file.
     """
+    frontmatter_of = frontmatter_of or parse_frontmatter
     corpus: dict[str, dict[str, Any]] = {}
     name_token_owners: dict[str, list[str]] = {}
 
     for skill_md in sorted(skills_root.glob("*/SKILL.md")):
         skill = skill_md.parent.name
-        fm = parse_frontmatter(skill_md)
+        fm = frontmatter_of(skill_md)
         description = fm.get("description", "")
         if not isinstance(description, str):
             description = ""
@@ -183,10 +205,20 @@ def build_skill_index(skills_root: Path, selected: set[str] | None) -> dict[str,
     return {name: data for name, data in corpus.items() if name in selected}
 
 
-def score_trigger(prompt: str, case_type: str, skill: str, skill_data: dict[str, Any]) -> float:
-    """TF-IDF cosine between the prompt and the skill, plus explicit-mention boosts."""
-    idf = skill_data.get("idf", {})
-    prompt_vec = _tfidf_vector(normalize_tokens(prompt), idf)
+def score_trigger(
+    prompt: str,
+    case_type: str,
+    skill: str,
+    skill_data: dict[str, Any],
+    prompt_vec: dict[str, float] | None = None,
+) -> float:
+    """TF-IDF cosine between the prompt and the skill, plus explicit-mention boosts.
+
+    `prompt_vec` is the prompt's vector under this skill's IDF; pass it when
+    scoring one prompt against many skills so the prompt is tokenized once.
+    """
+    if prompt_vec is None:
+        prompt_vec = _tfidf_vector(normalize_tokens(prompt), skill_data.get("idf", {}))
     skill_vec = skill_data.get("vector", {})
     cosine = sum(weight * skill_vec.get(token, 0.0) for token, weight in prompt_vec.items())
 
@@ -203,6 +235,24 @@ def score_trigger(prompt: str, case_type: str, skill: str, skill_data: dict[str,
     return max(0.0, min(1.0, cosine + boost))
 
 
+def score_all(prompt: str, case_type: str, skills: dict[str, dict[str, Any]]) -> dict[str, float]:
+    """Score one prompt against every skill, tokenizing the prompt once.
+
+    Skills from one `build_skill_index` call share an IDF table, so the prompt
+    vector is built once per distinct table (normally exactly once).
+    """
+    tokens = normalize_tokens(prompt)
+    vectors: dict[int, dict[str, float]] = {}
+    scores = {}
+    for skill, data in skills.items():
+        idf = data.get("idf", {})
+        vec = vectors.get(id(idf))
+        if vec is None:
+            vec = vectors[id(idf)] = _tfidf_vector(tokens, idf)
+        scores[skill] = score_trigger(prompt, case_type, skill, data, prompt_vec=vec)
+    return scores
+
+
 def threshold_for(case_type: str) -> float:
     if case_type == "explicit":
         return 0.20
@@ -235,33 +285,18 @@ def _skill_rows(counters: dict[str, dict[str, int]]) -> list[dict[str, Any]]:
     return rows
 
 
-def evaluate_cases(
-    skills: dict[str, dict[str, Any]],
-    cases: list[dict[str, Any]],
-    mode: str = "ranking",
-) -> dict[str, Any]:
-    """Score labeled cases under either the ranking or threshold assertion model.
+def _new_counters() -> dict[str, dict[str, int]]:
+    return defaultdict(lambda: {"tp": 0, "fp": 0, "tn": 0, "fn": 0})
 
-    Ranking (default): the top-scoring skill must be an expected trigger, and each
-    avoided skill must score strictly below the winner. A case with no expected
-    trigger ("matches nothing") passes when every avoided skill stays under
-    `MATCH_NOTHING_FLOOR`.
-
-    Threshold: each labeled skill is asserted against `threshold_for(case_type)`,
-    the older absolute-score model.
 
-    A case may set `"known_hard": true` to mark a genuine lexical-ceiling collision
-    (e.g. a prompt that names a competing skill's core verb). Its assertions are
-    tallied under `known_hard_*` and excluded from `failed`, so the case stays
-    visible without faking a pass or being deleted. A real agent
-    (`scripts/behavioral_evals.py`) is the backstop for these.
-
-    Both emit per-skill assertion entries with a boolean `passed`, so downstream
-    checks that grep for `"passed": false` keep working. Entries from a known_hard
-    case carry `"known_hard": true` so a grep can exclude them.
-    """
+def _evaluate_case_shard(
+    skills: dict[str, dict[str, Any]],
+    cases: list[Any],
+    mode: str,
+) -> tuple[list[dict[str, Any]], dict[str, dict[str, int]]]:
+    """Score a contiguous slice of cases; return its assertions and counters."""
     assertions: list[dict[str, Any]] = []
-    counters: dict[str, dict[str, int]] = defaultdict(lambda: {"tp": 0, "fp": 0, "tn": 0, "fn": 0})
+    counters = _new_counters()
 
     for raw_case in cases:
         if not isinstance(raw_case, dict):
@@ -277,7 +312,7 @@ def evaluate_cases(
         should_trigger = [s for s in expected.get("trigger", []) if s in skills]
         should_avoid = [s for s in expected.get("avoid", []) if s in skills]
 
-        scores = {s: score_trigger(prompt, case_type, s, data) for s, data in skills.items()}
+        scores = score_all(prompt, case_type, skills)
         rec = lambda skill, exp, pred, sc, winner="__unset__": _record(  # noqa: E731
             assertions, counters, case_id, case_type, skill, exp, pred, sc,
             known_hard=known_hard, winner=winner,
@@ -307,6 +342,51 @@ def evaluate_cases(
             for skill in should_avoid:
                 rec(skill, False, scores[skill] >= MATCH_NOTHING_FLOOR, scores[skill])
 
+    return assertions, dict(counters)
+
+
+def evaluate_cases(
+    skills: dict[str, dict[str, Any]],
+    cases: list[dict[str, Any]],
+    mode: str = "ranking",
+    jobs: int = 1,
+) -> dict[str, Any]:
+    """Score labeled cases under either the ranking or threshold assertion model.
+
+    Ranking (default): the top-scoring skill must be an expected trigger, and each
+    avoided skill must score strictly below the winner. A case with no expected
+    trigger ("matches nothing") passes when every avoided skill stays under
+    `MATCH_NOTHING_FLOOR`.
+
+    Threshold: each labeled skill is asserted against `threshold_for(case_type)`,
+    the older absolute-score model.
+
+    A case may set `"known_hard": true` to mark a genuine lexical-ceiling collision
+    (e.g. a prompt that names a competing skill's core verb). Its assertions are
+    tallied under `known_hard_*` and excluded from `failed`, so the case stays
+    visible without faking a pass or being deleted. A real agent
+    (`scripts/behavioral_evals.py`) is the backstop for these.
+
+    Both emit per-skill assertion entries with a boolean `passed`, so downstream
+    checks that grep for `"passed": false` keep working. Entries from a known_hard
+    case carry `"known_hard": true` so a grep can exclude them.
+
+    `jobs > 1` scores contiguous shards of `cases` in worker processes; the
+    result is the same as a serial run.
+    """
+    if jobs > 1 and len(cases) > 1:
+        shards = _map_shards(partial(_cases_worker, mode=mode), skills, _shard(cases, jobs), jobs)
+    else:
+        shards = [_evaluate_case_shard(skills, cases, mode)]
+
+    assertions: list[dict[str, Any]] = []
+    counters: dict[str, dict[str, int]] = _new_counters()
+    for shard_assertions, shard_counters in shards:
+        assertions.extend(shard_assertions)
+        for skill, row in shard_counters.items():
+            for key, value in row.items():
+                counters[skill][key] += value
+
     hard = [a for a in assertions if a.get("known_hard")]
     normal = [a for a in assertions if not a.get("known_hard")]
     passed = sum(1 for a in normal if a["passed"])
@@ -349,24 +429,16 @@ def _record(assertions, counters, case_id, case_type, skill, expected_bool,
     assertions.append(entry)
 
 
-def evaluate_declared_triggers(skills: dict[str, dict[str, Any]]) -> dict[str, Any]:
-    """Assert each skill's declared `triggers:` self-route without collisions.
-
-    For every declared trigger phrase, score it against every skill. The owning
-    skill must clear the explicit-case threshold and must not be tied or beaten
-    by any other skill (a tie/loss is a routing collision).
-    """
+def _declared_assertions(skills: dict[str, dict[str, Any]], owners: list[str]) -> list[dict[str, Any]]:
+    """Self-route/collision assertions for the declared triggers of `owners`."""
     case_type = "explicit"
     threshold = threshold_for(case_type)
     assertions: list[dict[str, Any]] = []
 
-    for owner in sorted(skills):
+    for owner in owners:
         triggers = skills[owner].get("declared_triggers", [])
         for phrase in triggers:
-            scores = {
-                skill: score_trigger(phrase, case_type, skill, data)
-                for skill, data in skills.items()
-            }
+            scores = score_all(phrase, case_type, skills)
             self_score = scores[owner]
             competitors = sorted(
                 ((s, sc) for s, sc in scores.items() if s != owner),
@@ -389,6 +461,28 @@ def evaluate_declared_triggers(skills: dict[str, dict[str, Any]]) -> dict[str, A
                     "passed": passed,
                 }
             )
+    return assertions
+
+
+def evaluate_declared_triggers(
+    skills: dict[str, dict[str, Any]],
+    jobs: int = 1,
+) -> dict[str, Any]:
+    """Assert each skill's declared `triggers:` self-route without collisions.
+
+    For every declared trigger phrase, score it against every skill. The owning
+    skill must clear the explicit-case threshold and must not be tied or beaten
+    by any other skill (a tie/loss is a routing collision).
+
+    `jobs > 1` shards the owners across worker processes with the same result
+    as a serial run.
+    """
+    declaring = [owner for owner in sorted(skills) if skills[owner].get("declared_triggers")]
+    if jobs > 1 and len(declaring) > 1:
+        shards = _map_shards(_declared_worker, skills, _shard(declaring, jobs), jobs)
+        assertions = [item for shard in shards for item in shard]
+    else:
+        assertions = _declared_assertions(skills, declaring)
 
     passed = sum(1 for item in assertions if item["passed"])
     failed = len(assertions) - passed
@@ -405,6 +499,88 @@ def evaluate_declared_triggers(skills: dict[str, dict[str, Any]]) -> dict[str, A
     }
 
 
+# Set once per worker process by the pool initializer; workers only read it.
+_WORKER_SKILLS: dict[str, dict[str, Any]] | None = None
+
+
+def _init_worker(skills: dict[str, dict[str, Any]]) -> None:
+    global _WORKER_SKILLS
+    _WORKER_SKILLS = skills
+
+
+def _cases_worker(cases: list[Any], mode: str):
+    return _evaluate_case_shard(_WORKER_SKILLS, cases, mode)
+
+
+def _declared_worker(owners: list[str]) -> list[dict[str, Any]]:
+    return _declared_assertions(_WORKER_SKILLS, owners)
+
+
+def _shard(items: list[Any], jobs: int) -> list[list[Any]]:
+    """Split `items` into at most `jobs` contiguous, order-preserving shards."""
+    size = math.ceil(len(items) / jobs)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _map_shards(worker, skills: dict[str, dict[str, Any]], shards: list[list[Any]], jobs: int) -> list[Any]:
+    # The index is handed to each worker once, at start-up, rather than pickled
+    # with every shard; results come back in shard order.
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(shards)), initializer=_init_worker, initargs=(skills,)
+    ) as pool:
+        return list(pool.map(worker, shards))
+
+
+def skill_fingerprints(skills: dict[str, dict[str, Any]]) -> dict[str, str]:
+    """Per-skill hash of everything routing reads from SKILL.md: description + triggers."""
+    return {
+        skill: hashlib.sha256(
+            json.dumps(
+                {"description": data["description"], "triggers": data["declared_triggers"]},
+                sort_keys=True,
+            ).encode("utf-8")
+        ).hexdigest()
+        for skill, data in sorted(skills.items())
+    }
+
+
+def changed_skills(skills: dict[str, dict[str, Any]], baseline: dict[str, str]) -> set[str]:
+    """Skills added, removed, or re-described since `baseline` was saved."""
+    current = skill_fingerprints(skills)
+    return {
+        skill for skill in current.keys() | baseline.keys()
+        if current.get(skill) != baseline.get(skill)
+    }
+
+
+def case_key(case: Any, mode: str, selected: set[str] | None = None) -> str:
+    """Hash of a case as written, the scoring mode, and the `--skills` selection.
+
+    The selection decides which skills compete for a prompt, so a case that
+    passed against a subset says nothing about the full catalog.
+    """
+    scope = sorted(selected) if selected is not None else None
+    return hashlib.sha256(json.dumps([mode, scope, case], sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def load_baseline(path: Path) -> tuple[dict[str, str], set[str]]:
+    """Return (skill fingerprints, keys of the cases that passed) from a baseline."""
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    fingerprints = payload.get("skills") if isinstance(payload, dict) else None
+    if not isinstance(fingerprints, dict):
+        raise ValueError(f"{path} is not a trigger-eval baseline (missing 'skills')")
+    cases = payload.get("cases", [])
+    return fingerprints, set(cases) if isinstance(cases, list) else set()
+
+
+def save_baseline(path: Path, skills: dict[str, dict[str, Any]], passed_cases: set[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps({"skills": skill_fingerprints(skills), "cases": sorted(passed_cases)}, indent=2) + "\n",
+        encoding="utf-8",
+    )
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Run deterministic trigger eval scaffold for skills")
     parser.add_argument("--cases", help="Path to trigger case JSON file")
@@ -421,10 +597,28 @@ def main() -> int:
         help="Assert cases against an absolute score threshold instead of the default ranking model",
     )
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes to shard cases and declared triggers across (default: 1)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        metavar="PATH",
+        help="After a passing run, write skill fingerprints and passed cases to PATH",
+    )
+    parser.add_argument(
+        "--skip-passed",
+        metavar="BASELINE",
+        help="Skip cases that passed in BASELINE; only while no catalog skill has changed since it",
+    )
     args = parser.parse_args()
 
     if not args.cases and not args.from_triggers:
         parser.error("provide --cases <file> and/or --from-triggers")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     script_path = Path(__file__).resolve()
     repo_root = script_path.parents[3]
@@ -446,10 +640,45 @@ def main() -> int:
         print("No skills available for scoring", file=sys.stderr)
         return 1
 
-    if args.from_triggers and not args.cases:
-        output = evaluate_declared_triggers(skills)
+    def resolve(path: str) -> Path:
+        target = Path(path)
+        return target if target.is_absolute() else (repo_root / target).resolve()
+
+    # Fingerprints always cover the whole catalog: IDF does, so an edit to an
+    # unselected skill still moves every selected score.
+    catalog = skills
+    if selected is not None and (args.skip_passed or args.save_baseline):
+        catalog = build_skill_index(skills_root, None)
+
+    changed = None
+    baseline_cases: set[str] = set()
+    if args.skip_passed:
+        try:
+            baseline, baseline_cases = load_baseline(resolve(args.skip_passed))
+        except (OSError, ValueError) as exc:
+            print(f"Could not read baseline: {exc}", file=sys.stderr)
+            return 1
+        changed = changed_skills(catalog, baseline)
+
+    def skip_passed_note(cases_skipped: int | None) -> dict[str, Any]:
+        note: dict[str, Any] = {"baseline": args.skip_passed, "changed_skills": sorted(changed)}
+        if cases_skipped is not None:
+            note["cases_skipped"] = cases_skipped
+        return note
+
+    def finish(output: dict[str, Any], code: int, passed_cases: set[str]) -> int:
         print(json.dumps(output, indent=2) if args.pretty else json.dumps(output))
-        return 1 if output["summary"]["failed"] else 0
+        # A failing run must not advance the baseline, or the next --skip-passed
+        # run would skip the regression it just found.
+        if args.save_baseline and code == 0:
+            save_baseline(resolve(args.save_baseline), catalog, passed_cases)
+        return code
+
+    if args.from_triggers and not args.cases:
+        output = evaluate_declared_triggers(skills, jobs=args.jobs)
+        if changed is not None:
+            output["skip_passed"] = skip_passed_note(None)
+        return finish(output, 1 if output["summary"]["failed"] else 0, set())
 
     cases_path = Path(args.cases)
     if not cases_path.is_absolute():
@@ -465,16 +694,27 @@ def main() -> int:
         return 1
 
     mode = "threshold" if args.threshold else "ranking"
-    output = evaluate_cases(skills, cases, mode=mode)
+    keys = [case_key(case, mode, selected) for case in cases]
+    skipped = 0
+    if changed is not None and not changed:
+        # Nothing routing reads has changed, so a case that passed then passes now.
+        kept = [case for case, key in zip(cases, keys) if key not in baseline_cases]
+        skipped = len(cases) - len(kept)
+        cases = kept
+
+    output = evaluate_cases(skills, cases, mode=mode, jobs=args.jobs)
+    if changed is not None:
+        output["skip_passed"] = skip_passed_note(skipped)
 
     declared_failed = 0
     if args.from_triggers:
-        declared = evaluate_declared_triggers(skills)
+        declared = evaluate_declared_triggers(skills, jobs=args.jobs)
         output["declared_triggers"] = declared
         declared_failed = declared["summary"]["failed"]
 
-    print(json.dumps(output, indent=2) if args.pretty else json.dumps(output))
-    return 1 if (output["summary"]["failed"] or declared_failed) else 0
+    code = 1 if (output["summary"]["failed"] or declared_failed) else 0
+    # Reached only when every case in the file passed now or was skipped as passed.
+    return finish(output, code, set(keys))
 
 
 if __name__ == "__main__":
@@ -114,9 +114,10 @@ def resource_map_present(text: str, skill_dir: Path) -> bool:
     return has_resource_heading or has_path_mentions
 
 
-def evaluate_skill(skill_dir: Path, validate_skill_fn, strict: bool) -> dict[str, Any]:
+def evaluate_skill(skill_dir: Path, validate_skill_fn, strict: bool, text: str | None = None) -> dict[str, Any]:
     skill_md = skill_dir / "SKILL.md"
-    text = skill_md.read_text(encoding="utf-8")
+    if text is None:
+        text = skill_md.read_text(encoding="utf-8")
     lines = text.count("\n") + 1
 
     valid, validate_msg = validate_skill_fn(str(skill_dir))
@@ -402,6 +403,29 @@ def render_markdown(results: list[dict[str, Any]], strict: bool) -> str:
     return "\n".join(out).rstrip() + "\n"
 
 
+def summarize(results: list[dict[str, Any]], strict: bool) -> dict[str, Any]:
+    return {
+        "total": len(results),
+        "pass": sum(1 for item in results if item["status"] == "pass"),
+        "warn": sum(1 for item in results if item["status"] == "warn"),
+        "fail": sum(1 for item in results if item["status"] == "fail"),
+        "strict": strict,
+    }
+
+
+def render_text(summary: dict[str, Any], results: list[dict[str, Any]]) -> str:
+    out = [
+        "Summary: "
+        f"total={summary['total']} pass={summary['pass']} warn={summary['warn']} fail={summary['fail']}"
+    ]
+    for item in results:
+        out.append(
+            f"{item['status'].upper():4} {item['skill']}[{item['skill_type']}] "
+            f"(required_failures={len(item['required_failures'])}, warnings={len(item['warnings'])})"
+        )
+    return "\n".join(out) + "\n"
+
+
 def collect_skills(skills_root: Path, selected: set[str] | None) -> list[Path]:
     skills = [path.parent for path in sorted(skills_root.glob("*/SKILL.md"))]
     if selected:
@@ -455,13 +479,7 @@ def main() -> int:
 
     results = [evaluate_skill(skill_dir, validate_skill, args.strict) for skill_dir in skill_dirs]
 
-    summary = {
-        "total": len(results),
-        "pass": sum(1 for item in results if item["status"] == "pass"),
-        "warn": sum(1 for item in results if item["status"] == "warn"),
-        "fail": sum(1 for item in results if item["status"] == "fail"),
-        "strict": args.strict,
-    }
+    summary = summarize(results, args.strict)
 
     payload = {
         "summary": summary,
@@ -479,15 +497,7 @@ def main() -> int:
     if args.json:
         print(json.dumps(payload, indent=2))
     else:
-        print(
-            "Summary: "
-            f"total={summary['total']} pass={summary['pass']} warn={summary['warn']} fail={summary['fail']}"
-        )
-        for item in results:
-            print(
-                f"{item['status'].upper():4} {item['skill']}[{item['skill_type']}] "
-                f"(required_failures={len(item['required_failures'])}, warnings={len(item['warnings'])})"
-            )
+        print(render_text(summary, results), end="")
 
     return 1 if summary["fail"] else 0
 
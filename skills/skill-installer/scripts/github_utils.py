@@ -3,19 +3,146 @@
 
 from __future__ import annotations
 
+import base64
+import hashlib
+import json
 import os
+import shutil
+import tempfile
+import time
+import urllib.error
 import urllib.request
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+CACHE_ENV = "SKILL_INSTALLER_CACHE"
+DEFAULT_RESPONSE_TTL = 600
 
-def github_request(url: str, user_agent: str) -> bytes:
+
+class OfflineCacheMiss(Exception):
+    """Offline mode was requested but nothing is cached for the URL."""
+
+
+def default_cache_dir() -> str:
+    if os.environ.get(CACHE_ENV):
+        return os.environ[CACHE_ENV]
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "skill-installer")
+
+
+class ResponseCache:
+    """On-disk GitHub response cache with a freshness TTL and ETag revalidation.
+
+    Fresh entries are served without touching the network. Stale entries are
+    revalidated with ``If-None-Match``; a 304 renews the entry and costs
+    nothing against the API rate limit. ``offline`` serves whatever is cached,
+    however old, and never makes a request.
+    """
+
+    def __init__(self, root: str, ttl: float = DEFAULT_RESPONSE_TTL, offline: bool = False):
+        self.root = root
+        self.ttl = ttl
+        self.offline = offline
+
+    def _path(self, url: str, accept: str | None) -> str:
+        # The token is part of the key: a private listing must not be served to
+        # a later caller running without (or with different) credentials.
+        token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN") or ""
+        material = "\0".join((url, accept or "", hashlib.sha256(token.encode()).hexdigest()))
+        return os.path.join(self.root, hashlib.sha256(material.encode()).hexdigest() + ".json")
+
+    def load(self, url: str, accept: str | None) -> dict | None:
+        try:
+            with open(self._path(url, accept), encoding="utf-8") as handle:
+                entry = json.load(handle)
+            entry["body"] = base64.b64decode(entry["body"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return entry
+
+    def store(self, url: str, accept: str | None, body: bytes, etag: str | None) -> None:
+        """Cache a response; if the cache dir cannot be written, carry on uncached."""
+        entry = {
+            "url": url,
+            "etag": etag,
+            "fetched_at": time.time(),
+            "body": base64.b64encode(body).decode("ascii"),
+        }
+        partial = None
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            fd, partial = tempfile.mkstemp(suffix=".partial", dir=self.root)
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entry, handle)
+            os.replace(partial, self._path(url, accept))
+        except OSError:
+            if partial is not None:
+                try:
+                    os.unlink(partial)
+                except OSError:
+                    pass
+
+
+def _github_headers(user_agent: str, accept: str | None = None) -> dict[str, str]:
     headers = {"User-Agent": user_agent}
+    if accept:
+        headers["Accept"] = accept
     token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
     if token:
         headers["Authorization"] = f"token {token}"
+    return headers
+
+
+def github_request(
+    url: str,
+    user_agent: str,
+    accept: str | None = None,
+    cache: ResponseCache | None = None,
+) -> bytes:
+    entry = cache.load(url, accept) if cache else None
+    if cache and cache.offline:
+        if entry is None:
+            raise OfflineCacheMiss(url)
+        return entry["body"]
+    if entry and time.time() - entry.get("fetched_at", 0) < cache.ttl:
+        return entry["body"]
+
+    headers = _github_headers(user_agent, accept)
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
     req = urllib.request.Request(url, headers=headers)
-    with urllib.request.urlopen(req) as resp:
-        return resp.read()
+    try:
+        with urllib.request.urlopen(req) as resp:
+            body = resp.read()
+            etag = resp.headers.get("ETag")
+    except urllib.error.HTTPError as exc:
+        if exc.code != 304 or entry is None:
+            raise
+        body, etag = entry["body"], exc.headers.get("ETag") or entry.get("etag")
+    if cache:
+        cache.store(url, accept, body, etag)
+    return body
+
+
+def github_download(url: str, user_agent: str, dest_path: str) -> int:
+    """Stream ``url`` to ``dest_path`` in fixed-size chunks; return bytes written.
+
+    Repository archives can be large, so they are never held in memory whole.
+    """
+    req = urllib.request.Request(url, headers=_github_headers(user_agent))
+    with urllib.request.urlopen(req) as resp, open(dest_path, "wb") as file_handle:
+        shutil.copyfileobj(resp, file_handle, DOWNLOAD_CHUNK_SIZE)
+        return file_handle.tell()
+
+
+def github_api_base() -> str:
+    """GitHub API root; overridable so tests can point at a local stand-in."""
+    return os.environ.get("SKILL_INSTALLER_GITHUB_API", "https://api.github.com").rstrip("/")
+
+
+def github_codeload_base() -> str:
+    """Archive download root; overridable like ``github_api_base``."""
+    return os.environ.get("SKILL_INSTALLER_CODELOAD", "https://codeload.github.com").rstrip("/")
 
 
 def github_api_contents_url(repo: str, path: str, ref: str) -> str:
-    return f"https://api.github.com/repos/{repo}/contents/{path}?ref={ref}"
+    return f"{github_api_base()}/repos/{repo}/contents/{path}?ref={ref}"
@@ -4,8 +4,12 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import os
+import posixpath
+import re
+import shlex
 import shutil
 import subprocess
 import sys
@@ -14,8 +18,18 @@ import urllib.error
 import urllib.parse
 import zipfile
 
-from github_utils import github_request
+from github_utils import (
+    CACHE_ENV,
+    default_cache_dir,
+    github_api_base,
+    github_codeload_base,
+    github_download,
+    github_request,
+)
 DEFAULT_REF = "main"
+USER_AGENT = "codex-skill-install"
+COMMIT_SHA_RE = re.compile(r"[0-9a-f]{40}")
+REPO_SEGMENT_RE = re.compile(r"[A-Za-z0-9_.-]+")
 DEFAULT_AGENT = "codex"
 AGENT_HOME_ENV = {
     "codex": "CODEX_HOME",
@@ -37,6 +51,10 @@ class Args:
     dest: str | None = None
     name: str | None = None
     method: str = "auto"
+    cache_dir: str | None = None
+    no_cache: bool = False
+    batch: str | None = None
+    jobs: int = 4
 
 
 @dataclass
@@ -48,6 +66,15 @@ class Source:
     repo_url: str | None = None
 
 
+@dataclass
+class BatchResult:
+    skill: str
+    source: str
+    path: str
+    status: str
+    detail: str
+
+
 class InstallError(Exception):
     pass
 
@@ -64,8 +91,8 @@ def _tmp_root() -> str:
     return base
 
 
-def _request(url: str) -> bytes:
-    return github_request(url, "codex-skill-install")
+def _request(url: str, accept: str | None = None) -> bytes:
+    return github_request(url, USER_AGENT, accept)
 
 
 def _parse_github_url(url: str, default_ref: str) -> tuple[str, str, str, str | None]:
@@ -89,23 +116,92 @@ def _parse_github_url(url: str, default_ref: str) -> tuple[str, str, str, str |
     return owner, repo, ref, subpath or None
 
 
-def _download_repo_zip(owner: str, repo: str, ref: str, dest_dir: str) -> str:
-    zip_url = f"https://codeload.github.com/{owner}/{repo}/zip/{ref}"
-    zip_path = os.path.join(dest_dir, "repo.zip")
+def _resolve_commit(owner: str, repo: str, ref: str) -> str:
+    """Pin ``ref`` to a commit SHA so the archive cache can never go stale."""
+    if COMMIT_SHA_RE.fullmatch(ref):
+        return ref
+    quoted_ref = urllib.parse.quote(ref, safe="/")
+    url = f"{github_api_base()}/repos/{owner}/{repo}/commits/{quoted_ref}"
     try:
-        payload = _request(zip_url)
+        payload = _request(url, accept="application/vnd.github.sha")
     except urllib.error.HTTPError as exc:
-        raise InstallError(f"Download failed: HTTP {exc.code}") from exc
-    with open(zip_path, "wb") as file_handle:
-        file_handle.write(payload)
+        raise InstallError(f"Ref lookup failed: HTTP {exc.code}") from exc
+    except urllib.error.URLError as exc:
+        raise InstallError(f"Ref lookup failed: {exc.reason}") from exc
+    commit = payload.decode("utf-8", errors="replace").strip()
+    if not COMMIT_SHA_RE.fullmatch(commit):
+        raise InstallError(f"Could not resolve ref {ref!r} to a commit.")
+    return commit
+
+
+def _cached_archive(owner: str, repo: str, commit: str, cache_dir: str) -> str:
+    """Return the archive for ``commit``, streaming it into the cache on a miss.
+
+    Archives are addressed by owner/repo/commit, so a hit is always exact.
+    Downloads land in a temp file beside the entry and are renamed into place
+    only once they open as a zip, so an interrupted run never poisons the cache.
+    """
+    for segment in (owner, repo):
+        if not REPO_SEGMENT_RE.fullmatch(segment) or segment in (".", ".."):
+            raise InstallError(f"Invalid repository segment: {segment!r}")
+    entry_dir = os.path.join(cache_dir, owner.lower(), repo.lower())
+    zip_path = os.path.join(entry_dir, f"{commit}.zip")
+    if os.path.isfile(zip_path):
+        return zip_path
+
+    os.makedirs(entry_dir, exist_ok=True)
+    zip_url = f"{github_codeload_base()}/{owner}/{repo}/zip/{commit}"
+    fd, partial = tempfile.mkstemp(prefix=f"{commit}.", suffix=".partial", dir=entry_dir)
+    os.close(fd)
+    try:
+        try:
+            github_download(zip_url, USER_AGENT, partial)
+        except urllib.error.HTTPError as exc:
+            raise InstallError(f"Download failed: HTTP {exc.code}") from exc
+        except urllib.error.URLError as exc:
+            raise InstallError(f"Download failed: {exc.reason}") from exc
+        try:
+            with zipfile.ZipFile(partial, "r"):
+                pass
+        except zipfile.BadZipFile as exc:
+            raise InstallError("Downloaded archive is not a valid zip file.") from exc
+        os.replace(partial, zip_path)
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+    return zip_path
+
+
+def _extract_paths(zip_path: str, paths: list[str], dest_dir: str) -> str:
+    """Extract only the requested repo paths; return the archive's root dir."""
     with zipfile.ZipFile(zip_path, "r") as zip_file:
-        _safe_extract_zip(zip_file, dest_dir)
-        top_levels = {name.split("/")[0] for name in zip_file.namelist() if name}
-    if not top_levels:
-        raise InstallError("Downloaded archive was empty.")
-    if len(top_levels) != 1:
-        raise InstallError("Unexpected archive layout.")
-    return os.path.join(dest_dir, next(iter(top_levels)))
+        infos = zip_file.infolist()
+        top_levels = {info.filename.split("/")[0] for info in infos if info.filename}
+        if not top_levels:
+            raise InstallError("Downloaded archive was empty.")
+        if len(top_levels) != 1:
+            raise InstallError("Unexpected archive layout.")
+        top_level = next(iter(top_levels))
+        prefixes = tuple(
+            f"{top_level}/{posixpath.normpath(path.strip('/'))}/" for path in paths
+        )
+        members = [info for info in infos if info.filename.startswith(prefixes)]
+        _safe_extract_zip(zip_file, dest_dir, members)
+    return os.path.join(dest_dir, top_level)
+
+
+def _download_repo_zip(
+    owner: str,
+    repo: str,
+    ref: str,
+    dest_dir: str,
+    paths: list[str],
+    cache_dir: str | None = None,
+) -> str:
+    commit = _resolve_commit(owner, repo, ref)
+    # Without a cache the archive still streams to disk, just inside dest_dir.
+    zip_path = _cached_archive(owner, repo, commit, cache_dir or dest_dir)
+    return _extract_paths(zip_path, paths, dest_dir)
 
 
 def _run_git(args: list[str]) -> None:
@@ -114,14 +210,19 @@ def _run_git(args: list[str]) -> None:
         raise InstallError(result.stderr.strip() or "Git command failed.")
 
 
-def _safe_extract_zip(zip_file: zipfile.ZipFile, dest_dir: str) -> None:
+def _safe_extract_zip(
+    zip_file: zipfile.ZipFile,
+    dest_dir: str,
+    members: list[zipfile.ZipInfo] | None = None,
+) -> None:
     dest_root = os.path.realpath(dest_dir)
-    for info in zip_file.infolist():
+    members = zip_file.infolist() if members is None else members
+    for info in members:
         extracted_path = os.path.realpath(os.path.join(dest_dir, info.filename))
         if extracted_path == dest_root or extracted_path.startswith(dest_root + os.sep):
             continue
         raise InstallError("Archive contains files outside the destination.")
-    zip_file.extractall(dest_dir)
+    zip_file.extractall(dest_dir, members=members)
 
 
 def _validate_relative_path(path: str) -> None:
@@ -188,6 +289,19 @@ def _copy_skill(src: str, dest_dir: str) -> None:
     shutil.copytree(src, dest_dir)
 
 
+def _install_skill(repo_root: str, path: str, dest_root: str, skill_name: str) -> str:
+    _validate_skill_name(skill_name)
+    if not skill_name:
+        raise InstallError("Unable to derive skill name.")
+    dest_dir = os.path.join(dest_root, skill_name)
+    if os.path.exists(dest_dir):
+        raise InstallError(f"Destination already exists: {dest_dir}")
+    skill_src = os.path.join(repo_root, path)
+    _validate_skill(skill_src)
+    _copy_skill(skill_src, dest_dir)
+    return dest_dir
+
+
 def _build_repo_url(owner: str, repo: str) -> str:
     return f"https://github.com/{owner}/{repo}.git"
 
@@ -196,10 +310,14 @@ def _build_repo_ssh(owner: str, repo: str) -> str:
     return f"git@github.com:{owner}/{repo}.git"
 
 
-def _prepare_repo(source: Source, method: str, tmp_dir: str) -> str:
+def _prepare_repo(
+    source: Source, method: str, tmp_dir: str, cache_dir: str | None = None
+) -> str:
     if method in ("download", "auto"):
         try:
-            return _download_repo_zip(source.owner, source.repo, source.ref, tmp_dir)
+            return _download_repo_zip(
+                source.owner, source.repo, source.ref, tmp_dir, source.paths, cache_dir
+            )
         except InstallError as exc:
             if method == "download":
                 raise
@@ -252,6 +370,144 @@ def _resolve_source(args: Args) -> Source:
     )
 
 
+def _read_batch(batch_path: str, default_ref: str) -> list[Source]:
+    """Parse a batch file into one single-path Source per line.
+
+    Each line is `owner/repo path [ref]` or a GitHub tree URL; blank lines and
+    `#` comments are skipped. `-` reads from stdin.
+    """
+    try:
+        if batch_path == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(batch_path, encoding="utf-8") as handle:
+                lines = handle.read().splitlines()
+    except OSError as exc:
+        raise InstallError(f"Cannot read batch file: {exc}") from exc
+
+    items = []
+    for lineno, line in enumerate(lines, start=1):
+        tokens = shlex.split(line, comments=True)
+        if not tokens:
+            continue
+        try:
+            if "://" in tokens[0]:
+                if len(tokens) > 2:
+                    raise InstallError("expected `<url> [path]`")
+                owner, repo, ref, url_path = _parse_github_url(tokens[0], default_ref)
+                path = tokens[1] if len(tokens) > 1 else url_path
+            else:
+                if len(tokens) not in (2, 3):
+                    raise InstallError("expected `owner/repo path [ref]`")
+                repo_parts = [p for p in tokens[0].split("/") if p]
+                if len(repo_parts) != 2:
+                    raise InstallError("repo must be in owner/repo format")
+                owner, repo = repo_parts
+                path = tokens[1]
+                ref = tokens[2] if len(tokens) == 3 else default_ref
+            if not path:
+                raise InstallError("missing skill path")
+            _validate_relative_path(path)
+        except InstallError as exc:
+            raise InstallError(f"{batch_path}:{lineno}: {exc}") from exc
+        items.append(Source(owner=owner, repo=repo, ref=ref, paths=[path]))
+    if not items:
+        raise InstallError("Batch file lists no skills.")
+    return items
+
+
+def _install_group(
+    source: Source, method: str, dest_root: str, cache_dir: str | None
+) -> list[BatchResult]:
+    """Prepare one checkout for every path in the group, then install each."""
+    label = f"{source.owner}/{source.repo}@{source.ref}"
+    names = [os.path.basename(path.rstrip("/")) for path in source.paths]
+    tmp_dir = tempfile.mkdtemp(prefix="skill-install-", dir=_tmp_root())
+    try:
+        try:
+            repo_root = _prepare_repo(source, method, tmp_dir, cache_dir)
+        except InstallError as exc:
+            return [
+                BatchResult(name, label, path, "failed", str(exc))
+                for name, path in zip(names, source.paths)
+            ]
+        results = []
+        for name, path in zip(names, source.paths):
+            try:
+                dest_dir = _install_skill(repo_root, path, dest_root, name)
+            except InstallError as exc:
+                results.append(BatchResult(name, label, path, "failed", str(exc)))
+            else:
+                results.append(BatchResult(name, label, path, "installed", dest_dir))
+        return results
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _format_results(results: list[BatchResult]) -> str:
+    header = ("SKILL", "SOURCE", "PATH", "STATUS", "DETAIL")
+    rows = [header] + [(r.skill, r.source, r.path, r.status, r.detail) for r in results]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header) - 1)]
+    return "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths)) + "  " + row[-1]
+        for row in rows
+    )
+
+
+def _run_batch(args: Args) -> int:
+    """Install a batch with one checkout per (repo, ref), groups in parallel."""
+    if args.name:
+        raise InstallError("--name cannot be combined with --batch.")
+    items = _read_batch(args.batch, args.ref)
+    dest_root = args.dest or _default_dest(args.agent)
+    cache_dir = _archive_cache_dir(args)
+
+    groups: dict[tuple[str, str, str], Source] = {}
+    members: dict[tuple[str, str, str], list[int]] = {}
+    ordered: list[BatchResult | None] = [None] * len(items)
+    seen_names: set[str] = set()
+    for index, item in enumerate(items):
+        path = item.paths[0]
+        name = os.path.basename(path.rstrip("/"))
+        if name in seen_names:
+            # Two entries would race for the same destination directory.
+            label = f"{item.owner}/{item.repo}@{item.ref}"
+            ordered[index] = BatchResult(
+                name, label, path, "failed", "duplicate skill name in batch"
+            )
+            continue
+        seen_names.add(name)
+        key = (item.owner.lower(), item.repo.lower(), item.ref)
+        group = groups.setdefault(
+            key, Source(owner=item.owner, repo=item.repo, ref=item.ref, paths=[])
+        )
+        group.paths.append(path)
+        members.setdefault(key, []).append(index)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(args.jobs, len(groups) or 1))) as pool:
+        futures = {
+            key: pool.submit(_install_group, group, args.method, dest_root, cache_dir)
+            for key, group in groups.items()
+        }
+        for key, future in futures.items():
+            for index, result in zip(members[key], future.result()):
+                ordered[index] = result
+
+    print(_format_results(ordered))
+    failed = sum(1 for r in ordered if r.status != "installed")
+    print(
+        f"\n{len(ordered) - failed} installed, {failed} failed "
+        f"across {len(groups)} checkout(s)."
+    )
+    return 1 if failed else 0
+
+
+def _archive_cache_dir(args: Args) -> str | None:
+    if args.no_cache:
+        return None
+    return args.cache_dir or os.path.join(default_cache_dir(), "archives")
+
+
 def _default_dest(agent: str) -> str:
     return os.path.join(_agent_home(agent), "skills")
 
@@ -281,12 +537,39 @@ def _parse_args(argv: list[str]) -> Args:
         choices=["auto", "download", "git"],
         default="auto",
     )
+    parser.add_argument(
+        "--cache-dir",
+        help="Archive cache directory "
+        f"(default: <${CACHE_ENV} or ~/.cache/skill-installer>/archives)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Download into a throwaway directory instead of the archive cache",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Install every `owner/repo path [ref]` (or GitHub URL) line in FILE; - for stdin",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=4,
+        help="Repositories to fetch concurrently in --batch mode (default: 4)",
+    )
     return parser.parse_args(argv, namespace=Args())
 
 
 def main(argv: list[str]) -> int:
     args = _parse_args(argv)
     try:
+        if args.batch:
+            if args.repo or args.url or args.path:
+                raise InstallError("--batch cannot be combined with --repo, --url, or --path.")
+            if args.jobs < 1:
+                raise InstallError("--jobs must be at least 1.")
+            return _run_batch(args)
         source = _resolve_source(args)
         source.ref = source.ref or args.ref
         if not source.paths:
@@ -296,20 +579,13 @@ def main(argv: list[str]) -> int:
         dest_root = args.dest or _default_dest(args.agent)
         tmp_dir = tempfile.mkdtemp(prefix="skill-install-", dir=_tmp_root())
         try:
-            repo_root = _prepare_repo(source, args.method, tmp_dir)
+            cache_dir = _archive_cache_dir(args)
+            repo_root = _prepare_repo(source, args.method, tmp_dir, cache_dir)
             installed = []
             for path in source.paths:
                 skill_name = args.name if len(source.paths) == 1 else None
                 skill_name = skill_name or os.path.basename(path.rstrip("/"))
-                _validate_skill_name(skill_name)
-                if not skill_name:
-                    raise InstallError("Unable to derive skill name.")
-                dest_dir = os.path.join(dest_root, skill_name)
-                if os.path.exists(dest_dir):
-                    raise InstallError(f"Destination already exists: {dest_dir}")
-                skill_src = os.path.join(repo_root, path)
-                _validate_skill(skill_src)
-                _copy_skill(skill_src, dest_dir)
+                dest_dir = _install_skill(repo_root, path, dest_root, skill_name)
                 installed.append((skill_name, dest_dir))
         finally:
             if os.path.isdir(tmp_dir):
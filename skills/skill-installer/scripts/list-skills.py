@@ -9,7 +9,14 @@ import os
 import sys
 import urllib.error
 
-from github_utils import github_api_contents_url, github_request
+from github_utils import (
+    DEFAULT_RESPONSE_TTL,
+    OfflineCacheMiss,
+    ResponseCache,
+    default_cache_dir,
+    github_api_contents_url,
+    github_request,
+)
 
 DEFAULT_REPO = "openai/skills"
 DEFAULT_PATH = "skills/.curated"
@@ -35,10 +42,13 @@ class Args(argparse.Namespace):
     ref: str
     agent: str
     format: str
+    ttl: float
+    offline: bool
+    no_cache: bool
 
 
-def _request(url: str) -> bytes:
-    return github_request(url, "codex-skill-list")
+def _request(url: str, cache: ResponseCache | None = None) -> bytes:
+    return github_request(url, "codex-skill-list", cache=cache)
 
 
 def _agent_home(agent: str) -> str:
@@ -51,18 +61,21 @@ def _installed_skills(agent: str) -> set[str]:
     root = os.path.join(_agent_home(agent), "skills")
     if not os.path.isdir(root):
         return set()
-    entries = set()
-    for name in os.listdir(root):
-        path = os.path.join(root, name)
-        if os.path.isdir(path):
-            entries.add(name)
-    return entries
+    # scandir reuses the directory entry's type, so no per-entry stat.
+    with os.scandir(root) as entries:
+        return {entry.name for entry in entries if entry.is_dir()}
 
 
-def _list_skills(repo: str, path: str, ref: str) -> list[str]:
+def _list_skills(
+    repo: str, path: str, ref: str, cache: ResponseCache | None = None
+) -> list[str]:
     api_url = github_api_contents_url(repo, path, ref)
     try:
-        payload = _request(api_url)
+        payload = _request(api_url, cache)
+    except OfflineCacheMiss as exc:
+        raise ListError(
+            f"No cached listing for {repo}/{path}@{ref}; run once online first."
+        ) from exc
     except urllib.error.HTTPError as exc:
         if exc.code == 404:
             raise ListError(
@@ -98,13 +111,39 @@ def _parse_args(argv: list[str]) -> Args:
         default="text",
         help="Output format",
     )
+    parser.add_argument(
+        "--ttl",
+        type=float,
+        default=DEFAULT_RESPONSE_TTL,
+        help="Seconds a cached listing is served without revalidation "
+        f"(default: {DEFAULT_RESPONSE_TTL})",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve the last cached listing without any network request",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch the listing and leave the response cache untouched",
+    )
     return parser.parse_args(argv, namespace=Args())
 
 
 def main(argv: list[str]) -> int:
     args = _parse_args(argv)
     try:
-        skills = _list_skills(args.repo, args.path, args.ref)
+        if args.offline and args.no_cache:
+            raise ListError("--offline needs the response cache; drop --no-cache.")
+        cache = None
+        if not args.no_cache:
+            cache = ResponseCache(
+                os.path.join(default_cache_dir(), "responses"),
+                ttl=args.ttl,
+                offline=args.offline,
+            )
+        skills = _list_skills(args.repo, args.path, args.ref, cache)
         installed = _installed_skills(args.agent)
         if args.format == "json":
             payload = [
@@ -14,43 +14,10 @@ Usage:
 """
 
 import argparse
-import json
 import os
 import sys
-import glob
-
-THEMES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "themes")
-
-
-def find_theme(name_or_path):
-    """Resolve a theme name or file path to a loaded JSON dict."""
-    # Direct path
-    if os.path.isfile(name_or_path):
-        with open(name_or_path) as f:
-            return json.load(f)
-
-    # Name lookup in themes directory
-    slug = name_or_path.lower().replace(" ", "-")
-    json_path = os.path.join(THEMES_DIR, f"{slug}.json")
-    if os.path.isfile(json_path):
-        with open(json_path) as f:
-            return json.load(f)
-
-    print(f"Error: theme '{name_or_path}' not found.", file=sys.stderr)
-    print(f"Looked for: {json_path}", file=sys.stderr)
-    available = list_themes()
-    if available:
-        print(f"Available: {', '.join(available)}", file=sys.stderr)
-    sys.exit(1)
-
-
-def list_themes():
-    """Return sorted list of available theme slugs."""
-    pattern = os.path.join(THEMES_DIR, "*.json")
-    return sorted(
-        os.path.splitext(os.path.basename(f))[0]
-        for f in glob.glob(pattern)
-    )
+
+from theme_index import ThemeError, find_theme, load_index
 
 
 def generate_vars(theme):
@@ -138,10 +105,8 @@ a:hover {
 
 def generate_all_vars():
     """Generate CSS variables for all themes, each scoped by data attribute."""
-    themes = list_themes()
     blocks = []
-    for slug in themes:
-        theme = find_theme(slug)
+    for slug, theme in load_index().items():
         css_vars = theme.get("css", {})
         heading = theme.get("typography", {}).get("heading", {})
         body = theme.get("typography", {}).get("body", {})
@@ -178,10 +143,16 @@ def main():
     parser.add_argument("--list", action="store_true", help="List available themes")
 
     args = parser.parse_args()
+    try:
+        run(args, parser)
+    except ThemeError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
 
+def run(args, parser):
     if args.list:
-        for slug in list_themes():
-            theme = find_theme(slug)
+        for slug, theme in load_index().items():
             mode = theme.get("mode", "?")
             print(f"  {slug:<22} ({mode})")
         return
@@ -12,51 +12,10 @@ Usage:
 """
 
 import argparse
-import json
 import os
 import sys
-import glob
-
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-THEMES_DIR = os.path.join(SCRIPT_DIR, "..", "themes")
-TEMPLATE_PATH = os.path.join(SCRIPT_DIR, "..", "assets", "theme-template.html")
-
-
-def find_theme(name_or_path):
-    """Resolve a theme name or file path to a loaded JSON dict."""
-    if os.path.isfile(name_or_path):
-        with open(name_or_path) as f:
-            return json.load(f)
-
-    slug = name_or_path.lower().replace(" ", "-")
-    json_path = os.path.join(THEMES_DIR, f"{slug}.json")
-    if os.path.isfile(json_path):
-        with open(json_path) as f:
-            return json.load(f)
-
-    print(f"Error: theme '{name_or_path}' not found.", file=sys.stderr)
-    available = list_themes()
-    if available:
-        print(f"Available: {', '.join(available)}", file=sys.stderr)
-    sys.exit(1)
-
-
-def list_themes():
-    """Return sorted list of available theme slugs."""
-    pattern = os.path.join(THEMES_DIR, "*.json")
-    return sorted(
-        os.path.splitext(os.path.basename(f))[0]
-        for f in glob.glob(pattern)
-    )
-
 
-def load_template():
-    """Load the HTML preview template."""
-    if not os.path.isfile(TEMPLATE_PATH):
-        print(f"Error: template not found at {TEMPLATE_PATH}", file=sys.stderr)
-        sys.exit(1)
-    with open(TEMPLATE_PATH) as f:
-        return f.read()
+from theme_index import ThemeError, find_theme, load_index, load_template
 
 
 def render_css_vars(theme):
@@ -152,22 +111,28 @@ def main():
     )
 
     args = parser.parse_args()
+    try:
+        run(args, parser)
+    except ThemeError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
 
+def run(args, parser):
     if args.list:
-        for slug in list_themes():
-            theme = find_theme(slug)
+        for slug, theme in load_index().items():
             mode = theme.get("mode", "?")
             print(f"  {slug:<22} ({mode})  {theme.get('description', '')[:60]}")
         return
 
     if args.all:
         os.makedirs(args.output_dir, exist_ok=True)
-        for slug in list_themes():
-            theme = find_theme(slug)
+        themes = load_index()
+        for slug, theme in themes.items():
             out = os.path.join(args.output_dir, f"{slug}-preview.html")
             path = generate_preview(theme, out)
             print(f"  {slug:<22} -> {path}")
-        print(f"\nGenerated {len(list_themes())} previews.")
+        print(f"\nGenerated {len(themes)} previews.")
         return
 
     if not args.theme:
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Render every theme's CSS and HTML preview in one process.
+
+Loads the compiled theme index and the preview template once, then writes, for
+each theme, <slug>.css and <slug>-preview.html into the output directory. It
+also writes themes.css, which holds every theme's variables scoped by
+[data-theme]. Output is identical to running generate_css.py and
+preview_theme.py once per theme.
+
+Usage:
+    python render_themes.py -d build/themes               # full CSS + previews
+    python render_themes.py -d build/themes --format vars # variables only
+"""
+
+import argparse
+import os
+import sys
+
+from generate_css import generate_all_vars, generate_full, generate_vars
+from preview_theme import generate_preview
+from theme_index import ThemeError, load_index
+
+
+def render_all(output_dir, css_format="full"):
+    """Write every theme's CSS and preview; return the written paths."""
+    os.makedirs(output_dir, exist_ok=True)
+    render_css = generate_full if css_format == "full" else generate_vars
+    written = []
+    for slug, theme in load_index().items():
+        css_path = os.path.join(output_dir, f"{slug}.css")
+        with open(css_path, "w") as f:
+            f.write(render_css(theme) + "\n")
+        written.append(css_path)
+        written.append(generate_preview(theme, os.path.join(output_dir, f"{slug}-preview.html")))
+
+    combined = os.path.join(output_dir, "themes.css")
+    with open(combined, "w") as f:
+        f.write(generate_all_vars() + "\n")
+    written.append(combined)
+    return [os.path.abspath(path) for path in written]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render CSS and HTML previews for every theme."
+    )
+    parser.add_argument(
+        "--output-dir", "-d",
+        default=".",
+        help="Output directory (default: current directory)"
+    )
+    parser.add_argument(
+        "--format", "-f",
+        choices=["vars", "full"],
+        default="full",
+        help="Per-theme CSS format (default: full)"
+    )
+    args = parser.parse_args()
+
+    try:
+        written = render_all(args.output_dir, args.format)
+    except ThemeError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+    themes = (len(written) - 1) // 2
+    print(f"Rendered {themes} themes ({len(written)} files) into "
+          f"{os.path.abspath(args.output_dir)}")
+
+
+if __name__ == "__main__":
+    main()
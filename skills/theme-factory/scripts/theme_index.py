@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""Compiled theme index shared by generate_css.py and preview_theme.py.
+
+Every theme JSON is loaded and validated once into a single bundle keyed by
+slug. An invalid theme file is left out of the bundle and reported on stderr;
+the valid themes stay usable. The bundle is written to a cache file and reused
+until the themes directory changes. Its signature is the directory mtime plus
+each theme file's name, mtime and size. The directory mtime alone would miss
+an in-place edit, and a single scandir for the per-file stats still avoids
+opening any JSON.
+
+Usage:
+    python theme_index.py            # rebuild the bundle and report its location
+    python theme_index.py --check    # validate every theme; exit 1 if any is invalid
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+THEMES_DIR = os.path.join(SCRIPT_DIR, "..", "themes")
+TEMPLATE_PATH = os.path.join(SCRIPT_DIR, "..", "assets", "theme-template.html")
+BUNDLE_VERSION = 2
+CACHE_ENV = "THEME_FACTORY_CACHE"
+
+_loaded = {}
+_template = None
+
+
+class ThemeError(Exception):
+    pass
+
+
+def cache_path(themes_dir=THEMES_DIR):
+    """Bundle location for a themes directory, outside the (possibly read-only) skill."""
+    root = os.environ.get(CACHE_ENV) or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+        "theme-factory",
+    )
+    key = hashlib.sha256(os.path.realpath(themes_dir).encode()).hexdigest()[:16]
+    return os.path.join(root, f"bundle-{key}.json")
+
+
+def signature(themes_dir=THEMES_DIR):
+    """Cheap change detector: directory mtime plus (name, mtime, size) per theme."""
+    entries = []
+    with os.scandir(themes_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".json") and entry.is_file():
+                stat = entry.stat()
+                entries.append([entry.name, stat.st_mtime_ns, stat.st_size])
+    entries.sort()
+    return [os.stat(themes_dir).st_mtime_ns, entries]
+
+
+def validate_theme(slug, theme):
+    """Return a list of problems with one theme definition."""
+    if not isinstance(theme, dict):
+        return [f"{slug}: theme must be a JSON object"]
+    problems = []
+    if not isinstance(theme.get("name"), str) or not theme["name"]:
+        problems.append(f"{slug}: missing 'name'")
+    css = theme.get("css")
+    if not isinstance(css, dict) or not css:
+        problems.append(f"{slug}: missing 'css' custom properties")
+    else:
+        for prop in css:
+            if not prop.startswith("--"):
+                problems.append(f"{slug}: css key '{prop}' is not a custom property")
+    for index, color in enumerate(theme.get("colors", [])):
+        if not isinstance(color, dict) or not {"name", "hex"} <= color.keys():
+            problems.append(f"{slug}: colors[{index}] needs 'name' and 'hex'")
+    if theme.get("slug", slug) != slug:
+        problems.append(f"{slug}: slug field '{theme['slug']}' does not match file name")
+    return problems
+
+
+def compile_bundle(themes_dir=THEMES_DIR):
+    """Load and validate every theme.
+
+    Valid themes go under "themes"; each invalid one is left out and its
+    problems recorded under "problems", keyed by slug.
+    """
+    sig = _signature_or_raise(themes_dir)
+    themes = {}
+    problems = {}
+    for name, _, _ in sig[1]:
+        slug = os.path.splitext(name)[0]
+        try:
+            with open(os.path.join(themes_dir, name)) as f:
+                theme = json.load(f)
+        except (OSError, ValueError) as exc:
+            problems[slug] = [f"{slug}: {exc}"]
+            continue
+        found = validate_theme(slug, theme)
+        if found:
+            problems[slug] = found
+        else:
+            themes[slug] = theme
+    return {
+        "version": BUNDLE_VERSION,
+        "signature": sig,
+        "themes": dict(sorted(themes.items())),
+        "problems": dict(sorted(problems.items())),
+    }
+
+
+def _signature_or_raise(themes_dir):
+    try:
+        return signature(themes_dir)
+    except OSError as exc:
+        raise ThemeError(f"cannot read themes directory {themes_dir}: {exc}") from exc
+
+
+def _read_bundle(path):
+    try:
+        with open(path) as f:
+            bundle = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return bundle if isinstance(bundle, dict) else None
+
+
+def _write_bundle(path, bundle):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, partial = tempfile.mkstemp(suffix=".partial", dir=os.path.dirname(path))
+        with os.fdopen(fd, "w") as f:
+            json.dump(bundle, f)
+        os.replace(partial, path)
+    except OSError:
+        # Read-only installs land here; each process then compiles its own
+        # bundle in memory.
+        pass
+
+
+def _load_bundle(themes_dir):
+    key = os.path.realpath(themes_dir)
+    sig = _signature_or_raise(themes_dir)
+    cached = _loaded.get(key)
+    if cached and cached["signature"] == sig:
+        return cached
+
+    path = cache_path(themes_dir)
+    bundle = _read_bundle(path)
+    if not bundle or bundle.get("version") != BUNDLE_VERSION or bundle.get("signature") != sig:
+        bundle = compile_bundle(themes_dir)
+        _write_bundle(path, bundle)
+    _loaded[key] = bundle
+    # Reported once per process per change, not on every lookup.
+    for found in bundle["problems"].values():
+        for problem in found:
+            print(f"Warning: skipping invalid theme {problem}", file=sys.stderr)
+    return bundle
+
+
+def load_index(themes_dir=THEMES_DIR):
+    """Return {slug: theme} for every valid theme, sorted by slug.
+
+    Raises ThemeError only if the themes directory itself cannot be read.
+    """
+    return _load_bundle(themes_dir)["themes"]
+
+
+def index_problems(themes_dir=THEMES_DIR):
+    """Return {slug: [problem, ...]} for every theme left out of the index."""
+    return _load_bundle(themes_dir)["problems"]
+
+
+def list_themes():
+    """Return sorted list of available theme slugs."""
+    return sorted(_index_or_exit())
+
+
+def find_theme(name_or_path):
+    """Resolve a theme name or file path to a loaded JSON dict."""
+    if os.path.isfile(name_or_path):
+        with open(name_or_path) as f:
+            return json.load(f)
+
+    slug = name_or_path.lower().replace(" ", "-")
+    themes = _index_or_exit()
+    if slug in themes:
+        return themes[slug]
+    problems = index_problems().get(slug)
+    if problems:
+        print(f"Error: theme '{name_or_path}' is invalid:", file=sys.stderr)
+        for problem in problems:
+            print(f"  {problem}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Error: theme '{name_or_path}' not found.", file=sys.stderr)
+    print(f"Looked for: {os.path.join(THEMES_DIR, f'{slug}.json')}", file=sys.stderr)
+    if themes:
+        print(f"Available: {', '.join(sorted(themes))}", file=sys.stderr)
+    sys.exit(1)
+
+
+def load_template():
+    """Load the HTML preview template once per process."""
+    global _template
+    if _template is None:
+        if not os.path.isfile(TEMPLATE_PATH):
+            print(f"Error: template not found at {TEMPLATE_PATH}", file=sys.stderr)
+            sys.exit(1)
+        with open(TEMPLATE_PATH) as f:
+            _template = f.read()
+    return _template
+
+
+def _index_or_exit():
+    try:
+        return load_index()
+    except ThemeError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile and validate the theme bundle.")
+    parser.add_argument("--check", action="store_true",
+                        help="Validate every theme without using the cache")
+    args = parser.parse_args()
+
+    try:
+        if args.check:
+            bundle = compile_bundle()
+            problems = [p for found in bundle["problems"].values() for p in found]
+            if problems:
+                print("Error: invalid themes:\n  " + "\n  ".join(problems), file=sys.stderr)
+                sys.exit(1)
+            print(f"{len(bundle['themes'])} themes valid.")
+            return
+        count = len(load_index())
+    except ThemeError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+    print(f"{count} themes bundled at {cache_path()}")
+
+
+if __name__ == "__main__":
+    main()
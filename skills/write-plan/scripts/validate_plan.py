@@ -11,9 +11,12 @@ from __future__ import annotations
 
 import argparse
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import json
 import re
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
 
@@ -391,6 +394,43 @@ def resolve_repo_path(raw: str, repo_root: Path) -> Path | None:
     return resolved
 
 
+class PathCache:
+    """Memoised repo-root discovery and path resolution for one batch run.
+
+    A directory of plans shares one Git root and cites the same handful of
+    files, so each `git rev-parse`, `resolve()` and `exists()` is paid once per
+    batch rather than once per plan. Scoped to a run: nothing outlives it.
+    Shared by `--jobs` workers, so every lookup-and-fill holds the lock; a
+    Git root is discovered under it too, keeping it one `git` call per directory.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._roots: dict[Path, Path] = {}
+        self._resolved: dict[tuple[str, Path], Path | None] = {}
+        self._exists: dict[Path, bool] = {}
+
+    def repo_root(self, path: Path) -> Path:
+        start = path if path.is_dir() else path.parent
+        with self._lock:
+            if start not in self._roots:
+                self._roots[start] = discover_repo_root(path)
+            return self._roots[start]
+
+    def resolve(self, raw: str, repo_root: Path) -> Path | None:
+        key = (raw, repo_root)
+        with self._lock:
+            if key not in self._resolved:
+                self._resolved[key] = resolve_repo_path(raw, repo_root)
+            return self._resolved[key]
+
+    def exists(self, path: Path) -> bool:
+        with self._lock:
+            if path not in self._exists:
+                self._exists[path] = path.exists()
+            return self._exists[path]
+
+
 def task_dependency_errors(body: str) -> list[str]:
     errors: list[str] = []
     blocks = iter_task_blocks(body)
@@ -423,18 +463,23 @@ def traceability_task_errors(body: str, high_risk_section: str) -> list[str]:
     return errors
 
 
-def modified_file_errors(body: str, repo_root: Path) -> list[str]:
+def modified_file_errors(
+    body: str,
+    repo_root: Path,
+    cache: PathCache | None = None,
+) -> list[str]:
     errors: list[str] = []
+    cache = cache or PathCache()
     for task in iter_task_blocks(body):
         files = task_files_block(task)
         for line in files.splitlines():
             if not re.match(r"^\s*[-*]\s*Modify(?:\s*\([^)]*\))?:", line, re.IGNORECASE):
                 continue
             for raw in INLINE_CODE_RE.findall(line):
-                target = resolve_repo_path(raw, repo_root)
+                target = cache.resolve(raw, repo_root)
                 if target is None:
                     errors.append(f"High-risk plan has invalid repository path: {raw}")
-                elif not target.exists():
+                elif not cache.exists(target):
                     errors.append(f"High-risk plan cites missing modified file: {raw}")
     return errors
 
@@ -461,9 +506,11 @@ def validate_high_risk(
     body: str,
     path: Path,
     repo_root: Path | None = None,
+    cache: PathCache | None = None,
 ) -> list[str]:
     """Validate the conditional high-risk planning extension."""
     errors: list[str] = []
+    cache = cache or PathCache()
     risk_profile = frontmatter.get("risk_profile", "routine")
     readiness = frontmatter.get("readiness", "draft")
 
@@ -474,7 +521,7 @@ def validate_high_risk(
     if risk_profile != "high":
         return errors
     resolved_repo_root = (
-        repo_root.resolve() if repo_root is not None else discover_repo_root(path)
+        repo_root.resolve() if repo_root is not None else cache.repo_root(path)
     )
 
     if "readiness" not in frontmatter:
@@ -495,10 +542,10 @@ def validate_high_risk(
     if not spec_value:
         errors.append("High-risk plans must link a repository-relative spec in frontmatter 'spec'")
     else:
-        spec_path = resolve_repo_path(spec_value, resolved_repo_root)
+        spec_path = cache.resolve(spec_value, resolved_repo_root)
         if spec_path is None:
             errors.append("High-risk plan frontmatter 'spec' must be repository-relative")
-        elif not spec_path.exists():
+        elif not cache.exists(spec_path):
             errors.append(f"High-risk plan linked spec does not exist: {spec_value}")
         else:
             spec_text = spec_path.read_text(encoding="utf-8")
@@ -539,7 +586,7 @@ def validate_high_risk(
 
     errors.extend(task_dependency_errors(body))
     errors.extend(traceability_task_errors(body, high_risk_section or ""))
-    errors.extend(modified_file_errors(body, resolved_repo_root))
+    errors.extend(modified_file_errors(body, resolved_repo_root, cache))
 
     if readiness == "ready":
         review = section_body(high_risk_section or "", "### Readiness Review") or ""
@@ -571,14 +618,26 @@ def validate_file(
     expected_stage: str,
     strict_filename: bool,
     repo_root: Path | None = None,
+    cache: PathCache | None = None,
 ) -> list[str]:
-    errors: list[str] = []
     if not path.exists():
         return [f"File not found: {path}"]
     if path.suffix.lower() != ".md":
         return [f"Not a markdown file: {path}"]
 
     text = path.read_text(encoding="utf-8")
+    return validate_text(text, path, expected_stage, strict_filename, repo_root, cache)
+
+
+def validate_text(
+    text: str,
+    path: Path,
+    expected_stage: str,
+    strict_filename: bool,
+    repo_root: Path | None = None,
+    cache: PathCache | None = None,
+) -> list[str]:
+    errors: list[str] = []
     frontmatter, body, fm_errors = parse_frontmatter(text)
     errors.extend(fm_errors)
 
@@ -588,10 +647,62 @@ def validate_file(
         )
 
     errors.extend(validate_body(body))
-    errors.extend(validate_high_risk(frontmatter, body, path, repo_root))
+    errors.extend(validate_high_risk(frontmatter, body, path, repo_root, cache))
     return errors
 
 
+def validate_target(
+    path: Path,
+    expected_stage: str,
+    strict_filename: bool,
+    repo_root: Path | None,
+    cache: PathCache,
+) -> dict:
+    """Validate one file for a batch: errors plus advisories from a single read."""
+    advisories: list[str] = []
+    if not path.exists():
+        errors = [f"File not found: {path}"]
+    elif path.suffix.lower() != ".md":
+        errors = [f"Not a markdown file: {path}"]
+    else:
+        text = path.read_text(encoding="utf-8")
+        errors = validate_text(text, path, expected_stage, strict_filename, repo_root, cache)
+        if not errors and path.is_file():
+            _, body, frontmatter_errors = parse_frontmatter(text)
+            if not frontmatter_errors:
+                advisories = collect_advisories(body)
+    return {
+        "path": str(path),
+        "status": "fail" if errors else "pass",
+        "errors": errors,
+        "advisories": advisories,
+    }
+
+
+def validate_batch(
+    targets: list[Path],
+    expected_stage: str,
+    strict_filename: bool,
+    repo_root: Path | None = None,
+    jobs: int = 1,
+) -> list[dict]:
+    """Validate `targets` across a worker pool; results keep input order."""
+    cache = PathCache()
+    workers = max(1, min(jobs, len(targets)))
+    if workers == 1:
+        return [
+            validate_target(t, expected_stage, strict_filename, repo_root, cache)
+            for t in targets
+        ]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(
+                lambda t: validate_target(t, expected_stage, strict_filename, repo_root, cache),
+                targets,
+            )
+        )
+
+
 def iter_markdown_files(paths: list[Path]) -> list[Path]:
     files: list[Path] = []
     for path in paths:
@@ -625,6 +736,17 @@ def main() -> int:
             "plan's Git root; outside Git, defaults to the current directory."
         ),
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Files validated in parallel (default: 1; validation is CPU-bound)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print one consolidated JSON report instead of PASS/FAIL lines",
+    )
     args = parser.parse_args()
 
     targets = iter_markdown_files([Path(p) for p in args.paths])
@@ -637,33 +759,40 @@ def main() -> int:
         print(f"Repository root is not a directory: {repo_root}")
         return 1
 
-    has_errors = False
-    for target in targets:
-        errors = validate_file(
-            target,
-            args.expected_stage,
-            args.strict_filename,
-            repo_root,
-        )
-        if errors:
-            has_errors = True
-            print(f"FAIL: {target}")
-            for error in errors:
+    results = validate_batch(
+        targets,
+        args.expected_stage,
+        args.strict_filename,
+        repo_root,
+        args.jobs,
+    )
+    failed = sum(1 for item in results if item["status"] == "fail")
+
+    if args.json:
+        payload = {
+            "summary": {
+                "total": len(results),
+                "pass": len(results) - failed,
+                "fail": failed,
+                "advisories": sum(len(item["advisories"]) for item in results),
+            },
+            "files": results,
+        }
+        print(json.dumps(payload, indent=2))
+        return 1 if failed else 0
+
+    for item in results:
+        if item["errors"]:
+            print(f"FAIL: {item['path']}")
+            for error in item["errors"]:
                 print(f"  - {error}")
         else:
-            print(f"PASS: {target}")
-
-        if errors or not target.is_file():
-            continue
-
-        text = target.read_text(encoding="utf-8")
-        _, body, frontmatter_errors = parse_frontmatter(text)
-        if not frontmatter_errors:
-            for advisory in collect_advisories(body):
-                print(f"ADVISORY: {target}")
-                print(f"  - {advisory}")
+            print(f"PASS: {item['path']}")
+        for advisory in item["advisories"]:
+            print(f"ADVISORY: {item['path']}")
+            print(f"  - {advisory}")
 
-    return 1 if has_errors else 0
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
@@ -12,6 +12,8 @@ from __future__ import annotations
 
 import argparse
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import json
 import re
 import sys
 from pathlib import Path
@@ -285,13 +287,19 @@ def validate_high_risk(frontmatter: dict[str, str], body: str) -> list[str]:
 
 
 def validate_file(path: Path, expected_stage: str, strict_filename: bool) -> list[str]:
-    errors: list[str] = []
     if not path.exists():
         return [f"File not found: {path}"]
     if path.suffix.lower() != ".md":
         return [f"Not a markdown file: {path}"]
 
     text = path.read_text(encoding="utf-8")
+    return validate_text(text, path, expected_stage, strict_filename)
+
+
+def validate_text(
+    text: str, path: Path, expected_stage: str, strict_filename: bool
+) -> list[str]:
+    errors: list[str] = []
     frontmatter, body, fm_errors = parse_frontmatter(text)
     errors.extend(fm_errors)
 
@@ -305,6 +313,47 @@ def validate_file(path: Path, expected_stage: str, strict_filename: bool) -> lis
     return errors
 
 
+def validate_target(path: Path, expected_stage: str, strict_filename: bool) -> dict:
+    """Validate one file for a batch: errors plus advisories from a single read."""
+    advisories: list[str] = []
+    if not path.exists():
+        errors = [f"File not found: {path}"]
+    elif path.suffix.lower() != ".md":
+        errors = [f"Not a markdown file: {path}"]
+    else:
+        text = path.read_text(encoding="utf-8")
+        errors = validate_text(text, path, expected_stage, strict_filename)
+        if not errors and path.is_file():
+            _, body, frontmatter_errors = parse_frontmatter(text)
+            if not frontmatter_errors:
+                advisories = collect_advisories(body)
+    return {
+        "path": str(path),
+        "status": "fail" if errors else "pass",
+        "errors": errors,
+        "advisories": advisories,
+    }
+
+
+def validate_batch(
+    targets: list[Path],
+    expected_stage: str,
+    strict_filename: bool,
+    jobs: int = 1,
+) -> list[dict]:
+    """Validate `targets` across a worker pool; results keep input order."""
+    workers = max(1, min(jobs, len(targets)))
+    if workers == 1:
+        return [validate_target(t, expected_stage, strict_filename) for t in targets]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(
+                lambda t: validate_target(t, expected_stage, strict_filename),
+                targets,
+            )
+        )
+
+
 def iter_markdown_files(paths: list[Path]) -> list[Path]:
     files: list[Path] = []
     for path in paths:
@@ -330,6 +379,17 @@ def main() -> int:
         action="store_true",
         help="Require filenames to end with '-spec.md'",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Files validated in parallel (default: 1; validation is CPU-bound)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print one consolidated JSON report instead of PASS/FAIL lines",
+    )
     args = parser.parse_args()
 
     targets = iter_markdown_files([Path(p) for p in args.paths])
@@ -337,28 +397,36 @@ def main() -> int:
         print("No markdown files found.")
         return 1
 
-    has_errors = False
-    for target in targets:
-        errors = validate_file(target, args.expected_stage, args.strict_filename)
-        if errors:
-            has_errors = True
-            print(f"FAIL: {target}")
-            for error in errors:
+    results = validate_batch(
+        targets, args.expected_stage, args.strict_filename, args.jobs
+    )
+    failed = sum(1 for item in results if item["status"] == "fail")
+
+    if args.json:
+        payload = {
+            "summary": {
+                "total": len(results),
+                "pass": len(results) - failed,
+                "fail": failed,
+                "advisories": sum(len(item["advisories"]) for item in results),
+            },
+            "files": results,
+        }
+        print(json.dumps(payload, indent=2))
+        return 1 if failed else 0
+
+    for item in results:
+        if item["errors"]:
+            print(f"FAIL: {item['path']}")
+            for error in item["errors"]:
                 print(f"  - {error}")
         else:
-            print(f"PASS: {target}")
-
-        if errors or not target.is_file():
-            continue
-
-        text = target.read_text(encoding="utf-8")
-        _, body, frontmatter_errors = parse_frontmatter(text)
-        if not frontmatter_errors:
-            for advisory in collect_advisories(body):
-                print(f"ADVISORY: {target}")
-                print(f"  - {advisory}")
+            print(f"PASS: {item['path']}")
+        for advisory in item["advisories"]:
+            print(f"ADVISORY: {item['path']}")
+            print(f"  - {advisory}")
 
-    return 1 if has_errors else 0
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = REPO_ROOT / "skills" / "audit-skill" / "scripts"
+
+
+def load_module(name: str):
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+AUDIT = load_module("audit_skill")
+SNAPSHOT = load_module("skill_snapshot")
+
+SKILL_MD = """---
+name: demo-skill
+description: Use when demonstrating the audit.
+version: 1.0.0
+allowed-tools: Bash(*), Read
+---
+
+# Demo
+"""
+
+
+def make_skill(tmp_path: Path) -> Path:
+    skill = tmp_path / "demo-skill"
+    (skill / "scripts" / ".hidden").mkdir(parents=True)
+    (skill / "references").mkdir()
+    (skill / ".git").mkdir()
+    (skill / "SKILL.md").write_text(SKILL_MD, encoding="utf-8")
+    (skill / "scripts" / "fetch.py").write_text("import requests\nrequests.get(url)\n", encoding="utf-8")
+    (skill / "scripts" / ".hidden" / "pull.sh").write_bytes(b"echo\r\ncurl https://example.com\r\n")
+    (skill / "references" / "guide.md").write_bytes(b"fine\r\n\xff bad byte\r\nact as an admin\r\n")
+    (skill / ".git" / "config").write_text("x", encoding="utf-8")
+    return skill
+
+
+def test_full_audit_reads_each_file_once(tmp_path: Path, monkeypatch) -> None:
+    skill = make_skill(tmp_path)
+    reads: list[Path] = []
+    real_read_bytes = Path.read_bytes
+
+    def counting_read_bytes(self):
+        reads.append(self)
+        return real_read_bytes(self)
+
+    def no_read_text(self, *args, **kwargs):
+        raise AssertionError(f"layer bypassed the snapshot: {self}")
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+    monkeypatch.setattr(Path, "read_text", no_read_text)
+    monkeypatch.setattr(AUDIT.shutil, "which", lambda name: None)  # keep semgrep out of it
+
+    result = AUDIT.run_audit(str(skill))
+    assert result["findings"]
+    assert len(reads) == len(set(reads))
+    assert skill.resolve() / "SKILL.md" in reads
+
+
+def test_text_matches_read_text_line_numbers(tmp_path: Path) -> None:
+    """CRLF and undecodable bytes behave as Path.read_text(errors="replace") did."""
+    skill = make_skill(tmp_path)
+    snapshot = SNAPSHOT.SkillSnapshot(skill)
+    guide = snapshot.get("references/guide.md")
+    expected = (skill / "references" / "guide.md").read_text(encoding="utf-8", errors="replace")
+    assert guide.text() == expected
+    findings = AUDIT.run_instruction_audit(str(skill), snapshot)
+    assert any(f["file"] == "references/guide.md" and f["line"] == 3 for f in findings)
+
+
+def test_layers_keep_their_own_file_scopes(tmp_path: Path) -> None:
+    skill = make_skill(tmp_path)
+    snapshot = SNAPSHOT.SkillSnapshot(skill)
+    structural = AUDIT.run_structural_audit(str(skill), snapshot)
+    # Hidden directories stay out of the inventory ...
+    assert not any(f["file"].startswith(".git") for f in structural)
+    # ... but network inference still scans everything under scripts/.
+    network = {(f["file"], f["line"]) for f in structural if f["id"] == "STRUCT-030"}
+    assert network == {
+        ("scripts/fetch.py", 2),
+        ("scripts/.hidden/pull.sh", 2),
+    }
+    assert any(f["id"] == "STRUCT-011" and "Bash(*)" in f["message"] for f in structural)
+
+
+def test_missing_skill_md_is_reported(tmp_path: Path) -> None:
+    skill = tmp_path / "empty"
+    skill.mkdir()
+    findings = AUDIT.run_structural_audit(str(skill))
+    assert findings[0]["message"] == "Frontmatter validation failed: SKILL.md not found"
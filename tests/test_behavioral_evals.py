@@ -3,6 +3,8 @@ from __future__ import annotations
 import importlib.util
 from pathlib import Path
 
+import pytest
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SCRIPT_PATH = REPO_ROOT / "scripts" / "behavioral_evals.py"
@@ -98,3 +100,153 @@ def test_gated_off_by_default(tmp_path: Path, monkeypatch):
 
     assert module.main() == 0  # opt-in notice, clean exit
     assert called["runner"] is False  # never invoked the agent
+
+
+def _routing_runner(calls: list[str]):
+    """Stub agent: routes each prompt to the skill its trigger belongs to."""
+    trigger_to_skill = {"debug this": "diagnose", "diagnose this": "diagnose", "create a handoff": "handoff"}
+
+    def runner(prompt: str) -> str:
+        calls.append(prompt)
+        for trig, skill in trigger_to_skill.items():
+            if f'"{trig}"' in prompt:
+                return skill
+        return "unknown"
+
+    return runner
+
+
+def test_concurrent_run_is_bounded_and_keeps_case_order():
+    import threading
+    import time
+
+    module = load_module()
+    catalog = [
+        {"name": f"skill-{i}", "description": f"Skill {i}.", "triggers": [f"trigger {i}"]}
+        for i in range(8)
+    ]
+    lock = threading.Lock()
+    active = {"now": 0, "max": 0}
+
+    def runner(prompt: str) -> str:
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        # Later cases finish first, so completion order differs from case order.
+        index = int(prompt.split('"trigger ')[1][0])
+        time.sleep(0.02 * (8 - index))
+        with lock:
+            active["now"] -= 1
+        return f"skill-{index}"
+
+    report = module.run_evals(catalog, runner, jobs=3)
+    assert active["max"] == 3
+    assert [r["skill"] for r in report["results"]] == [f"skill-{i}" for i in range(8)]
+    assert report["summary"]["failed"] == 0
+
+
+def test_cached_replies_are_not_asked_again(tmp_path: Path):
+    module = load_module()
+    path = tmp_path / "replies.json"
+    first_calls: list[str] = []
+    cache = module.ResponseCache(path, "agent-a")
+    first = module.run_evals(CATALOG, _routing_runner(first_calls), jobs=2, cache=cache)
+    assert len(first_calls) == 3
+
+    second_calls: list[str] = []
+    second = module.run_evals(CATALOG, _routing_runner(second_calls), cache=module.ResponseCache(path, "agent-a"))
+    assert second_calls == []
+    assert second == first
+
+    # A different agent command, or a changed prompt, misses the cache.
+    other_calls: list[str] = []
+    module.run_evals(CATALOG, _routing_runner(other_calls), cache=module.ResponseCache(path, "agent-b"))
+    assert len(other_calls) == 3
+    edited = [dict(CATALOG[0], description="Debug very hard bugs."), CATALOG[1]]
+    edited_calls: list[str] = []
+    module.run_evals(edited, _routing_runner(edited_calls), cache=module.ResponseCache(path, "agent-a"))
+    assert len(edited_calls) == 3  # the catalog is part of every prompt
+
+
+def test_checkpoint_resumes_a_failed_run(tmp_path: Path):
+    module = load_module()
+    path = tmp_path / "checkpoint.jsonl"
+    calls: list[str] = []
+    routing = _routing_runner(calls)
+
+    def flaky(prompt: str) -> str:
+        if '"create a handoff"' in prompt:
+            raise RuntimeError("agent crashed")
+        return routing(prompt)
+
+    with pytest.raises(RuntimeError, match="agent crashed"):
+        module.run_evals(CATALOG, flaky, checkpoint=module.Checkpoint(path, "agent"))
+    assert len(module.Checkpoint(path, "agent").replies) == 2
+    path.write_text(path.read_text(encoding="utf-8") + '{"torn', encoding="utf-8")
+
+    calls.clear()
+    report = module.run_evals(CATALOG, routing, checkpoint=module.Checkpoint(path, "agent"))
+    assert [c for c in calls if '"create a handoff"' in c] == calls and len(calls) == 1
+    assert report["summary"] == {"cases": 3, "passed": 3, "failed": 0}
+    assert not path.exists()  # cleared once every case has a reply
+
+
+def test_main_wires_cache_and_jobs(tmp_path: Path, monkeypatch, capsys):
+    module = load_module()
+    skills_root = tmp_path / "skills"
+    (skills_root / "diagnose").mkdir(parents=True)
+    (skills_root / "diagnose" / "SKILL.md").write_text(
+        "---\nname: diagnose\ndescription: Debug hard bugs.\nversion: 1.0.0\ntriggers:\n  - debug this\n---\n",
+        encoding="utf-8",
+    )
+    calls: list[str] = []
+    monkeypatch.setattr(module, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(module, "default_runner", _routing_runner(calls))
+    monkeypatch.setenv("DOJO_BEHAVIORAL_EVALS", "1")
+    monkeypatch.setenv("DOJO_BEHAVIORAL_AGENT", "stub-agent")
+    for argv, expected_calls in ((["--jobs", "2"], 1), ([], 1), (["--no-cache"], 2)):
+        monkeypatch.setattr("sys.argv", ["behavioral", "--skills-root", str(skills_root), *argv])
+        assert module.main() == 0
+        assert len(calls) == expected_calls
+    assert "stub-agent" in (tmp_path / "cache" / "replies.json").read_text(encoding="utf-8")
+    assert "1/1 routed correctly" in capsys.readouterr().out
+
+
+def test_unwritable_cache_never_masks_or_fails_a_run(tmp_path: Path):
+    module = load_module()
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")  # parent of every cache path is a file
+    cache = module.ResponseCache(blocker / "replies.json", "agent")
+    checkpoint = module.Checkpoint(blocker / "checkpoint.jsonl", "agent")
+
+    report = module.run_evals(CATALOG, _routing_runner([]), cache=cache, checkpoint=checkpoint)
+    assert report["summary"]["passed"] == 3
+
+    def crashing(prompt: str) -> str:
+        raise RuntimeError("agent crashed")
+
+    with pytest.raises(RuntimeError, match="agent crashed"):
+        module.run_evals(CATALOG, crashing, cache=module.ResponseCache(blocker / "replies.json", "agent"))
+    assert list(tmp_path.iterdir()) == [blocker]
+
+
+def test_no_cache_does_not_replay_the_checkpoint(tmp_path: Path, monkeypatch):
+    module = load_module()
+    skills_root = tmp_path / "skills"
+    (skills_root / "diagnose").mkdir(parents=True)
+    (skills_root / "diagnose" / "SKILL.md").write_text(
+        "---\nname: diagnose\ndescription: Debug hard bugs.\nversion: 1.0.0\ntriggers:\n  - debug this\n---\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(module, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setenv("DOJO_BEHAVIORAL_EVALS", "1")
+    monkeypatch.setenv("DOJO_BEHAVIORAL_AGENT", "stub-agent")
+    catalog = module.build_catalog(skills_root)
+    prompt = module.build_prompt(catalog, "debug this")
+    module.Checkpoint(tmp_path / "cache" / "checkpoint.jsonl", "stub-agent").record(prompt, "handoff")
+
+    calls: list[str] = []
+    monkeypatch.setattr(module, "default_runner", _routing_runner(calls))
+    monkeypatch.setattr("sys.argv", ["behavioral", "--skills-root", str(skills_root), "--no-cache"])
+    assert module.main() == 0
+    assert len(calls) == 1
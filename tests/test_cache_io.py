@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_PATH = REPO_ROOT / "skills" / "skill-evals" / "scripts" / "cache_io.py"
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("cache_io", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+cache_io = load_module()
+
+
+def test_write_replaces_the_file_and_creates_parents(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "entry.json"
+    assert cache_io.write_json_atomic(path, {"b": 1, "a": 2}, sort_keys=True)
+    assert cache_io.write_json_atomic(path, {"a": 3})
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": 3}
+    assert cache_io.write_atomic(tmp_path / "blob.bin", b"\x00\x01")
+    assert (tmp_path / "blob.bin").read_bytes() == b"\x00\x01"
+    assert sorted(p.name for p in tmp_path.rglob("*.tmp")) == []
+
+
+def test_unwritable_target_reports_false_and_leaves_nothing(tmp_path: Path) -> None:
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+    assert cache_io.write_json_atomic(blocker / "entry.json", {"a": 1}) is False
+
+    # The rename fails after the temp file was written: it must be removed.
+    target = tmp_path / "occupied"
+    target.mkdir()
+    (target / "keep").write_text("", encoding="utf-8")
+    assert cache_io.write_atomic(target, "data") is False
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["not-a-dir", "occupied"]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_PATH = REPO_ROOT / "scripts" / "catalog_check.py"
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("catalog_check", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+MODULE = load_module()
+
+
+@pytest.fixture(scope="module")
+def results():
+    return MODULE.run_checks(MODULE.Snapshot.load())
+
+
+def test_each_check_matches_its_standalone_script(results):
+    """Exit codes and messages must be exactly what the separate CI steps printed."""
+    assert [r.name for r in results] == MODULE.CHECK_NAMES
+    for result in results:
+        proc = subprocess.run(
+            [sys.executable, *result.command.split()],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        assert (result.exit_code, result.stdout, result.stderr) == (
+            proc.returncode,
+            proc.stdout,
+            proc.stderr,
+        ), result.name
+
+
+def test_contract_report_matches_json_mode(results):
+    contract = next(r for r in results if r.name == "contract")
+    proc = subprocess.run(
+        [sys.executable, *contract.command.split(), "--json"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert json.dumps(contract.data, indent=2) + "\n" == proc.stdout
+
+
+def test_checks_reuse_the_snapshot_instead_of_rereading_skill_md(monkeypatch):
+    snapshot = MODULE.Snapshot.load()
+    reads: list[Path] = []
+    real_read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        if self.name == "SKILL.md":
+            reads.append(self)
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    # The link check keeps its own mtime-keyed graph of every markdown file.
+    names = [name for name in MODULE.CHECK_NAMES if name != "links"]
+    results = MODULE.run_checks(snapshot, names)
+    assert all(r.ok for r in results), [(r.name, r.stderr) for r in results if not r.ok]
+    assert reads == []
+
+
+def test_a_crashing_check_fails_without_hiding_the_others(monkeypatch):
+    def boom(snapshot, stdout, stderr):
+        raise RuntimeError("simulated crash")
+
+    checks = [
+        (name, command, boom if name == "slop" else fn) for name, command, fn in MODULE.CHECKS
+    ]
+    monkeypatch.setattr(MODULE, "CHECKS", checks)
+    results = MODULE.run_checks(MODULE.Snapshot.load(), ["manifest", "slop"], jobs=2)
+    by_name = {r.name: r for r in results}
+    assert by_name["manifest"].ok
+    assert by_name["slop"].exit_code == 1
+    assert "simulated crash" in by_name["slop"].stderr
+    assert MODULE.exit_code(results) == 1
+
+
+def test_cli_writes_reports(tmp_path: Path, capsys):
+    report = tmp_path / "report.json"
+    summary = tmp_path / "summary.md"
+    contract_json = tmp_path / "contract.json"
+    code = MODULE.main([
+        "--only", "contract,manifest",
+        "--json", str(report),
+        "--markdown", str(summary),
+        "--contract-json", str(contract_json),
+    ])
+    out = capsys.readouterr().out
+    assert code == 0
+    assert "== contract: PASS" in out
+    assert "Manifest is up to date." in out
+    payload = json.loads(report.read_text(encoding="utf-8"))
+    assert [c["name"] for c in payload["checks"]] == ["contract", "manifest"]
+    assert payload["exit_code"] == 0
+    assert "| manifest | pass |" in summary.read_text(encoding="utf-8")
+    assert json.loads(contract_json.read_text(encoding="utf-8"))["summary"]["strict"] is True
+
+
+def test_cli_rejects_unknown_check(capsys):
+    with pytest.raises(SystemExit) as exc:
+        MODULE.main(["--only", "nope"])
+    assert exc.value.code == 2
+    assert "unknown check(s): nope" in capsys.readouterr().err
+
+
+def test_harness_check_stays_read_only(monkeypatch):
+    """CI must never create the local-only catalog links (see test_profiles_automation_authority)."""
+    seen = {}
+
+    def fake_run(repo_root, skills_root, **kwargs):
+        seen.update(kwargs)
+        return 0
+
+    monkeypatch.setattr(MODULE.gen_harness_adapters, "run", fake_run)
+    MODULE.run_checks(MODULE.Snapshot.load(), ["harness-adapters"])
+    assert seen["check"] is True
+    assert seen["skip_symlinks"] is True
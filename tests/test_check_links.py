@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.util
+import sys
 from pathlib import Path
 
 
@@ -11,6 +12,7 @@ SCRIPT_PATH = REPO_ROOT / "scripts" / "check_links.py"
 def load_module():
     spec = importlib.util.spec_from_file_location("check_links", SCRIPT_PATH)
     module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
     assert spec.loader is not None
     spec.loader.exec_module(module)
     return module
@@ -157,3 +159,77 @@ def test_clean_checkout_matches_working_tree() -> None:
     for path in MODULE.markdown_files(MODULE.SKILLS_ROOT, MODULE.LIVING_DOCS):
         rel = path.relative_to(MODULE.REPO_ROOT).as_posix()
         assert rel in tracked, f"{rel} is scanned by the gate but not tracked in git"
+
+
+def test_graph_reparses_only_changed_files(tmp_path: Path) -> None:
+    root = tmp_path / "skills"
+    make_skill(root, "alpha", "Nothing.\n")
+    beta = make_skill(root, "beta", "Nothing.\n")
+    graph = MODULE.LinkGraph()
+    assert MODULE.check(root, [], graph=graph) == []
+    assert MODULE.check(root, [], graph=graph) == []
+    assert graph.refresh(MODULE.markdown_files(root, [])) == []
+
+    (beta / "SKILL.md").write_text("See [gone](./missing.md) and more text.\n", encoding="utf-8")
+    assert graph.refresh(MODULE.markdown_files(root, [])) == [str(beta / "SKILL.md")]
+    assert graph.problems(MODULE.known_skills(root)) == [f"{beta / 'SKILL.md'}: broken link -> ./missing.md"]
+
+
+def test_deleting_a_target_flags_the_files_that_pointed_at_it(tmp_path: Path) -> None:
+    """Existence is re-checked every run, so a cached graph cannot hide a deletion."""
+    root = tmp_path / "skills"
+    a = make_skill(root, "alpha", "See [detail](./references/detail.md).\n")
+    make_skill(root, "beta", "Unrelated.\n")
+    (a / "references").mkdir()
+    detail = a / "references" / "detail.md"
+    detail.write_text("x", encoding="utf-8")
+    graph = MODULE.LinkGraph()
+    assert MODULE.check(root, [], graph=graph) == []
+
+    detail.unlink()
+    problems = MODULE.check(root, [], graph=graph)
+    assert problems == [f"{a / 'SKILL.md'}: broken link -> ./references/detail.md"]
+
+
+def test_graph_round_trips_through_disk(tmp_path: Path) -> None:
+    root = tmp_path / "skills"
+    make_skill(root, "alpha", "## Sibling skills\n\n- `beta-skill` — other.\n")
+    graph = MODULE.LinkGraph()
+    first = MODULE.check(root, [], graph=graph)
+    cache = tmp_path / "graph.json"
+    graph.save(cache)
+
+    loaded = MODULE.LinkGraph.load(cache)
+    assert loaded.refresh(MODULE.markdown_files(root, [])) == []
+    assert MODULE.check(root, [], graph=loaded) == first
+
+
+def test_unreadable_or_foreign_graph_starts_cold(tmp_path: Path) -> None:
+    cache = tmp_path / "graph.json"
+    cache.write_text("not json", encoding="utf-8")
+    assert MODULE.LinkGraph.load(cache).files == {}
+    cache.write_text('{"version": 1, "repo_root": "/elsewhere", "files": {}}', encoding="utf-8")
+    assert MODULE.LinkGraph.load(cache).files == {}
+
+
+def test_referrers_answers_what_links_to_a_skill(tmp_path: Path, monkeypatch) -> None:
+    repo = tmp_path
+    root = repo / "skills"
+    monkeypatch.setattr(MODULE, "REPO_ROOT", repo)
+    monkeypatch.setattr(MODULE, "SKILLS_ROOT", root)
+    make_skill(root, "retired", "Old.\n")
+    make_skill(root, "by-path", "Run `python3 skills/retired/scripts/go.py`.\n")
+    make_skill(root, "by-sibling", "## Sibling skills\n\n- `retired` — gone soon.\n")
+    make_skill(root, "by-link", "See [it](../retired/SKILL.md).\n")
+    make_skill(root, "bystander", "Nothing.\n")
+    graph = MODULE.LinkGraph()
+    MODULE.check(root, [], graph=graph)
+
+    expected = [
+        "skills/by-link/SKILL.md",
+        "skills/by-path/SKILL.md",
+        "skills/by-sibling/SKILL.md",
+    ]
+    assert graph.referrers("skills/retired") == expected
+    assert graph.referrers("retired/") == expected
+    assert graph.referrers("skills/retired/SKILL.md") == ["skills/by-link/SKILL.md"]
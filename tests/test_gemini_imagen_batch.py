@@ -0,0 +1,255 @@
+"""Tests for gemini-imagen's `batch` subcommand, run against a fake client."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_PATH = REPO_ROOT / "skills" / "gemini-imagen" / "scripts" / "generate_image.py"
+JPEG = b"\xff\xd8\xff fake jpeg"
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("generate_image", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class ServerError(Exception):
+    def __init__(self, code: int, message: str = "") -> None:
+        super().__init__(f"{code} {message}")
+        self.code = code
+
+
+class FakeModels:
+    def __init__(self, failures: dict[str, list[Exception]] | None = None) -> None:
+        self.failures = failures or {}
+        self.calls: list[dict] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def generate_content(self, *, model, contents, config):
+        self.calls.append({"model": model, "contents": contents, "config": config})
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            queued = self.failures.get(contents[0], [])
+            if queued:
+                raise queued.pop(0)
+            part = SimpleNamespace(text=None, inline_data=SimpleNamespace(data=JPEG, mime_type="image/jpeg"))
+            return SimpleNamespace(parts=[SimpleNamespace(text="ok", inline_data=None), part])
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def module(monkeypatch):
+    module = load_module()
+    monkeypatch.setattr(module, "build_config", lambda resolution, aspect: {"size": resolution, "aspect": aspect})
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    return module
+
+
+def run_cli(module, monkeypatch, argv: list[str]) -> int:
+    monkeypatch.setattr(sys, "argv", ["generate_image.py", *argv])
+    try:
+        module.main()
+    except SystemExit as exc:
+        return int(exc.code or 0)
+    return 0
+
+
+def write_jobs(tmp_path: Path, lines: list) -> Path:
+    path = tmp_path / "jobs.jsonl"
+    path.write_text(
+        "\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines) + "\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_batch_shares_one_client_and_bounds_concurrency(module, tmp_path, monkeypatch) -> None:
+    models = FakeModels()
+    created: list[str] = []
+
+    def fake_client(api_key: str):
+        created.append(api_key)
+        return SimpleNamespace(aio=SimpleNamespace(models=models))
+
+    monkeypatch.setattr(module, "create_client", fake_client)
+    jobs = write_jobs(tmp_path, [f"poster number {n}" for n in range(6)] + [
+        {"prompt": "hero shot", "filename": "hero.jpg", "resolution": "4K", "aspect": "16:9"},
+    ])
+    out = tmp_path / "out"
+
+    code = run_cli(module, monkeypatch, ["batch", "--input", str(jobs), "--out-dir", str(out), "--concurrency", "2"])
+
+    assert code == 0
+    assert created == ["test-key"]
+    assert models.peak == 2
+    assert (out / "hero.jpg").read_bytes() == JPEG
+    assert (out / "001-poster-number-0.jpg").exists()
+    hero_call = next(call for call in models.calls if call["contents"] == ["hero shot"])
+    assert hero_call["config"] == {"size": "4K", "aspect": "16:9"}
+    summary = json.loads((out / "batch-summary.json").read_text(encoding="utf-8"))
+    assert summary["total"] == 7 and summary["ok"] == 7
+    assert [job["job"] for job in summary["jobs"]] == list(range(1, 8))
+    assert summary["jobs"][0]["text"] == "ok"
+
+
+def test_transient_errors_are_retried_and_permanent_ones_are_recorded(module, tmp_path, monkeypatch) -> None:
+    models = FakeModels({
+        "flaky": [ServerError(429, "RESOURCE_EXHAUSTED"), ServerError(503, "UNAVAILABLE")],
+        "refused": [ServerError(400, "INVALID_ARGUMENT")],
+    })
+    monkeypatch.setattr(module, "create_client", lambda key: SimpleNamespace(aio=SimpleNamespace(models=models)))
+    monkeypatch.setattr(module, "retry_delay", lambda exc, attempt: 0.0)
+    jobs = write_jobs(tmp_path, ["flaky", "refused", "steady"])
+    out = tmp_path / "out"
+    summary_path = tmp_path / "summary.json"
+
+    code = run_cli(module, monkeypatch, [
+        "batch", "--input", str(jobs), "--out-dir", str(out), "--summary", str(summary_path),
+    ])
+
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    by_job = {job["job"]: job for job in summary["jobs"]}
+    assert code == 1
+    assert by_job[1]["status"] == "ok" and by_job[1]["attempts"] == 3
+    assert by_job[2]["status"] == "failed" and by_job[2]["attempts"] == 1
+    assert "INVALID_ARGUMENT" in by_job[2]["error"]
+    assert by_job[3]["status"] == "ok"
+
+
+def test_retry_backoff_releases_the_concurrency_slot(module, tmp_path, monkeypatch) -> None:
+    models = FakeModels({"flaky": [ServerError(503, "UNAVAILABLE")]})
+    monkeypatch.setattr(module, "create_client", lambda key: SimpleNamespace(aio=SimpleNamespace(models=models)))
+    monkeypatch.setattr(module, "retry_delay", lambda exc, attempt: 0.2)
+    jobs = write_jobs(tmp_path, ["flaky", "steady"])
+
+    code = run_cli(module, monkeypatch, [
+        "batch", "--input", str(jobs), "--out-dir", str(tmp_path / "out"), "--concurrency", "1",
+    ])
+
+    assert code == 0
+    # "steady" ran while "flaky" was backing off, not after its retry.
+    assert [call["contents"][0] for call in models.calls] == ["flaky", "steady", "flaky"]
+
+
+def test_input_preparation_is_bounded_by_concurrency(module, tmp_path, monkeypatch) -> None:
+    models = FakeModels({"flaky": [ServerError(503, "UNAVAILABLE")]})
+    monkeypatch.setattr(module, "create_client", lambda key: SimpleNamespace(aio=SimpleNamespace(models=models)))
+    monkeypatch.setattr(module, "retry_delay", lambda exc, attempt: 0.05)
+    held: list[int] = []
+    live = {"count": 0}
+    send = models.generate_content
+
+    def fake_build(job, resolution, optimize):
+        live["count"] += 1
+        held.append(live["count"])
+        return [job["prompt"]], 0, 0
+
+    async def sending(**kwargs):
+        try:
+            return await send(**kwargs)
+        finally:
+            live["count"] -= 1  # the request is done with its inputs
+
+    monkeypatch.setattr(module, "build_job_contents", fake_build)
+    monkeypatch.setattr(models, "generate_content", sending)
+    jobs = write_jobs(tmp_path, ["flaky", *[f"poster {n}" for n in range(5)]])
+
+    code = run_cli(module, monkeypatch, [
+        "batch", "--input", str(jobs), "--out-dir", str(tmp_path / "out"), "--concurrency", "2",
+    ])
+
+    assert code == 0
+    # Seven preparations (one retry), never more than two jobs' inputs alive at once.
+    assert len(held) == 7
+    assert max(held) <= 2
+
+
+def test_fail_fast_abort_still_writes_the_summary(module, tmp_path, monkeypatch) -> None:
+    models = FakeModels({"refused": [ServerError(400, "INVALID_ARGUMENT")]})
+    monkeypatch.setattr(module, "create_client", lambda key: SimpleNamespace(aio=SimpleNamespace(models=models)))
+    read_calls: list[Path] = []
+    real_read_jobs = module.read_jobs
+    monkeypatch.setattr(module, "read_jobs", lambda path: read_calls.append(path) or real_read_jobs(path))
+    jobs = write_jobs(tmp_path, ["refused", "slow one", "slow two", "never started"])
+    out = tmp_path / "out"
+
+    code = run_cli(module, monkeypatch, [
+        "batch", "--input", str(jobs), "--out-dir", str(out), "--concurrency", "3", "--fail-fast",
+    ])
+
+    assert code == 1
+    assert read_calls == [jobs]
+    summary = json.loads((out / "batch-summary.json").read_text(encoding="utf-8"))
+    assert "INVALID_ARGUMENT" in summary["aborted"]
+    assert summary["total"] == 4 and summary["failed"] == 1
+    statuses = {job["job"]: job["status"] for job in summary["jobs"]}
+    assert statuses[1] == "failed"
+    assert all(statuses[n] in {"ok", "cancelled"} for n in statuses if n != 1)
+    assert summary["cancelled"] + summary["ok"] + summary["failed"] + summary["not_started"] == 4
+
+
+def test_invalid_job_file_fails_before_any_call(module, tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(module, "create_client", lambda key: pytest.fail("client must not be created"))
+    jobs = write_jobs(tmp_path, [{"command": "compose", "prompt": "merge", "input_images": []}])
+
+    code = run_cli(module, monkeypatch, ["batch", "--input", str(jobs), "--out-dir", str(tmp_path / "out")])
+
+    assert code == 1
+
+
+def test_retry_delay_prefers_server_hint() -> None:
+    module = load_module()
+    assert module.retry_delay(ServerError(429, "retryDelay: '7s'"), 1) == 7.0
+    assert module.retry_delay(ServerError(503), 3) == 8.0
+
+
+def test_upload_savings_report() -> None:
+    module = load_module()
+    assert module.format_upload_savings(24_000_000, 600_000) == (
+        "Upload optimisation: 24.00 MB -> 0.60 MB (saved 23.40 MB, 98%)"
+    )
+    assert module.format_upload_savings(0, 0).endswith("(saved 0.00 MB, 0%)")
+
+
+def test_inputs_are_downsized_to_the_target_resolution(tmp_path: Path) -> None:
+    pil = pytest.importorskip("PIL.Image")
+    module = load_module()
+    photo = tmp_path / "photo.png"
+    pil.new("RGB", (4000, 3000), (120, 80, 40)).save(photo)
+
+    data, mime, original = module.encode_for_upload(str(photo), module.RESOLUTION_MAX_DIM["1K"])
+
+    from io import BytesIO
+
+    assert mime == "image/jpeg"
+    assert original == photo.stat().st_size
+    assert pil.open(BytesIO(data)).size == (1024, 768)
+
+
+def test_small_inputs_with_alpha_keep_their_original_bytes(tmp_path: Path) -> None:
+    pil = pytest.importorskip("PIL.Image")
+    module = load_module()
+    icon = tmp_path / "icon.png"
+    pil.new("RGBA", (64, 64), (0, 0, 0, 0)).save(icon)
+
+    data, mime, original = module.encode_for_upload(str(icon), 1024)
+
+    assert mime == "image/png"
+    assert len(data) <= original
@@ -0,0 +1,322 @@
+"""Tests for gpt-imagen's `generate-batch` pipeline, run against a stub client."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import importlib.util
+import json
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_PATH = REPO_ROOT / "skills" / "gpt-imagen" / "scripts" / "image_gen.py"
+PIXEL = base64.b64encode(b"not-really-a-png").decode("ascii")
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("image_gen", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class StubImages:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.calls: list[dict] = []
+
+    async def generate(self, **payload):
+        self.calls.append(payload)
+        await asyncio.sleep(self.delay)
+        n = int(payload.get("n", 1))
+        return SimpleNamespace(data=[SimpleNamespace(b64_json=PIXEL) for _ in range(n)])
+
+
+def write_jobs(tmp_path: Path, prompts: list[str]) -> Path:
+    path = tmp_path / "jobs.jsonl"
+    path.write_text("\n".join(json.dumps({"prompt": p}) for p in prompts) + "\n", encoding="utf-8")
+    return path
+
+
+def run_cli(module, monkeypatch, argv: list[str]) -> int:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(sys, "argv", ["image_gen.py", *argv])
+    try:
+        return module.main()
+    except SystemExit as exc:
+        return int(exc.code or 0)
+
+
+@pytest.fixture
+def module():
+    return load_module()
+
+
+def test_postprocessing_runs_off_the_event_loop_thread(module, tmp_path, monkeypatch) -> None:
+    client = SimpleNamespace(images=StubImages())
+    monkeypatch.setattr(module, "_create_async_client", lambda: client)
+    threads: list[str] = []
+    original = module._decode_write_and_downscale
+
+    def recording(*args, **kwargs):
+        threads.append(threading.current_thread().name)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(module, "_decode_write_and_downscale", recording)
+    jobs = write_jobs(tmp_path, ["a red fox", "a blue whale", "a green frog"])
+    out = tmp_path / "out"
+
+    code = run_cli(module, monkeypatch, [
+        "generate-batch", "--input", str(jobs), "--out-dir", str(out), "--postprocess-workers", "2",
+    ])
+
+    assert code == 0
+    assert len(threads) == 3
+    assert all(name.startswith("image-postprocess") for name in threads)
+    assert sorted(p.name for p in out.iterdir()) == [
+        "001-a-red-fox.png",
+        "002-a-blue-whale.png",
+        "003-a-green-frog.png",
+    ]
+    assert (out / "001-a-red-fox.png").read_bytes() == b"not-really-a-png"
+
+
+def test_dry_run_output_is_unchanged_by_the_pool_options(module, tmp_path, monkeypatch, capsys) -> None:
+    jobs = write_jobs(tmp_path, ["a red fox"])
+    out = tmp_path / "out"
+
+    code = run_cli(module, monkeypatch, [
+        "generate-batch", "--input", str(jobs), "--out-dir", str(out), "--dry-run",
+        "--postprocess-workers", "3",
+    ])
+
+    printed = json.loads(capsys.readouterr().out)
+    assert code == 0
+    assert printed["outputs"] == [str(out / "001-a-red-fox.png")]
+    assert "postprocess_workers" not in printed
+
+
+def test_existing_output_still_aborts_without_force(module, tmp_path, monkeypatch) -> None:
+    client = SimpleNamespace(images=StubImages())
+    monkeypatch.setattr(module, "_create_async_client", lambda: client)
+    jobs = write_jobs(tmp_path, ["a red fox"])
+    out = tmp_path / "out"
+    out.mkdir()
+    (out / "001-a-red-fox.png").write_bytes(b"paid for already")
+
+    code = run_cli(module, monkeypatch, ["generate-batch", "--input", str(jobs), "--out-dir", str(out)])
+
+    assert code == 1
+    assert (out / "001-a-red-fox.png").read_bytes() == b"paid for already"
+
+
+class FlakyImages(StubImages):
+    """Fails permanently on any prompt containing one of `failing`."""
+
+    def __init__(self, failing: set[str]) -> None:
+        super().__init__()
+        self.failing = failing
+
+    async def generate(self, **payload):
+        if any(word in payload["prompt"] for word in self.failing):
+            self.calls.append(payload)
+            raise ValueError("content policy")
+        return await super().generate(**payload)
+
+
+def test_resume_retries_only_jobs_missing_from_the_checkpoint(module, tmp_path, monkeypatch) -> None:
+    jobs = write_jobs(tmp_path, ["a red fox", "a blue whale", "a green frog"])
+    out = tmp_path / "out"
+    argv = ["generate-batch", "--input", str(jobs), "--out-dir", str(out), "--no-augment"]
+
+    first = SimpleNamespace(images=FlakyImages({"whale"}))
+    monkeypatch.setattr(module, "_create_async_client", lambda: first)
+    assert run_cli(module, monkeypatch, argv) == 1
+    journal = tmp_path / "out.checkpoint.jsonl"
+    records = [json.loads(line) for line in journal.read_text().splitlines()]
+    assert sorted(r["job"] for r in records if r["status"] == "completed") == [1, 3]
+
+    second = SimpleNamespace(images=StubImages())
+    monkeypatch.setattr(module, "_create_async_client", lambda: second)
+    assert run_cli(module, monkeypatch, [*argv, "--resume"]) == 0
+    assert [call["prompt"] for call in second.images.calls] == ["a blue whale"]
+    assert len(list(out.iterdir())) == 3
+
+
+def test_resume_regenerates_a_job_whose_payload_changed(module, tmp_path, monkeypatch) -> None:
+    jobs = tmp_path / "jobs.jsonl"
+    jobs.write_text('{"prompt": "a red fox", "out": "fox.png"}\n', encoding="utf-8")
+    out = tmp_path / "out"
+    argv = ["generate-batch", "--input", str(jobs), "--out-dir", str(out), "--resume"]
+    client = SimpleNamespace(images=StubImages())
+    monkeypatch.setattr(module, "_create_async_client", lambda: client)
+
+    assert run_cli(module, monkeypatch, argv) == 0
+    assert run_cli(module, monkeypatch, argv) == 0
+    assert len(client.images.calls) == 1
+
+    # The finished image from the old payload is not partial: replacing it is
+    # a deliberate choice, so it takes --force.
+    jobs.write_text('{"prompt": "a red fox", "out": "fox.png", "quality": "high"}\n', encoding="utf-8")
+    assert run_cli(module, monkeypatch, argv) == 1
+    assert run_cli(module, monkeypatch, [*argv, "--force"]) == 0
+    assert len(client.images.calls) == 2
+    assert client.images.calls[-1]["quality"] == "high"
+
+
+def test_an_aborted_run_keeps_the_journal_and_resume_spares_finished_images(
+    module, tmp_path, monkeypatch
+) -> None:
+    jobs = write_jobs(tmp_path, ["a red fox", "a blue whale"])
+    out = tmp_path / "out"
+    argv = ["generate-batch", "--input", str(jobs), "--out-dir", str(out), "--no-augment"]
+    client = SimpleNamespace(images=StubImages())
+    monkeypatch.setattr(module, "_create_async_client", lambda: client)
+    assert run_cli(module, monkeypatch, argv) == 0
+    journal = tmp_path / "out.checkpoint.jsonl"
+    before = journal.read_text()
+
+    # A fresh run without --resume aborts on the existing outputs ...
+    assert run_cli(module, monkeypatch, argv) == 1
+    assert journal.read_text().startswith(before)
+
+    # ... and the journal still lets --resume skip both paid-for images.
+    assert run_cli(module, monkeypatch, [*argv, "--resume"]) == 0
+    assert len(client.images.calls) == 2  # the aborted run paid for nothing
+    assert (out / "001-a-red-fox.png").read_bytes() == b"not-really-a-png"
+
+
+def test_resume_overwrites_only_outputs_left_mid_write(module, tmp_path, monkeypatch) -> None:
+    jobs = write_jobs(tmp_path, ["a red fox"])
+    out = tmp_path / "out"
+    argv = ["generate-batch", "--input", str(jobs), "--out-dir", str(out), "--no-augment", "--resume"]
+    out.mkdir()
+    fox = out / "001-a-red-fox.png"
+    client = SimpleNamespace(images=StubImages())
+    monkeypatch.setattr(module, "_create_async_client", lambda: client)
+
+    # An existing file the journal knows nothing about is someone's finished image.
+    fox.write_bytes(b"someone else's image")
+    assert run_cli(module, monkeypatch, argv) == 1
+    assert fox.read_bytes() == b"someone else's image"
+    assert client.images.calls == []
+
+    # One the journal shows as started and never completed is partial.
+    fox.write_bytes(b"partial")
+    (tmp_path / "out.checkpoint.jsonl").write_text(
+        json.dumps({"job": 1, "status": "started", "payload_hash": "x", "outputs": [str(fox)]}) + "\n",
+        encoding="utf-8",
+    )
+    assert run_cli(module, monkeypatch, argv) == 0
+    assert fox.read_bytes() == b"not-really-a-png"
+
+
+def test_resume_regenerates_when_a_checkpointed_output_was_deleted(module, tmp_path, monkeypatch) -> None:
+    jobs = write_jobs(tmp_path, ["a red fox"])
+    out = tmp_path / "out"
+    argv = ["generate-batch", "--input", str(jobs), "--out-dir", str(out), "--resume"]
+    client = SimpleNamespace(images=StubImages())
+    monkeypatch.setattr(module, "_create_async_client", lambda: client)
+
+    assert run_cli(module, monkeypatch, argv) == 0
+    next(out.iterdir()).unlink()
+    assert run_cli(module, monkeypatch, argv) == 0
+    assert len(client.images.calls) == 2
+
+
+class RateLimitError(Exception):
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("429 Too Many Requests")
+        self.retry_after = retry_after
+
+
+class ThrottlingImages(StubImages):
+    """Answers 429 while more than `capacity` requests are in flight."""
+
+    def __init__(self, capacity: int, retry_after: float) -> None:
+        super().__init__(delay=0.02)
+        self.capacity = capacity
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self.peak = 0
+        self.rejected = 0
+
+    async def generate(self, **payload):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            if self.in_flight > self.capacity:
+                self.rejected += 1
+                await asyncio.sleep(0)
+                raise RateLimitError(self.retry_after)
+            return await super().generate(**payload)
+        finally:
+            self.in_flight -= 1
+
+
+def test_limiter_halves_once_per_congestion_event_and_regrows() -> None:
+    module = load_module()
+
+    async def scenario():
+        limiter = module._AdaptiveLimiter(8)
+        starts = [await limiter.acquire() for _ in range(4)]
+        for started in starts:
+            await limiter.release(started, "rate_limited", 0.01)
+        # Four 429s from one burst cut the window once, not four times.
+        assert limiter.window == 4.0
+        assert limiter.rate_limits == 4
+        # Additive increase: roughly one slot per window's worth of successes.
+        for _ in range(30):
+            await limiter.release(await limiter.acquire(), "ok")
+        return limiter
+
+    limiter = asyncio.run(scenario())
+    assert limiter.window == 8.0
+    assert limiter.min_window == 4.0
+
+
+def test_limiter_pauses_every_job_for_the_largest_retry_after() -> None:
+    module = load_module()
+
+    async def scenario():
+        limiter = module._AdaptiveLimiter(4)
+        a = await limiter.acquire()
+        b = await limiter.acquire()
+        await limiter.release(a, "rate_limited", 0.2)
+        await limiter.release(b, "rate_limited", 0.05)
+        waited_from = module.time.monotonic()
+        await limiter.acquire()
+        return module.time.monotonic() - waited_from
+
+    assert asyncio.run(scenario()) >= 0.18
+
+
+def test_batch_backs_off_globally_and_reports_a_summary(module, tmp_path, monkeypatch) -> None:
+    images = ThrottlingImages(capacity=2, retry_after=0.05)
+    monkeypatch.setattr(module, "_create_async_client", lambda: SimpleNamespace(images=images))
+    jobs = write_jobs(tmp_path, [f"tile number {n}" for n in range(12)])
+    out = tmp_path / "out"
+    summary_path = tmp_path / "summary.json"
+
+    code = run_cli(module, monkeypatch, [
+        "generate-batch", "--input", str(jobs), "--out-dir", str(out),
+        "--concurrency", "8", "--max-attempts", "6", "--summary", str(summary_path),
+    ])
+
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    assert code == 0
+    assert summary["totals"] == {"ok": 12, "failed": 0, "skipped": 0}
+    assert summary["window"]["max"] == 8
+    assert summary["window"]["min"] <= 2
+    assert summary["retries"] == sum(job["retries"] for job in summary["jobs"])
+    assert all(job["latency_s"] > 0 for job in summary["jobs"])
+    # A fixed window would keep hammering at 8; the shared window settles near capacity.
+    assert images.rejected < 12
@@ -292,3 +292,87 @@ def test_seeded_statistics_warning_does_not_fail_the_run(tmp_path):
                    "--executor", "terminal").returncode == 0
     assert run_cli(tmp_path, make_prompt(extra=SEEDED_FLOATING),
                    "--executor", "terminal", "--strict").returncode == 1
+
+
+# --- incremental mode -----------------------------------------------------
+
+
+INCREMENTAL_CASES = [
+    make_prompt(),
+    make_prompt(slots=True, comments=True),
+    make_prompt(rubric=False, summary=False, extra="Include `key_findings`.\n"),
+    make_prompt(extra=SEEDED_FLOATING + "\n</content>\n\n"),
+    make_prompt(extra=SEEDED_IDENTIFIED + "\n**Source floor:** report the 1.5M base rate.\n"),
+    # A second opener continues the seed region, so its identifier covers the
+    # magnitude in the bullet above it -- exactly as the whole-prompt scan sees it.
+    make_prompt(extra="**Seed sources:**\n- 43% of trades\n**Background:** arXiv 2602.19520\n"),
+    # An unclosed slot swallows text up to the next block's closing braces.
+    make_prompt(extra="**Scope:** {{SCOPE\n\n## Later\n\nstill open }}\n"),
+    make_prompt(extra="Line with a carriage\rreturn.\n**Background:** 9,000 rows\n"),
+    "",
+]
+
+
+@pytest.mark.parametrize("text", INCREMENTAL_CASES)
+def test_incremental_result_matches_a_full_evaluation(text):
+    cache = lint_prompt.BlockCache()
+    for executor in ("web", "terminal"):
+        result, _ = lint_prompt.evaluate_incremental(text, executor, cache)
+        assert result == lint_prompt.evaluate(text, executor)
+
+
+def test_blocks_open_at_headings_and_bold_lead_ins():
+    blocks = lint_prompt.split_blocks("intro\n## One\nbody\n**Two:** x\n- item\n")
+    assert [b for _, b in blocks] == ["intro\n", "## One\nbody\n", "**Two:** x\n- item\n"]
+    assert "".join(b for _, b in blocks) == "intro\n## One\nbody\n**Two:** x\n- item\n"
+
+
+def test_only_edited_blocks_are_relinted():
+    cache = lint_prompt.BlockCache()
+    text = make_prompt(extra=SEEDED_FLOATING)
+    _, first = lint_prompt.evaluate_incremental(text, "terminal", cache)
+    assert len(first) == len(lint_prompt.split_blocks(text))
+
+    edited = text.replace("1.2B trades", "1.2B trades (arXiv 2602.19520)")
+    result, second = lint_prompt.evaluate_incremental(edited, "terminal", cache)
+    assert len(second) == 1
+    assert edited.splitlines()[second[0]["line"] - 1].startswith("**Seed sources")
+    assert check(result, "seeded_statistics")["status"] == "pass"
+
+
+def test_cache_round_trips_and_ignores_other_versions(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = lint_prompt.BlockCache()
+    lint_prompt.evaluate_incremental(make_prompt(), "terminal", cache)
+    cache.save(path)
+    _, relinted = lint_prompt.evaluate_incremental(
+        make_prompt(), "terminal", lint_prompt.BlockCache.load(path))
+    assert relinted == []
+
+    path.write_text(json.dumps({"version": -1, "blocks": cache.entries}))
+    assert lint_prompt.BlockCache.load(path).entries == {}
+
+
+def test_watch_streams_block_and_result_lines(tmp_path):
+    import io
+
+    prompt = tmp_path / "prompt.md"
+    prompt.write_text(make_prompt(slots=True))
+    out = io.StringIO()
+    cache = lint_prompt.BlockCache()
+    lint_prompt.watch(prompt, "terminal", cache, interval=0.01, out=out, max_passes=1)
+    events = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert {e["event"] for e in events[:-1]} == {"block"}
+    assert events[-1]["event"] == "result"
+    assert events[-1]["status"] == "fail"
+    assert events[-1]["relinted"] == len(events) - 1
+
+
+def test_cli_cache_output_matches_plain_run(tmp_path):
+    cache = tmp_path / "lint-cache.json"
+    text = make_prompt(extra=SEEDED_FLOATING)
+    plain = run_cli(tmp_path, text, "--json")
+    cached = run_cli(tmp_path, text, "--json", "--cache", str(cache))
+    again = run_cli(tmp_path, text, "--json", "--cache", str(cache))
+    assert json.loads(plain.stdout) == json.loads(cached.stdout) == json.loads(again.stdout)
+    assert cache.is_file()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import shutil
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = REPO_ROOT / "skills" / "skill-creator" / "scripts"
+SCRIPT_PATH = SCRIPTS_DIR / "package_skill.py"
+
+
+def load_module():
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    spec = importlib.util.spec_from_file_location("package_skill", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+package_skill = load_module()
+
+
+def make_skill(root: Path, name: str, body: str = "# Skill\n") -> Path:
+    skill = root / name
+    (skill / "scripts" / "__pycache__").mkdir(parents=True)
+    (skill / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: Use when testing packaging.\n"
+        f"version: 1.0.0\nskill-type: reference\n---\n\n{body}",
+        encoding="utf-8",
+    )
+    (skill / "scripts" / "run.py").write_text("print('hi')\n", encoding="utf-8")
+    (skill / "scripts" / "__pycache__" / "run.cpython-311.pyc").write_bytes(b"\0")
+    (skill / ".DS_Store").write_bytes(b"\0")
+    return skill
+
+
+def test_archive_skips_ignored_names_and_is_sorted(tmp_path):
+    skill = make_skill(tmp_path / "skills", "demo")
+    archive = package_skill.package_skill(skill, tmp_path / "dist")
+    with zipfile.ZipFile(archive) as zf:
+        names = zf.namelist()
+        assert names == ["demo/SKILL.md", "demo/scripts/run.py"]
+        assert {info.date_time for info in zf.infolist()} == {package_skill.FIXED_DATE_TIME}
+
+
+def test_archives_are_byte_identical_across_rebuilds(tmp_path):
+    skill = make_skill(tmp_path / "skills", "demo")
+    first = package_skill.package_skill(skill, tmp_path / "a").read_bytes()
+    # A fresh mtime must not leak into the archive.
+    (skill / "SKILL.md").touch()
+    second = package_skill.package_skill(skill, tmp_path / "b").read_bytes()
+    assert first == second
+
+
+def test_catalog_packages_every_skill_and_writes_checksums(tmp_path):
+    root = tmp_path / "skills"
+    make_skill(root, "alpha")
+    make_skill(root, "beta")
+    (root / "_fragments").mkdir()
+    dist = tmp_path / "dist"
+
+    assert package_skill.package_catalog(root, dist, jobs=2)
+
+    index = json.loads((dist / package_skill.INDEX_NAME).read_text())["skills"]
+    assert sorted(index) == ["alpha", "beta"]
+    sums = (dist / package_skill.CHECKSUMS_NAME).read_text().splitlines()
+    assert sums == [
+        f"{package_skill.file_sha256(dist / name)}  {name}"
+        for name in ("alpha.skill", "beta.skill")
+    ]
+
+
+def test_catalog_skips_unchanged_skills(tmp_path, capsys):
+    root = tmp_path / "skills"
+    make_skill(root, "alpha")
+    beta = make_skill(root, "beta")
+    dist = tmp_path / "dist"
+    package_skill.package_catalog(root, dist)
+    capsys.readouterr()
+
+    (beta / "SKILL.md").write_text(
+        (beta / "SKILL.md").read_text() + "More.\n", encoding="utf-8"
+    )
+    assert package_skill.package_catalog(root, dist)
+    out = capsys.readouterr().out
+    assert "[SKIP] alpha: unchanged" in out
+    assert "[OK] beta: packaged" in out
+
+
+def test_catalog_rebuilds_a_tampered_archive(tmp_path, capsys):
+    root = tmp_path / "skills"
+    make_skill(root, "alpha")
+    dist = tmp_path / "dist"
+    package_skill.package_catalog(root, dist)
+    (dist / "alpha.skill").write_bytes(b"truncated")
+    capsys.readouterr()
+
+    package_skill.package_catalog(root, dist)
+    assert "[OK] alpha: packaged" in capsys.readouterr().out
+    assert zipfile.is_zipfile(dist / "alpha.skill")
+
+
+def test_catalog_reports_invalid_skills_without_dropping_the_rest(tmp_path):
+    root = tmp_path / "skills"
+    make_skill(root, "alpha")
+    broken = root / "broken"
+    broken.mkdir()
+    (broken / "SKILL.md").write_text("no frontmatter\n", encoding="utf-8")
+    dist = tmp_path / "dist"
+
+    assert not package_skill.package_catalog(root, dist)
+    index = json.loads((dist / package_skill.INDEX_NAME).read_text())["skills"]
+    assert list(index) == ["alpha"]
+
+
+def test_packages_without_skill_standardizer_installed(tmp_path):
+    # skill-creator installed on its own: no skill-standardizer beside it.
+    scripts = tmp_path / "install" / "skill-creator" / "scripts"
+    shutil.copytree(SCRIPTS_DIR, scripts, ignore=shutil.ignore_patterns("__pycache__"))
+    skill = make_skill(tmp_path / "skills", "demo")
+    proc = subprocess.run(
+        [sys.executable, str(scripts / "package_skill.py"), str(skill), str(tmp_path / "dist")],
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+    with zipfile.ZipFile(tmp_path / "dist" / "demo.skill") as zf:
+        assert zf.namelist() == ["demo/SKILL.md", "demo/scripts/run.py"]
+
+    # The standalone copy of the ignore rules must not drift from the library's.
+    probe = subprocess.run(
+        [sys.executable, "-c",
+         "import json, package_skill as p; "
+         "print(json.dumps([sorted(p.IGNORE_NAMES), sorted(p.IGNORE_FILE_SUFFIXES)]))"],
+        cwd=scripts, capture_output=True, text=True, check=True,
+    )
+    assert json.loads(probe.stdout) == [
+        sorted(package_skill.IGNORE_NAMES), sorted(package_skill.IGNORE_FILE_SUFFIXES),
+    ]
@@ -0,0 +1,83 @@
+"""Catalog budget profiler — one cost table, every composition derived from it.
+
+The property that matters is agreement: a curve's final demand must equal what
+`budget.demand` charges for the same members, or the profiler is a second cost
+model that can disagree with the first.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+POLICIES = REPO_ROOT / "profiles" / "policies"
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from profiles import cost_profile, definitions  # noqa: E402
+from profiles.budget import demand, load_policy  # noqa: E402
+from profiles.observe import source_descriptions  # noqa: E402
+from profiles.resolve import resolve  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def report():
+    return cost_profile.profile(
+        REPO_ROOT / "skills", REPO_ROOT / "profiles", REPO_ROOT / "skills.json", POLICIES,
+        locator_root=Path("/r"),
+    )
+
+
+def test_every_entry_is_costed_under_every_policy(report):
+    catalog = definitions.load_catalog(REPO_ROOT / "skills.json")
+    policies = {path.stem for path in POLICIES.glob("*.yaml")}
+    assert len(report["entries"]) == len(catalog) == report["catalog_size"]
+    assert all(set(row["costs"]) == policies for row in report["entries"])
+    shares = [row["max_limit_bps"] for row in report["entries"]]
+    assert shares == sorted(shares, reverse=True)
+
+
+def test_curve_demand_matches_budget_demand(report):
+    catalog = definitions.load_catalog(REPO_ROOT / "skills.json")
+    defs = definitions.load_definitions(REPO_ROOT / "profiles", catalog)
+    descriptions = source_descriptions(REPO_ROOT / "skills")
+    members = resolve(("core", "engineering"), defs, catalog).members
+    entries = [
+        {"name": n, "source_description": descriptions.get(n, ""), "locator": f"/r/{n}/SKILL.md"}
+        for n in members
+    ]
+    for key, result in report["compositions"]["core+engineering"]["policies"].items():
+        assert result["demand"] == demand(entries, load_policy(POLICIES / f"{key}.yaml"))
+        assert result["curve"][-1]["cumulative"] == result["demand"]
+
+
+def test_compositions_cover_core_each_overlay_and_full(report):
+    catalog = definitions.load_catalog(REPO_ROOT / "skills.json")
+    defs = definitions.load_definitions(REPO_ROOT / "profiles", catalog)
+    overlays = {f"core+{n}" for n, d in defs.items() if d.kind == "overlay"}
+    assert set(report["compositions"]) == {"core", "full"} | overlays
+    assert report["compositions"]["full"]["members"] == len(catalog)
+
+
+def test_curve_is_costliest_first_and_trim_is_minimal():
+    policy = load_policy(POLICIES / "codex.yaml")
+    table = {"a": {"codex": 1000}, "b": {"codex": 3000}, "c": {"codex": 500}}
+    result = cost_profile.headroom_curve(("a", "b", "c"), table, "codex", policy)
+    assert [p["skill"] for p in result["curve"]] == ["b", "a", "c"]
+    assert result["ceiling"] == 3600
+    assert result["demand"] == 4500
+    assert result["headroom"] == -900
+    assert not result["within_ceiling"]
+    assert result["fits_costliest"] == 1
+    # Dropping the single costliest entry leaves 1,500, under the ceiling.
+    assert result["trim_to_fit"] == 1
+
+
+def test_cli_json(capsys):
+    assert cost_profile.main(["--json", "--locator-root", "/r"]) == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["compositions"]["full"]["policies"]["codex"]["unit"] == "tokens"
+    assert "the Codex alias table" in payload["not_costed"]
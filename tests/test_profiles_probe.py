@@ -586,3 +586,54 @@ def test_no_fixture_captures_another_project():
     """
     for path in sorted(FIXTURES.iterdir()):
         assert "viral" not in path.name
+
+
+def _block(name: str) -> str:
+    return probe_codex.extract_block(json.loads((FIXTURES / name).read_text()))
+
+
+@pytest.mark.parametrize("name", [
+    "codex-prompt-input-dojo-2026-08-02.json",
+    "codex-prompt-input-truncating-2026-08-02.json",
+])
+def test_parse_cache_round_trips_exactly(name):
+    """A packed listing must unpack to exactly what the parser produced."""
+    block = _block(name)
+    cache = probe_codex.ParseCache()
+    fresh = probe_codex.parse_block(block, cache=None)
+    assert probe_codex.parse_block(block, cache) == fresh
+    assert probe_codex.parse_block(block, cache) == fresh
+    assert (cache.misses, cache.hits) == (1, 1)
+
+
+def test_parse_cache_hits_are_independent_listings():
+    """``classify`` mutates what it is handed; a hit must never share that state."""
+    block = _block("codex-prompt-input-dojo-2026-08-02.json")
+    cache = probe_codex.ParseCache()
+    first = probe_codex.classify(probe_codex.parse_block(block, cache), DOJO_SKILLS, CAPTURE_HOME)
+    second = probe_codex.parse_block(block, cache)
+    assert first.entries[0].origin != "unknown"
+    assert {e.origin for e in second.entries} == {"unknown"}
+
+
+def test_parse_cache_persists_on_disk_and_survives_corruption(tmp_path):
+    block = _block("codex-prompt-input-dojo-2026-08-02.json")
+    expected = probe_codex.parse_block(block, cache=None)
+    probe_codex.parse_block(block, probe_codex.ParseCache(tmp_path))
+
+    warm = probe_codex.ParseCache(tmp_path)
+    assert probe_codex.parse_block(block, warm) == expected
+    assert (warm.misses, warm.hits) == (0, 1)
+
+    (tmp_path / f"{probe_codex.block_key(block)}.bin").write_bytes(b"not zlib")
+    cold = probe_codex.ParseCache(tmp_path)
+    assert probe_codex.parse_block(block, cold) == expected
+    assert cold.misses == 1
+
+
+def test_parse_cache_never_stores_a_failed_parse():
+    cache = probe_codex.ParseCache()
+    for _ in range(2):
+        with pytest.raises(ValueError, match="neither known intro"):
+            probe_codex.parse_block("<skills_instructions>?</skills_instructions>", cache)
+    assert cache.misses == 2 and cache.hits == 0
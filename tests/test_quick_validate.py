@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import importlib.util
+import subprocess
+import sys
 from pathlib import Path
 
 
@@ -76,3 +78,32 @@ def test_rejects_numeric_prerelease_with_leading_zero(tmp_path: Path) -> None:
         False,
         "Version '1.0.0-01' must be valid SemVer, for example 1.0.0",
     )
+
+
+def test_validate_skill_text_matches_directory_validation(tmp_path: Path) -> None:
+    module = load_module()
+    for index, version_line in enumerate(("version: 1.0.0", "version: v1.0.0", None)):
+        case_dir = tmp_path / str(index)
+        case_dir.mkdir()
+        skill_dir = write_skill(case_dir, base_frontmatter(version_line))
+        content = (skill_dir / "SKILL.md").read_text(encoding="utf-8")
+        assert module.validate_skill_text(content) == module.validate_skill(skill_dir)
+
+
+def test_validate_skill_text_rejects_missing_frontmatter() -> None:
+    module = load_module()
+    assert module.validate_skill_text("# No frontmatter\n") == (
+        False,
+        "Invalid or missing YAML frontmatter",
+    )
+
+
+def test_module_import_does_not_load_yaml() -> None:
+    code = (
+        "import importlib.util, sys\n"
+        f"spec = importlib.util.spec_from_file_location('quick_validate', {str(SCRIPT_PATH)!r})\n"
+        "module = importlib.util.module_from_spec(spec)\n"
+        "spec.loader.exec_module(module)\n"
+        "assert 'yaml' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import importlib.util
+import itertools
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_PATH = REPO_ROOT / "skills" / "skill-evals" / "scripts" / "routing_matrix.py"
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("routing_matrix", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+MODULE = load_module()
+
+
+def write_skill(skills_root: Path, name: str, description: str) -> None:
+    skill_dir = skills_root / name
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: {description}\nversion: 1.0.0\n---\n\n# {name}\n",
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def skills_root(tmp_path: Path) -> Path:
+    root = tmp_path / "skills"
+    write_skill(root, "gemini-imagen", "Generate and edit images with the Gemini image API.")
+    write_skill(root, "gpt-imagen", "Generate and edit images with the OpenAI image API.")
+    write_skill(root, "write-spec", "Pin the falsifiable contract for a change.")
+    write_skill(root, "diagnose", "Debug hard bugs with a reproduction loop.")
+    return root
+
+
+def test_sparse_rows_match_brute_force_cosine():
+    skills = MODULE.build_skill_index(REPO_ROOT / "skills", None)
+    rows = MODULE.similarity_rows(skills)
+    for a, b in itertools.combinations(sorted(skills), 2):
+        va, vb = skills[a]["vector"], skills[b]["vector"]
+        expected = sum(w * vb.get(t, 0.0) for t, w in va.items())
+        assert rows[a].get(b, 0.0) == pytest.approx(expected)
+        assert rows[a].get(b, 0.0) == pytest.approx(rows[b].get(a, 0.0))
+
+
+def test_matrix_flags_overlapping_pair_with_shared_tokens(skills_root: Path):
+    matrix = MODULE.build_matrix(MODULE.build_skill_index(skills_root, None), top_k=2, threshold=0.3)
+    assert [c["skills"] for c in matrix["collisions"]] == [["gemini-imagen", "gpt-imagen"]]
+    assert {"image", "edit"} <= set(matrix["collisions"][0]["shared_tokens"])
+    assert matrix["neighbours"]["gpt-imagen"][0]["skill"] == "gemini-imagen"
+    assert all(len(near) <= 2 for near in matrix["neighbours"].values())
+    sims = [n["similarity"] for n in matrix["neighbours"]["gemini-imagen"]]
+    assert sims == sorted(sims, reverse=True)
+
+
+def test_result_is_cached_against_the_catalog_hash(skills_root: Path, tmp_path: Path, monkeypatch):
+    cache = tmp_path / "cache" / "matrix.json"
+    first, from_cache = MODULE.routing_matrix(skills_root, cache_path=cache)
+    assert not from_cache
+
+    def no_rebuild(*args, **kwargs):
+        raise AssertionError("unchanged catalog must be served from the cache")
+
+    monkeypatch.setattr(MODULE, "build_skill_index", no_rebuild)
+    again, from_cache = MODULE.routing_matrix(skills_root, cache_path=cache)
+    assert from_cache and again == first
+
+    monkeypatch.undo()
+    # Any SKILL.md edit, or a parameter change, invalidates the entry.
+    write_skill(skills_root, "screenshot", "Capture images of the screen.")
+    changed, from_cache = MODULE.routing_matrix(skills_root, cache_path=cache)
+    assert not from_cache and changed["catalog_hash"] != first["catalog_hash"]
+    _, from_cache = MODULE.routing_matrix(skills_root, top_k=1, cache_path=cache)
+    assert not from_cache
+
+
+def test_check_exits_nonzero_on_collision(skills_root: Path, monkeypatch, capsys):
+    monkeypatch.setattr(MODULE, "DEFAULT_CACHE", skills_root.parent / "matrix.json")
+    monkeypatch.setattr(sys, "argv", ["routing_matrix", "--skills-root", str(skills_root), "--check"])
+    assert MODULE.main() == 1
+    out = capsys.readouterr().out
+    assert "gemini-imagen <-> gpt-imagen" in out
+    monkeypatch.setattr(sys, "argv", ["routing_matrix", "--skills-root", str(skills_root), "--threshold", "0.99"])
+    assert MODULE.main() == 0
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import importlib.util
+import json
+import subprocess
+import sys
 from pathlib import Path
 
 
@@ -313,3 +316,176 @@ def test_idf_computed_over_full_corpus_not_selected_subset(tmp_path: Path) -> No
     subset = module.build_skill_index(root, {"secure-code", "filler-0"})
     # "semgrep" idf must be identical whether or not we filter the returned set.
     assert full["secure-code"]["idf"]["semgrep"] == subset["secure-code"]["idf"]["semgrep"]
+
+
+def load_registered_module():
+    """Worker processes unpickle shard functions by module name, so register it."""
+    import sys
+
+    module = load_module()
+    sys.modules[module.__name__] = module
+    return module
+
+
+def test_sharded_run_matches_serial_run() -> None:
+    import json
+
+    module = load_registered_module()
+    skills = module.build_skill_index(REPO_ROOT / "skills", None)
+    cases = json.loads(
+        (REPO_ROOT / "skills" / "skill-evals" / "assets" / "trigger-collision-cases-expanded.json")
+        .read_text(encoding="utf-8")
+    )["cases"]
+    for mode in ("ranking", "threshold"):
+        assert module.evaluate_cases(skills, cases, mode=mode, jobs=3) == module.evaluate_cases(
+            skills, cases, mode=mode
+        )
+    assert module.evaluate_declared_triggers(skills, jobs=2) == module.evaluate_declared_triggers(skills)
+
+
+def test_score_all_matches_per_skill_scoring(tmp_path: Path) -> None:
+    module = load_module()
+    root = tmp_path / "skills"
+    root.mkdir()
+    write_plain_skill(root, "secure-code", "Scan code with semgrep for the lethal trifecta.")
+    write_plain_skill(root, "review-tool", "Review a diff for style issues.")
+    skills = module.build_skill_index(root, None)
+    prompt = "run $secure-code semgrep scan over this unseen-token diff"
+    assert module.score_all(prompt, "explicit", skills) == {
+        s: module.score_trigger(prompt, "explicit", s, d) for s, d in skills.items()
+    }
+
+
+def test_changed_skills_tracks_description_trigger_and_membership(tmp_path: Path) -> None:
+    module = load_module()
+    root = tmp_path / "skills"
+    root.mkdir()
+    write_skill(root, "alpha", "Alpha the widgets.", ["alpha widgets"])
+    write_skill(root, "bravo", "Bravo the gadgets.", ["bravo gadgets"])
+    write_plain_skill(root, "gone", "Removed later.")
+    baseline = module.skill_fingerprints(module.build_skill_index(root, None))
+
+    (root / "gone" / "SKILL.md").unlink()
+    write_plain_skill(root, "charlie", "A new skill.")
+    md = root / "bravo" / "SKILL.md"
+    md.write_text(md.read_text(encoding="utf-8").replace("bravo gadgets", "bravo gizmos"), encoding="utf-8")
+    # Body edits do not change routing, so alpha stays unchanged.
+    md = root / "alpha" / "SKILL.md"
+    md.write_text(md.read_text(encoding="utf-8") + "\nMore body.\n", encoding="utf-8")
+
+    skills = module.build_skill_index(root, None)
+    assert module.changed_skills(skills, baseline) == {"bravo", "charlie", "gone"}
+    case = {"id": "a", "prompt": "alpha", "expected": {"trigger": ["alpha"]}}
+    assert module.case_key(case, "ranking") == module.case_key(dict(case), "ranking")
+    assert module.case_key(case, "ranking") != module.case_key(case, "threshold")
+    assert module.case_key(case, "ranking") != module.case_key(case, "ranking", {"alpha"})
+
+
+def run_cli(*args: str) -> tuple[int, dict]:
+    proc = subprocess.run([sys.executable, str(SCRIPT_PATH), *args], capture_output=True, text=True)
+    return proc.returncode, json.loads(proc.stdout)
+
+
+def test_cli_skip_passed_skips_passed_cases_only_while_nothing_changed(tmp_path: Path) -> None:
+    root = tmp_path / "skills"
+    root.mkdir()
+    write_skill(root, "alpha", "Alpha the widgets.", ["alpha widgets"])
+    write_skill(root, "bravo", "Bravo the gadgets.", ["bravo gadgets"])
+    cases_path = tmp_path / "cases.json"
+    cases = [
+        {"id": "a", "prompt": "alpha my widgets", "expected": {"trigger": ["alpha"], "avoid": ["bravo"]}},
+        {"id": "b", "prompt": "bravo my gadgets", "expected": {"trigger": ["bravo"], "avoid": []}},
+    ]
+    cases_path.write_text(json.dumps({"cases": cases}), encoding="utf-8")
+    baseline = tmp_path / "baseline.json"
+    common = ["--cases", str(cases_path), "--from-triggers", "--skills-root", str(root)]
+
+    code, full = run_cli(*common, "--save-baseline", str(baseline))
+    assert code == 0 and full["summary"]["cases"] == 2
+
+    # Unchanged catalog: passed cases are skipped, a new case is not, and
+    # declared triggers are always re-checked.
+    cases.append({"id": "c", "prompt": "alpha widgets", "expected": {"trigger": ["alpha"], "avoid": []}})
+    cases_path.write_text(json.dumps({"cases": cases}), encoding="utf-8")
+    code, quiet = run_cli(*common, "--skip-passed", str(baseline))
+    assert code == 0
+    assert quiet["skip_passed"] == {"baseline": str(baseline), "changed_skills": [], "cases_skipped": 2}
+    assert {a["case_id"] for a in quiet["assertions"]} == {"c"}
+    assert {a["skill"] for a in quiet["declared_triggers"]["assertions"]} == {"alpha", "bravo"}
+
+    # Any changed skill re-runs every case.
+    md = root / "bravo" / "SKILL.md"
+    md.write_text(md.read_text(encoding="utf-8").replace("Bravo the gadgets.", "Bravo the gadgets fast."),
+                  encoding="utf-8")
+    code, partial = run_cli(*common, "--skip-passed", str(baseline), "--jobs", "2")
+    assert code == 0
+    assert partial["skip_passed"]["changed_skills"] == ["bravo"]
+    assert partial["skip_passed"]["cases_skipped"] == 0
+    assert {a["case_id"] for a in partial["assertions"]} == {"a", "b", "c"}
+
+
+def test_cli_skip_passed_catches_a_changed_skill_beating_an_unchanged_owner(tmp_path: Path) -> None:
+    """Editing bravo can break alpha's own trigger; that must not pass as unrelated."""
+    root = tmp_path / "skills"
+    root.mkdir()
+    write_skill(root, "alpha", "Compress image files for the web.", ["compress image files"])
+    write_skill(root, "bravo", "Convert audio formats.", ["convert audio"])
+    baseline = tmp_path / "baseline.json"
+    common = ["--from-triggers", "--skills-root", str(root)]
+    assert run_cli(*common, "--save-baseline", str(baseline))[0] == 0
+
+    md = root / "bravo" / "SKILL.md"
+    md.write_text(
+        md.read_text(encoding="utf-8").replace(
+            "Convert audio formats.", "Compress image files, compress image files, compress image files."
+        ),
+        encoding="utf-8",
+    )
+    code, full = run_cli(*common)
+    assert code == 1
+    code, partial = run_cli(*common, "--skip-passed", str(baseline))
+    assert code == 1
+    assert partial["summary"]["failed"] == full["summary"]["failed"]
+
+
+def test_cli_failing_run_does_not_advance_the_baseline(tmp_path: Path) -> None:
+    root = tmp_path / "skills"
+    root.mkdir()
+    write_skill(root, "alpha", "Alpha the widgets.", ["alpha widgets"])
+    cases_path = tmp_path / "cases.json"
+    cases_path.write_text(json.dumps({"cases": [
+        {"id": "a", "prompt": "bravo gadgets", "expected": {"trigger": ["alpha"], "avoid": []}},
+    ]}), encoding="utf-8")
+    baseline = tmp_path / "baseline.json"
+
+    code, _ = run_cli("--cases", str(cases_path), "--skills-root", str(root), "--save-baseline", str(baseline))
+    assert code == 1
+    assert not baseline.exists()
+
+
+def test_cli_skip_passed_sees_an_unselected_skill_change(tmp_path: Path) -> None:
+    """IDF spans the catalog, so editing a skill outside --skills still re-runs cases."""
+    root = tmp_path / "skills"
+    root.mkdir()
+    write_skill(root, "alpha", "Alpha the widgets.", ["alpha widgets"])
+    write_skill(root, "bravo", "Bravo the gadgets.", ["bravo gadgets"])
+    write_skill(root, "charlie", "Charlie the gizmos.", ["charlie gizmos"])
+    cases_path = tmp_path / "cases.json"
+    cases_path.write_text(json.dumps({"cases": [
+        {"id": "a", "prompt": "alpha my widgets", "expected": {"trigger": ["alpha"], "avoid": ["bravo"]}},
+    ]}), encoding="utf-8")
+    baseline = tmp_path / "baseline.json"
+    common = ["--cases", str(cases_path), "--skills-root", str(root), "--skills", "alpha,bravo"]
+    assert run_cli(*common, "--save-baseline", str(baseline))[0] == 0
+    assert set(json.loads(baseline.read_text(encoding="utf-8"))["skills"]) == {"alpha", "bravo", "charlie"}
+    assert run_cli(*common, "--skip-passed", str(baseline))[1]["skip_passed"]["cases_skipped"] == 1
+    # A baseline saved for one selection does not vouch for another.
+    wider = ["--cases", str(cases_path), "--skills-root", str(root)]
+    assert run_cli(*wider, "--skip-passed", str(baseline))[1]["skip_passed"]["cases_skipped"] == 0
+
+    md = root / "charlie" / "SKILL.md"
+    md.write_text(md.read_text(encoding="utf-8").replace("Charlie the gizmos.", "Widgets everywhere."),
+                  encoding="utf-8")
+    code, rerun = run_cli(*common, "--skip-passed", str(baseline))
+    assert rerun["skip_passed"] == {"baseline": str(baseline), "changed_skills": ["charlie"], "cases_skipped": 0}
+    assert {a["case_id"] for a in rerun["assertions"]} == {"a"}
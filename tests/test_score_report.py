@@ -314,3 +314,60 @@ def test_cli_rejects_a_zero_sample_size(tmp_path):
 
 def test_spread_of_zero_is_empty_not_a_crash():
     assert score_report.spread([{"id": "a"}, {"id": "b"}], 0) == []
+
+
+# --- large reports --------------------------------------------------------
+
+
+def _naive_worksheet_parts(text):
+    """The original quadratic extraction, kept as the byte-identity oracle."""
+    found, linked = [], []
+    for match in score_report.MARKDOWN_LINK_RE.finditer(text):
+        linked.append(match.span())
+        found.append((match.start(), match.group("url"), match.group("text").strip()))
+    for match in score_report.BARE_URL_RE.finditer(text):
+        if any(start <= match.start() < end for start, end in linked):
+            continue
+        found.append((match.start(), match.group(0).rstrip(").,;"), ""))
+    found.sort(key=lambda item: item[0])
+    citations = [
+        {"id": f"C{i}", "url": url, "anchor_text": anchor,
+         "line": score_report.line_of(text, offset), "offset": offset}
+        for i, (offset, url, anchor) in enumerate(found, start=1)
+    ]
+    claims = []
+    for start, end, raw in score_report.sentences(text):
+        attached = [c["id"] for c in citations if start <= c["offset"] < end]
+        if attached:
+            claims.append((raw.strip(), score_report.line_of(text, start), attached))
+    return citations, claims
+
+
+def _large_report(sections=60):
+    parts = ["# Large report\n"]
+    for n in range(sections):
+        parts.append(f"\n## Section {n}\n\n")
+        parts.append(
+            f"Volume reached {n * 17}M units, per [study {n}](https://example.org/s/{n}). "
+            f"A follow-up (https://example.org/f/{n}) reports {n}% drift.\n"
+            f"Bare trailing https://example.org/b/{n}, then [two](https://a.test/{n}) "
+            f"[links](https://b.test/{n}) in one sentence.\n"
+            "Uncited filler that should not become a claim.\n"
+        )
+    return "".join(parts)
+
+
+def test_large_report_matches_the_reference_extraction_exactly():
+    text = _large_report()
+    expected_citations, expected_claims = _naive_worksheet_parts(text)
+    citations = score_report.extract_citations(text)
+    claims = score_report.extract_claims(text, citations)
+    assert json.dumps(citations) == json.dumps(expected_citations)
+    assert [(c["text"], c["line"], c["citations"]) for c in claims] == expected_claims
+
+
+def test_line_table_agrees_with_line_of_at_every_offset():
+    text = "a\n\nbc\nd" + "\n"
+    starts = score_report.line_starts(text)
+    for offset in range(len(text) + 1):
+        assert score_report.line_at(starts, offset) == score_report.line_of(text, offset)
@@ -273,3 +273,154 @@ def test_findings_writes_no_file():
     assert proc.returncode == 0, proc.stderr
     assert "####" in proc.stdout  # findings printed to stdout
     assert backlog.read_bytes() == before  # nothing auto-written
+
+
+# --- Paged, conditional ingestion against a local HTTP stand-in -------------
+
+import threading  # noqa: E402
+import urllib.parse  # noqa: E402
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # noqa: E402
+
+
+def _row(name, invocations, version="1.0.0"):
+    return {"name": name, "version": version, "invocations": invocations,
+            "neverFired": invocations == 0, "misfireEligible": invocations,
+            "misfires": 0, "lastInvokedAt": None}
+
+
+class _HealthServer:
+    """Serves `rows` in `limit`-sized pages with ETags and 304 revalidation."""
+
+    def __init__(self, rows, honour_limit=True):
+        self.rows = rows
+        self.honour_limit = honour_limit
+        self.version = "v1"
+        self.requests = []  # (query dict, status)
+        outer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                query = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(self.path).query))
+                start = int(query.get("cursor", 0))
+                limit = int(query.get("limit", len(outer.rows))) if outer.honour_limit else len(outer.rows)
+                etag = f'"{outer.version}-{start}-{limit}"'
+                if self.headers.get("If-None-Match") == etag:
+                    outer.requests.append((query, 304))
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                end = start + limit
+                payload = {"data": outer.rows[start:end]}
+                if end < len(outer.rows):
+                    payload["nextCursor"] = str(end)
+                body = json.dumps(payload).encode()
+                outer.requests.append((query, 200))
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/api/v2/analytics/skills/health?from=2026-06-01"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def statuses(self):
+        return [status for _, status in self.requests]
+
+
+@pytest.fixture
+def health_server():
+    rows = [_row(f"skill-{i:02d}", i % 3) for i in range(10)] + [_row("skill-01", 4, "0.9.0")]
+    server = _HealthServer(rows)
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+
+def test_paged_fetch_matches_single_shot(health_server):
+    paged = shr.load_health_rows(url=health_server.url, path=None, page_size=4)
+    assert paged == health_server.rows
+    assert health_server.statuses() == [200, 200, 200]
+    # Existing query parameters survive; paging parameters are added per page.
+    assert [q.get("cursor") for q, _ in health_server.requests] == [None, "4", "8"]
+    assert all(q["from"] == "2026-06-01" and q["limit"] == "4" for q, _ in health_server.requests)
+
+
+def test_merged_rows_aggregate_across_pages(health_server):
+    merged = {r["name"]: r for r in shr.load_merged_rows(url=health_server.url, path=None, page_size=3)}
+    assert len(merged) == 10
+    # skill-01's two versions land on different pages and are summed.
+    assert merged["skill-01"]["invocations"] == 5
+    assert merged["skill-01"] == shr.aggregate_rows(health_server.rows)["skill-01"]
+
+
+def test_unchanged_window_is_revalidated_not_redownloaded(health_server, tmp_path):
+    cache = tmp_path / "cache"
+    first = shr.load_health_rows(url=health_server.url, path=None, page_size=4, cache_dir=cache)
+    second = shr.load_health_rows(url=health_server.url, path=None, page_size=4, cache_dir=cache)
+    assert first == second == health_server.rows
+    assert health_server.statuses() == [200, 200, 200, 304, 304, 304]
+
+    health_server.version = "v2"
+    health_server.rows[0] = _row("skill-00", 7)
+    third = shr.load_health_rows(url=health_server.url, path=None, page_size=4, cache_dir=cache)
+    assert third[0]["invocations"] == 7
+    assert health_server.statuses()[-3:] == [200, 200, 200]
+
+
+def test_malformed_row_on_a_later_page_raises(health_server):
+    health_server.rows[9] = {"name": "broken"}
+    with pytest.raises(RuntimeError, match="malformed row"):
+        shr.load_merged_rows(url=health_server.url, path=None, page_size=4)
+
+
+def test_repeated_cursor_raises(monkeypatch):
+    monkeypatch.setattr(shr, "_fetch_page", lambda url, **kwargs: ([_row("a", 1)], "same"))
+    with pytest.raises(RuntimeError, match="repeated page cursor"):
+        shr.load_health_rows(url="http://127.0.0.1:1/health", path=None)
+
+
+def test_limit_honoured_without_next_cursor_raises(health_server, monkeypatch):
+    # A server that honours `limit` but names its continuation token otherwise.
+    real = shr._fetch_page
+    monkeypatch.setattr(shr, "_fetch_page", lambda url, **kwargs: (real(url, **kwargs)[0], None))
+    with pytest.raises(RuntimeError, match="no nextCursor"):
+        shr.load_health_rows(url=health_server.url, path=None, page_size=4)
+    # A short page is the whole window.
+    assert shr.load_health_rows(url=health_server.url, path=None, page_size=20) == health_server.rows
+
+
+def test_last_page_of_exactly_limit_rows_ends_the_read(health_server):
+    del health_server.rows[8:]
+    assert shr.load_health_rows(url=health_server.url, path=None, page_size=4) == health_server.rows
+    # Two pages, then one probe for a fifth row at the last cursor.
+    assert [(q.get("cursor"), q["limit"]) for q, _ in health_server.requests] == [
+        (None, "4"), ("4", "4"), ("4", "5"),
+    ]
+
+
+def test_server_ignoring_limit_is_read_in_one_request():
+    rows = [_row(f"skill-{i:02d}", 1) for i in range(12)]
+    server = _HealthServer(rows, honour_limit=False)
+    try:
+        assert shr.load_health_rows(url=server.url, path=None, page_size=4) == rows
+        assert server.statuses() == [200]
+    finally:
+        server.httpd.shutdown()
+        server.httpd.server_close()
+
+
+def test_corrupt_cache_entry_is_a_miss(health_server, tmp_path):
+    cache = shr.PageCache(tmp_path)
+    shr.load_health_rows(url=health_server.url, path=None, page_size=20, cache_dir=tmp_path)
+    for entry in tmp_path.iterdir():
+        entry.write_text("{not json", encoding="utf-8")
+    assert shr.load_health_rows(url=health_server.url, path=None, page_size=20, cache_dir=tmp_path)
+    assert health_server.statuses() == [200, 200]
+    assert cache.load("http://elsewhere") is None
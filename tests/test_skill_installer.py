@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = REPO_ROOT / "skills" / "skill-installer" / "scripts"
+SCRIPT_PATH = SCRIPTS_DIR / "install-skill-from-github.py"
+COMMIT = "a" * 40
+
+
+def load_module():
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    spec = importlib.util.spec_from_file_location("install_skill_from_github", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+installer = load_module()
+
+
+@pytest.fixture
+def github(tmp_path, monkeypatch):
+    """A file:// stand-in for the commits API and codeload archive endpoints."""
+    api = tmp_path / "api"
+    codeload = tmp_path / "codeload"
+    commits = api / "repos" / "acme" / "tools" / "commits"
+    commits.mkdir(parents=True)
+    (commits / "main").write_text(COMMIT + "\n")
+    archive = codeload / "acme" / "tools" / "zip" / COMMIT
+    archive.parent.mkdir(parents=True)
+    with zipfile.ZipFile(archive, "w") as zf:
+        top = f"tools-{COMMIT}"
+        for name in ("alpha", "beta", "gamma"):
+            zf.writestr(f"{top}/skills/{name}/SKILL.md", f"---\nname: {name}\n---\n")
+        zf.writestr(f"{top}/README.md", "repo readme\n")
+    monkeypatch.setenv("SKILL_INSTALLER_GITHUB_API", api.as_uri())
+    monkeypatch.setenv("SKILL_INSTALLER_CODELOAD", codeload.as_uri())
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    return archive
+
+
+def install(tmp_path, dest, *paths, extra=()):
+    return installer.main([
+        "--repo", "acme/tools", "--path", *paths, "--dest", str(dest),
+        "--method", "download", "--cache-dir", str(tmp_path / "cache"), *extra,
+    ])
+
+
+def test_multi_path_install_uses_one_cached_archive(tmp_path, github):
+    assert install(tmp_path, tmp_path / "dest", "skills/alpha", "skills/beta") == 0
+    assert (tmp_path / "dest" / "alpha" / "SKILL.md").is_file()
+    assert (tmp_path / "dest" / "beta" / "SKILL.md").is_file()
+    cached = tmp_path / "cache" / "acme" / "tools" / f"{COMMIT}.zip"
+    assert cached.read_bytes() == github.read_bytes()
+
+
+def test_cache_hit_skips_the_download(tmp_path, github):
+    assert install(tmp_path, tmp_path / "first", "skills/alpha") == 0
+    github.unlink()
+    assert install(tmp_path, tmp_path / "second", "skills/gamma") == 0
+    assert (tmp_path / "second" / "gamma" / "SKILL.md").is_file()
+
+
+def test_no_cache_leaves_the_cache_dir_untouched(tmp_path, github):
+    assert install(tmp_path, tmp_path / "dest", "skills/alpha", extra=["--no-cache"]) == 0
+    assert not (tmp_path / "cache").exists()
+
+
+def test_extraction_is_limited_to_requested_paths(tmp_path, github):
+    out = tmp_path / "out"
+    root = installer._extract_paths(str(github), ["skills/beta/"], str(out))
+    extracted = sorted(p.relative_to(root).as_posix() for p in Path(root).rglob("*") if p.is_file())
+    assert extracted == ["skills/beta/SKILL.md"]
+
+
+def test_missing_ref_reports_the_http_style_failure(tmp_path, github, capsys):
+    code = installer.main([
+        "--repo", "acme/tools", "--path", "skills/alpha", "--ref", "nope",
+        "--dest", str(tmp_path / "dest"), "--method", "download",
+        "--cache-dir", str(tmp_path / "cache"),
+    ])
+    assert code == 1
+    assert "Ref lookup failed" in capsys.readouterr().err
+
+
+def test_corrupt_download_is_not_cached(tmp_path, github):
+    github.write_bytes(b"not a zip")
+    assert install(tmp_path, tmp_path / "dest", "skills/alpha") == 1
+    entry = tmp_path / "cache" / "acme" / "tools"
+    assert list(entry.iterdir()) == []
+
+
+def test_pinned_commit_skips_ref_lookup(tmp_path, github, monkeypatch):
+    def fail(*_args, **_kwargs):
+        raise AssertionError("commit lookup should not run for a pinned SHA")
+
+    monkeypatch.setattr(installer, "_request", fail)
+    assert installer._resolve_commit("acme", "tools", COMMIT) == COMMIT
+
+
+# --- batch mode -----------------------------------------------------------
+
+
+def test_batch_groups_paths_into_one_checkout_per_repo(tmp_path, github, monkeypatch, capsys):
+    calls = []
+    prepare = installer._prepare_repo
+
+    def counting_prepare(source, method, tmp_dir, cache_dir=None):
+        calls.append((source.owner, source.repo, source.ref, list(source.paths)))
+        return prepare(source, method, tmp_dir, cache_dir)
+
+    monkeypatch.setattr(installer, "_prepare_repo", counting_prepare)
+    batch = tmp_path / "batch.txt"
+    batch.write_text(
+        "# onboarding set\n"
+        "acme/tools skills/alpha\n"
+        f"https://github.com/acme/tools/tree/main/skills/beta\n"
+        "acme/tools skills/gamma main\n"
+    )
+    code = installer.main([
+        "--batch", str(batch), "--dest", str(tmp_path / "dest"), "--method", "download",
+        "--cache-dir", str(tmp_path / "cache"),
+    ])
+    assert code == 0
+    assert calls == [("acme", "tools", "main", ["skills/alpha", "skills/beta", "skills/gamma"])]
+    out = capsys.readouterr().out
+    assert out.splitlines()[0].split() == ["SKILL", "SOURCE", "PATH", "STATUS", "DETAIL"]
+    assert "3 installed, 0 failed across 1 checkout(s)." in out
+
+
+def test_batch_reports_each_failure_without_stopping_the_rest(tmp_path, github, capsys):
+    (tmp_path / "dest" / "alpha").mkdir(parents=True)
+    batch = tmp_path / "batch.txt"
+    batch.write_text(
+        "acme/tools skills/alpha\n"
+        "acme/tools skills/missing\n"
+        "acme/tools skills/beta\n"
+        "other/tools skills/beta\n"
+        "ghost/repo skills/delta\n"
+    )
+    code = installer.main([
+        "--batch", str(batch), "--dest", str(tmp_path / "dest"), "--method", "download",
+        "--cache-dir", str(tmp_path / "cache"),
+    ])
+    assert code == 1
+    rows = {line.split()[0] + " " + line.split()[1]: line
+            for line in capsys.readouterr().out.splitlines()[1:6]}
+    assert "Destination already exists" in rows["alpha acme/tools@main"]
+    assert "Skill path not found" in rows["missing acme/tools@main"]
+    assert "installed" in rows["beta acme/tools@main"]
+    assert "duplicate skill name" in rows["beta other/tools@main"]
+    assert "Ref lookup failed" in rows["delta ghost/repo@main"]
+    assert (tmp_path / "dest" / "beta" / "SKILL.md").is_file()
+
+
+def test_batch_rejects_malformed_lines(tmp_path, capsys):
+    batch = tmp_path / "batch.txt"
+    batch.write_text("acme/tools\n")
+    assert installer.main(["--batch", str(batch), "--dest", str(tmp_path)]) == 1
+    assert "batch.txt:1" in capsys.readouterr().err
+
+
+# --- cached listing -------------------------------------------------------
+
+
+def load_list_skills():
+    spec = importlib.util.spec_from_file_location("list_skills", SCRIPTS_DIR / "list-skills.py")
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+list_skills = load_list_skills()
+
+
+@pytest.fixture
+def contents_api(tmp_path, monkeypatch):
+    """A local HTTP stand-in for the contents API that honours If-None-Match."""
+    import http.server
+    import json
+    import threading
+
+    state = {"listing": ["alpha", "beta"], "hits": 0, "not_modified": 0}
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            state["hits"] += 1
+            body = json.dumps([{"name": n, "type": "dir"} for n in state["listing"]]).encode()
+            etag = f'"{hash(body) & 0xFFFFFFFF:x}"'
+            if self.headers.get("If-None-Match") == etag:
+                state["not_modified"] += 1
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    monkeypatch.setenv("SKILL_INSTALLER_GITHUB_API", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setenv("SKILL_INSTALLER_CACHE", str(tmp_path / "cache"))
+    monkeypatch.setenv("CODEX_HOME", str(tmp_path / "codex"))
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    yield state, server
+    server.shutdown()
+    server.server_close()
+
+
+def listed(capsys):
+    return capsys.readouterr().out.split()
+
+
+def test_fresh_listing_is_served_from_cache(contents_api, capsys):
+    state, _ = contents_api
+    assert list_skills.main([]) == 0
+    assert list_skills.main([]) == 0
+    assert state["hits"] == 1
+    assert listed(capsys) == ["1.", "alpha", "2.", "beta"] * 2
+
+
+def test_stale_listing_revalidates_with_etag(contents_api, capsys):
+    state, _ = contents_api
+    assert list_skills.main(["--ttl", "0"]) == 0
+    assert list_skills.main(["--ttl", "0"]) == 0
+    assert (state["hits"], state["not_modified"]) == (2, 1)
+
+    state["listing"] = ["alpha", "beta", "gamma"]
+    capsys.readouterr()
+    assert list_skills.main(["--ttl", "0"]) == 0
+    assert "gamma" in listed(capsys)
+
+
+def test_offline_serves_the_last_listing_without_network(contents_api, capsys):
+    state, server = contents_api
+    assert list_skills.main([]) == 0
+    server.shutdown()
+    capsys.readouterr()
+    assert list_skills.main(["--offline", "--ttl", "0"]) == 0
+    assert listed(capsys) == ["1.", "alpha", "2.", "beta"]
+    assert state["hits"] == 1
+
+
+def test_offline_without_a_cached_listing_fails_clearly(contents_api, capsys):
+    assert list_skills.main(["--offline"]) == 1
+    assert "No cached listing" in capsys.readouterr().err
+
+
+def test_unwritable_cache_dir_lists_uncached(contents_api, tmp_path, monkeypatch, capsys):
+    state, _ = contents_api
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+    monkeypatch.setenv("SKILL_INSTALLER_CACHE", str(blocker / "cache"))
+    assert list_skills.main([]) == 0
+    assert list_skills.main([]) == 0
+    assert listed(capsys) == ["1.", "alpha", "2.", "beta"] * 2
+    assert state["hits"] == 2
+
+
+def test_failed_cache_write_leaves_no_partial_file(contents_api, tmp_path, monkeypatch, capsys):
+    github_utils = sys.modules["github_utils"]
+
+    def disk_full(*_args, **_kwargs):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(github_utils.json, "dump", disk_full)
+    assert list_skills.main([]) == 0
+    assert listed(capsys) == ["1.", "alpha", "2.", "beta"]
+    assert [p for p in (tmp_path / "cache").rglob("*") if p.is_file()] == []
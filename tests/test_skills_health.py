@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import importlib.util
 import sys
+import threading
+import time
 from pathlib import Path
 
+import pytest
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SCRIPT_PATH = REPO_ROOT / "scripts" / "skills_health.py"
@@ -129,3 +133,120 @@ def test_findings_mode_does_not_run_static_build_report(monkeypatch, capsys):
     assert module.main() == 0
     out = capsys.readouterr().out
     assert "#### find-skills" in out  # fixture's never-fired dojo skill
+
+
+def _subprocess_report(skills_root: Path) -> dict:
+    """The report as the old `_run_json` pipeline built it, from the CLIs' JSON."""
+    import json
+    import subprocess
+
+    scripts = REPO_ROOT / "skills" / "skill-evals" / "scripts"
+
+    def run(*args: str) -> dict:
+        proc = subprocess.run([sys.executable, *args], capture_output=True, text=True)
+        return json.loads(proc.stdout)
+
+    return {
+        "contract": run(str(scripts / "validate_skill_contract.py"), "--skills-root", str(skills_root), "--json"),
+        "triggers": run(str(scripts / "run_trigger_evals.py"), "--from-triggers", "--skills-root", str(skills_root)),
+    }
+
+
+def test_in_process_engines_match_their_cli_json(tmp_path: Path):
+    module = load_module()
+    skills_root = tmp_path / "skills"
+    skills_root.mkdir()
+    make_skill(skills_root, "alpha", triggers=["use alpha", "run bravo"])
+    make_skill(skills_root, "bravo", triggers=["run bravo"])
+    (skills_root / "broken").mkdir()
+    (skills_root / "broken" / "SKILL.md").write_text("no frontmatter\n", encoding="utf-8")
+
+    from catalog_snapshot import Snapshot
+
+    snapshot = Snapshot.load(skills_root)
+    expected = _subprocess_report(skills_root)
+    assert module._contract_payload(snapshot) == expected["contract"]
+    assert module._triggers_payload(snapshot) == expected["triggers"]
+
+
+def test_build_report_reads_each_skill_md_once_without_subprocesses(tmp_path: Path, monkeypatch):
+    import subprocess
+
+    module = load_module()
+    skills_root = tmp_path / "skills"
+    skills_root.mkdir()
+    make_skill(skills_root, "alpha", triggers=["use alpha"])
+    make_skill(skills_root, "bravo")
+
+    reads: list[Path] = []
+    real_read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        if self.name == "SKILL.md":
+            reads.append(self)
+        return real_read_text(self, *args, **kwargs)
+
+    def no_subprocess(*args, **kwargs):
+        raise AssertionError("build_report must not shell out")
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    monkeypatch.setattr(subprocess, "run", no_subprocess)
+    report = module.build_report(skills_root)
+    assert report["summary"]["total"] == 2
+    assert sorted(p.parent.name for p in reads) == ["alpha", "bravo"]
+
+
+def test_build_report_empty_catalog_raises(tmp_path: Path):
+    module = load_module()
+    (tmp_path / "skills").mkdir()
+    with pytest.raises(RuntimeError, match="no skills"):
+        module.build_report(tmp_path / "skills")
+
+
+def test_runtime_rows_are_joined_in_process(monkeypatch, capsys, tmp_path: Path):
+    import json
+
+    module = load_module()
+    skills_root = tmp_path / "skills"
+    skills_root.mkdir()
+    make_skill(skills_root, "alpha")
+    rows = [{"name": "alpha", "invocations": 3, "neverFired": False}]
+    seen = {}
+
+    def fake_load(*, url, path, cache_dir):
+        seen["path"] = path
+        return rows
+
+    monkeypatch.setattr(module.runtime, "load_merged_rows", fake_load)
+    monkeypatch.setattr(
+        sys, "argv",
+        ["skills_health", "--json", "--skills-root", str(skills_root), "--health-json", "rows.json"],
+    )
+    assert module.main() == 0
+    report = json.loads(capsys.readouterr().out)
+    assert seen["path"] == "rows.json"
+    assert report["summary"]["runtime_source"] == "rows.json"
+    assert report["skills"][0]["skill"] == "alpha"
+
+
+def test_failed_static_report_does_not_wait_for_runtime_fetch(monkeypatch, tmp_path: Path):
+    module = load_module()
+    release = threading.Event()
+
+    def hanging_load(**options):
+        release.wait(30)  # stands in for an unreachable endpoint's timeout
+        return []
+
+    def _boom(*args, **kwargs):
+        raise RuntimeError("contract engine failed")
+
+    monkeypatch.setattr(module.runtime, "load_merged_rows", hanging_load)
+    monkeypatch.setattr(module, "build_report", _boom)
+    (tmp_path / "skills").mkdir()
+    monkeypatch.setattr(sys, "argv", ["skills_health", "--runtime", "--skills-root", str(tmp_path / "skills")])
+    started = time.monotonic()
+    try:
+        assert module.main() == 1
+        assert time.monotonic() - started < 5
+    finally:
+        release.set()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_PATH = REPO_ROOT / "skills" / "screenshot" / "scripts" / "take_screenshot.py"
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("take_screenshot", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+take_screenshot = load_module()
+
+
+def run_session(tmp_path: Path, lines: list[str], *args: str) -> subprocess.CompletedProcess:
+    env = {
+        "CODEX_SCREENSHOT_TEST_MODE": "1",
+        "CODEX_SCREENSHOT_TEST_PLATFORM": "linux",
+        "HOME": str(tmp_path),
+        "PATH": "/usr/bin:/bin",
+    }
+    return subprocess.run(
+        [sys.executable, str(SCRIPT_PATH), "--session", "--path", f"{tmp_path}/shots/", *args],
+        input="".join(line + "\n" for line in lines),
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+
+def results(proc: subprocess.CompletedProcess) -> list[dict]:
+    return [json.loads(line) for line in proc.stdout.splitlines()]
+
+
+def test_session_writes_one_result_per_frame(tmp_path):
+    proc = run_session(tmp_path, [
+        json.dumps({"id": "home", "region": [0, 0, 10, 10]}),
+        json.dumps({"id": "anim", "repeat": 3, "interval": 0.01,
+                    "path": str(tmp_path / "shots" / "anim.png")}),
+    ])
+    assert proc.returncode == 0, proc.stderr
+    out = results(proc)
+    assert [(r["id"], r["frame"]) for r in out] == [("home", 0), ("anim", 0), ("anim", 1), ("anim", 2)]
+    assert [Path(r["path"]).name for r in out[1:]] == [
+        "anim-f0000.png", "anim-f0001.png", "anim-f0002.png",
+    ]
+    for r in out:
+        assert Path(r["path"]).read_bytes() == take_screenshot.TEST_PNG
+
+
+def test_default_names_stay_unique_within_one_second(tmp_path):
+    proc = run_session(tmp_path, ['{"repeat": 5}'])
+    paths = {r["path"] for r in results(proc)}
+    assert len(paths) == 5
+
+
+def test_bad_requests_are_reported_and_the_session_continues(tmp_path):
+    proc = run_session(tmp_path, [
+        "not json",
+        json.dumps({"region": "1,2"}),
+        json.dumps({"region": [0, 0, 5, 5], "window_id": 3}),
+        json.dumps({"zoom": 2}),
+        json.dumps({"id": "ok"}),
+    ])
+    assert proc.returncode == 1
+    out = results(proc)
+    assert [r["status"] for r in out] == ["error"] * 4 + ["ok"]
+    assert out[0]["id"] == 1
+    assert "unknown keys: zoom" in out[3]["detail"]
+
+
+def test_session_rejects_per_shot_target_flags(tmp_path):
+    proc = run_session(tmp_path, [], "--region", "0,0,1,1")
+    assert proc.returncode != 0
+    assert "per request" in proc.stderr
+
+
+def test_linux_tools_are_probed_once_per_session(tmp_path, monkeypatch):
+    probes = []
+    monkeypatch.setattr(take_screenshot.shutil, "which",
+                        lambda name: probes.append(name) or f"/usr/bin/{name}")
+    commands = []
+
+    def fake_run(cmd):
+        commands.append(cmd)
+        Path(cmd[-1]).write_bytes(take_screenshot.TEST_PNG)
+
+    monkeypatch.setattr(take_screenshot, "run", fake_run)
+    args = argparse.Namespace(path=f"{tmp_path}/shots/", mode="default", format="png", buffer=1)
+    stream = io.StringIO('{"repeat": 4}\n{"region": [1, 2, 3, 4]}\n')
+    out = io.StringIO()
+    assert take_screenshot.run_session(args, "Linux", False, stream, out) == 0
+    assert sorted(probes) == ["gnome-screenshot", "import", "scrot", "xdotool"]
+    assert commands[-1][:3] == ["/usr/bin/scrot", "-a", "1,2,3,4"]
+    assert len(out.getvalue().splitlines()) == 5
+
+
+def test_directory_paths_get_unique_names_per_frame(tmp_path):
+    shots = tmp_path / "picked"
+    shots.mkdir()
+    proc = run_session(tmp_path, [json.dumps({"path": str(shots)})] * 3 + [
+        json.dumps({"path": f"{shots}/", "repeat": 2}),
+    ])
+    assert proc.returncode == 0, proc.stderr
+    paths = [r["path"] for r in results(proc)]
+    assert len(set(paths)) == 5
+    assert all(Path(p).parent == shots for p in paths)
+
+
+def test_a_frame_that_raises_is_reported_and_the_session_continues(tmp_path, monkeypatch):
+    # Only import + xdotool, so active-window capture shells out to xdotool.
+    monkeypatch.setattr(take_screenshot.shutil, "which",
+                        lambda name: f"/usr/bin/{name}" if name in ("import", "xdotool") else None)
+
+    def fake_check_output(cmd, **kwargs):
+        raise subprocess.CalledProcessError(1, cmd)
+
+    def fake_run(cmd):
+        Path(cmd[-1]).write_bytes(take_screenshot.TEST_PNG)
+
+    monkeypatch.setattr(take_screenshot.subprocess, "check_output", fake_check_output)
+    monkeypatch.setattr(take_screenshot, "run", fake_run)
+    unwritable = tmp_path / "file"
+    unwritable.write_text("")
+    args = argparse.Namespace(path=f"{tmp_path}/shots/", mode="default", format="png", buffer=1)
+    stream = io.StringIO(
+        '{"id": "active", "active_window": true}\n'
+        + json.dumps({"id": "bad-path", "path": f"{unwritable}/sub/"}) + "\n"
+        + '{"id": "ok"}\n'
+    )
+    out = io.StringIO()
+    assert take_screenshot.run_session(args, "Linux", False, stream, out) == 1
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [(r["id"], r["status"]) for r in rows] == [("active", "error"), ("bad-path", "error"), ("ok", "ok")]
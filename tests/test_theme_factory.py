@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = REPO_ROOT / "skills" / "theme-factory" / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+theme_index = importlib.import_module("theme_index")
+generate_css = importlib.import_module("generate_css")
+preview_theme = importlib.import_module("preview_theme")
+render_themes = importlib.import_module("render_themes")
+
+
+def write_theme(themes_dir: Path, slug: str, accent: str = "#123456") -> Path:
+    path = themes_dir / f"{slug}.json"
+    path.write_text(json.dumps({
+        "name": slug.title(),
+        "slug": slug,
+        "colors": [{"name": "Accent", "hex": accent}],
+        "css": {"--theme-accent": accent},
+        "mode": "light",
+    }))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(theme_index.CACHE_ENV, str(tmp_path / "cache"))
+    monkeypatch.setattr(theme_index, "_loaded", {})
+
+
+def test_bundle_is_reused_until_a_theme_changes(tmp_path, monkeypatch):
+    themes = tmp_path / "themes"
+    themes.mkdir()
+    path = write_theme(themes, "alpha")
+    write_theme(themes, "beta")
+    assert list(theme_index.load_index(themes)) == ["alpha", "beta"]
+
+    # A new process (empty memo) reads the bundle instead of recompiling.
+    monkeypatch.setattr(theme_index, "_loaded", {})
+    compiled = []
+    real_compile = theme_index.compile_bundle
+    monkeypatch.setattr(theme_index, "compile_bundle",
+                        lambda d: compiled.append(d) or real_compile(d))
+    theme_index.load_index(themes)
+    assert compiled == []
+
+    # An in-place edit leaves the directory mtime alone but must still count.
+    stat = path.stat()
+    write_theme(themes, "alpha", accent="#abcdef")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert theme_index.load_index(themes)["alpha"]["css"]["--theme-accent"] == "#abcdef"
+    assert compiled == [themes]
+
+
+def test_invalid_themes_are_skipped_and_reported(tmp_path, capsys):
+    themes = tmp_path / "themes"
+    themes.mkdir()
+    write_theme(themes, "alpha")
+    (themes / "broken.json").write_text("{")
+    (themes / "bare.json").write_text(json.dumps({"name": "Bare", "css": {"color": "red"}}))
+
+    assert list(theme_index.load_index(themes)) == ["alpha"]
+    problems = theme_index.index_problems(themes)
+    assert sorted(problems) == ["bare", "broken"]
+    assert "bare: css key 'color' is not a custom property" in problems["bare"]
+    err = capsys.readouterr().err
+    assert "Warning: skipping invalid theme broken:" in err
+    # Reported once per process, not on every lookup.
+    theme_index.load_index(themes)
+    assert capsys.readouterr().err == ""
+
+
+def test_cli_entry_points_report_theme_errors_without_a_traceback(monkeypatch, capsys):
+    def unreadable(*args, **kwargs):
+        raise theme_index.ThemeError("cannot read themes directory /nope")
+
+    for module, argv in ((generate_css, ["--list"]), (preview_theme, ["--all", "-d", "/tmp"])):
+        monkeypatch.setattr(module, "load_index", unreadable)
+        monkeypatch.setattr(sys, "argv", [module.__name__, *argv])
+        with pytest.raises(SystemExit) as excinfo:
+            module.main()
+        assert excinfo.value.code == 1
+        assert "Error: cannot read themes directory /nope" in capsys.readouterr().err
+
+
+def test_shipped_themes_validate():
+    bundle = theme_index.compile_bundle(theme_index.THEMES_DIR)
+    assert len(bundle["themes"]) >= 10
+
+
+def test_render_all_matches_the_single_theme_scripts(tmp_path):
+    written = render_themes.render_all(tmp_path / "out")
+    themes = theme_index.load_index()
+    assert len(written) == 2 * len(themes) + 1
+
+    slug = next(iter(themes))
+    css = (tmp_path / "out" / f"{slug}.css").read_text()
+    assert css == generate_css.generate_full(generate_css.find_theme(slug)) + "\n"
+    single = tmp_path / "single.html"
+    preview_theme.generate_preview(preview_theme.find_theme(slug), single)
+    assert (tmp_path / "out" / f"{slug}-preview.html").read_text() == single.read_text()
+    assert (tmp_path / "out" / "themes.css").read_text() == generate_css.generate_all_vars() + "\n"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.util
+import json
 import subprocess
 import sys
 from pathlib import Path
@@ -884,3 +885,74 @@ def test_high_risk_plan_rejects_unknown_traceability_task(tmp_path: Path) -> Non
     )
 
     assert any("traceability references unknown Task 9" in error for error in errors)
+
+
+def test_batch_discovers_repo_root_once_per_directory(tmp_path: Path, monkeypatch) -> None:
+    module = load_module()
+    repo = tmp_path / "consumer"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q", str(repo)], check=True, capture_output=True)
+    write_high_risk_spec(repo)
+    plan = write_complete_high_risk_plan(repo)
+    second = plan.with_name("second-plan.md")
+    second.write_text(plan.read_text(encoding="utf-8"), encoding="utf-8")
+
+    calls: list[Path] = []
+    original = module.discover_repo_root
+
+    def counting(path: Path) -> Path:
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(module, "discover_repo_root", counting)
+    results = module.validate_batch([plan, second], "plan", False, jobs=1)
+
+    assert [item["status"] for item in results] == ["pass", "pass"]
+    assert len(calls) == 1
+
+
+def test_parallel_batch_shares_one_repo_root_discovery(tmp_path: Path, monkeypatch) -> None:
+    module = load_module()
+    repo = tmp_path / "consumer"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q", str(repo)], check=True, capture_output=True)
+    write_high_risk_spec(repo)
+    plan = write_complete_high_risk_plan(repo)
+    plans = [plan]
+    for n in range(7):
+        copy = plan.with_name(f"copy-{n}-plan.md")
+        copy.write_text(plan.read_text(encoding="utf-8"), encoding="utf-8")
+        plans.append(copy)
+
+    calls: list[Path] = []
+    original = module.discover_repo_root
+
+    def counting(path: Path) -> Path:
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(module, "discover_repo_root", counting)
+    results = module.validate_batch(plans, "plan", False, jobs=4)
+
+    assert [item["status"] for item in results] == ["pass"] * len(plans)
+    assert len(calls) == 1
+
+
+def test_cli_json_batch_reports_every_file_in_order(tmp_path: Path) -> None:
+    good = write_plan(tmp_path, "- Create: `src/example.py`")
+    bad = tmp_path / "broken-plan.md"
+    bad.write_text("# Nothing here\n", encoding="utf-8")
+
+    proc = subprocess.run(
+        [sys.executable, str(SCRIPT_PATH), str(good), str(bad), "--json", "--jobs", "2"],
+        capture_output=True,
+        text=True,
+    )
+
+    report = json.loads(proc.stdout)
+    assert proc.returncode == 1
+    assert report["summary"]["total"] == 2
+    assert report["summary"]["fail"] == 1
+    assert [item["path"] for item in report["files"]] == [str(good), str(bad)]
+    assert report["files"][0]["status"] == "pass"
+    assert report["files"][1]["errors"]
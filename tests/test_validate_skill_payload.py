@@ -183,6 +183,33 @@ def test_load_validator_returns_none_on_import_error(monkeypatch):
     assert module._load_validator() is None
 
 
+def test_missing_yaml_at_call_time_degrades_to_allow(skill_dir, monkeypatch):
+    """PyYAML is imported on first validation, so its absence surfaces at call time."""
+    module = load_hook_module()
+
+    def validator(content):
+        raise ImportError("No module named 'yaml'")
+
+    monkeypatch.setattr(module, "_load_validator", lambda: validator)
+    target = skill_dir / "SKILL.md"
+    monkeypatch.setattr("sys.stdin", _StdinStub(json.dumps(write_payload(target, MISSING_VERSION))))
+    assert module.main() == 0
+
+
+def test_validation_does_not_touch_the_filesystem(skill_dir, monkeypatch):
+    module = load_hook_module()
+    import tempfile
+
+    def forbidden(*args, **kwargs):
+        raise AssertionError("hook must validate in memory")
+
+    monkeypatch.setattr(tempfile, "mkdtemp", forbidden)
+    target = skill_dir / "SKILL.md"
+    monkeypatch.setattr("sys.stdin", _StdinStub(json.dumps(write_payload(target, MISSING_VERSION))))
+    assert module.main() == 2
+    assert not target.exists()
+
+
 class _StdinStub:
     def __init__(self, text):
         self._text = text
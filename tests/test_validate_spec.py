@@ -310,3 +310,40 @@ def test_legacy_high_risk_contract_still_requires_structural_headings() -> None:
     )
 
     assert any("Authority And Safety" in error for error in errors)
+
+
+def test_batch_matches_serial_validation_and_keeps_order(tmp_path: Path) -> None:
+    module = load_module()
+    paths = []
+    for index in range(6):
+        path = tmp_path / f"case-{index}-spec.md"
+        path.write_text("# Incomplete\n" if index % 2 else "", encoding="utf-8")
+        paths.append(path)
+
+    serial = module.validate_batch(paths, "spec", False, jobs=1)
+    parallel = module.validate_batch(paths, "spec", False, jobs=4)
+
+    assert parallel == serial
+    assert [item["path"] for item in parallel] == [str(p) for p in paths]
+    assert all(
+        item["errors"] == module.validate_file(Path(item["path"]), "spec", False)
+        for item in parallel
+    )
+
+
+def test_cli_json_report_summarises_the_batch(tmp_path: Path) -> None:
+    broken = tmp_path / "broken-spec.md"
+    broken.write_text("# Nothing here\n", encoding="utf-8")
+
+    proc = subprocess.run(
+        [sys.executable, str(SCRIPT_PATH), str(tmp_path), "--json"],
+        capture_output=True,
+        text=True,
+    )
+
+    import json
+
+    report = json.loads(proc.stdout)
+    assert proc.returncode == 1
+    assert report["summary"] == {"total": 1, "pass": 0, "fail": 1, "advisories": 0}
+    assert report["files"][0]["path"] == str(broken)